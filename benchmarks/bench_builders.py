@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+    bench_builders.py
+
+    Compare the time to find the request builder of an event by calling matches on
+    every builder, find_request_builder, against the lookup of the builder by the
+    fingerprint of the event, RequestBuilderRegistry.find. The linear scan gets
+    slower with every builder registered ahead of the builder of the event, the
+    lookup by fingerprint does not.
+
+    Usage: python benchmarks/bench_builders.py
+"""
+
+import timeit
+
+from minik.builders import REQUEST_BUILDERS, RequestBuilder, RequestBuilderRegistry
+from minik.utils import (
+    create_api_event, create_alb_event, create_http_api_event, create_cloudfront_event, create_websocket_event
+)
+
+
+NUMBER = 100000
+CUSTOM_BUILDERS = 10
+
+
+class RecordsRequestBuilder(RequestBuilder):
+
+    def __init__(self, event_source):
+        self.event_source = event_source
+
+    def matches(self, event):
+        return (event.get('Records') or [{}])[0].get('eventSource') == self.event_source
+
+
+def find_linear(builders, event):
+    for builder in builders:
+        if builder.matches(event):
+            return builder
+
+
+def run():
+    custom_builders = [RecordsRequestBuilder(f'aws:source{idx}') for idx in range(CUSTOM_BUILDERS)]
+    scenarios = [
+        ('default', list(REQUEST_BUILDERS)),
+        (f'+{CUSTOM_BUILDERS} custom', custom_builders + list(REQUEST_BUILDERS)),
+    ]
+    events = [
+        ('http api', create_http_api_event('/events')),
+        ('websocket', create_websocket_event('$default')),
+        ('api', create_api_event('/events')),
+        ('alb', create_alb_event('/events')),
+        ('cloudfront', create_cloudfront_event('/events')),
+    ]
+
+    print(f'{"builders":>12} {"event":>12} {"linear usec":>12} {"registry usec":>14}')
+
+    for scenario, builders in scenarios:
+        registry = RequestBuilderRegistry(builders)
+
+        for name, event in events:
+            linear = timeit.timeit(lambda: find_linear(builders, event), number=NUMBER) / NUMBER * 1e6
+            registry.find(event)
+            memoized = timeit.timeit(lambda: registry.find(event), number=NUMBER) / NUMBER * 1e6
+            print(f'{scenario:>12} {name:>12} {linear:>12.3f} {memoized:>14.3f}')
+
+
+if __name__ == '__main__':
+    run()
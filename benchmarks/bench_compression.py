@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+    bench_compression.py
+
+    Measure the cpu cost of the compression of a json list body against the bytes
+    saved, for every gzip level and, when brotli is installed, for a few brotli
+    qualities. The sizes include the base64 encoding of the compressed body, which
+    is what the lambda function returns.
+
+    Usage: python benchmarks/bench_compression.py
+"""
+
+import base64
+import json
+import random
+import timeit
+
+from minik.middleware import brotli, gzip_compress
+
+
+NUMBER = 20
+SIZES = (200 * 1024, 2 * 1024 * 1024)
+
+
+def build_body(size):
+    rnd = random.Random(7)
+    cities = ['Baltimore', 'San Diego', 'Washington', 'Richmond', 'Denver', 'Boston']
+    events = []
+    body = b'[]'
+
+    while len(body) < size:
+        events.extend(
+            {
+                'id': len(events) + idx,
+                'name': f'Gran Fondo {rnd.randint(1, 10000)}',
+                'city': rnd.choice(cities),
+                'distance_km': round(rnd.uniform(40, 200), 1),
+                'registered': rnd.randint(0, 5000),
+            }
+            for idx in range(500)
+        )
+        body = json.dumps(events).encode()
+
+    return body
+
+
+def measure(compress, body):
+    compressed = compress(body)
+    elapsed = timeit.timeit(lambda: compress(body), number=NUMBER) / NUMBER * 1e3
+    return elapsed, len(base64.b64encode(compressed))
+
+
+def run():
+    for size in SIZES:
+        body = build_body(size)
+        encoded_size = len(base64.b64encode(body))
+        print(f'body: {len(body) // 1024} KB, {encoded_size // 1024} KB base64 encoded')
+        print(f'{"encoding":>10} {"msec":>8} {"KB sent":>8} {"saved":>7}')
+
+        codecs = [(f'gzip-{level}', lambda b, level=level: gzip_compress(b, level)) for level in range(1, 10)]
+        if brotli is not None:
+            codecs += [(f'br-{quality}', lambda b, quality=quality: brotli.compress(b, quality=quality))
+                       for quality in (1, 4, 6, 9)]
+
+        for name, compress in codecs:
+            elapsed, sent = measure(compress, body)
+            print(f'{name:>10} {elapsed:>8.2f} {sent // 1024:>8} {1 - sent / len(body):>7.1%}')
+        print()
+
+
+if __name__ == '__main__':
+    run()
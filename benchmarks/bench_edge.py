@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+    bench_edge.py
+
+    Measure the time to handle synthetic CloudFront viewer request events with the
+    default profile of the app and with the edge profile, Minik(edge=True). The
+    views return plain text, the edge profile skips the json content negotiation,
+    the lookup of the request builder and the trace of unhandled exceptions.
+
+    Usage: python benchmarks/bench_edge.py
+"""
+
+import timeit
+
+from minik.core import Minik
+from minik.utils import create_cloudfront_event
+
+
+NUMBER = 20000
+
+
+def build_app(**kwargs):
+    app = Minik(**kwargs)
+
+    @app.get('/')
+    def index():
+        app.response.headers['Content-Type'] = 'text/plain'
+        return 'ok'
+
+    @app.get('/redirects/{name}')
+    def redirect(name):
+        app.response.status_code = 302
+        app.response.headers['Location'] = f'https://example.com/{name}'
+        return ''
+
+    @app.get('/failure')
+    def failure():
+        raise ValueError('unexpected')
+
+    return app
+
+
+def run():
+    events = [
+        ('static', create_cloudfront_event('/')),
+        ('param', create_cloudfront_event('/redirects/home', querystring='lang=en')),
+        ('error', create_cloudfront_event('/failure')),
+    ]
+    apps = [('default', build_app(route_cache_size=128)), ('edge', build_app(edge=True, route_cache_size=128))]
+
+    print(f'{"event":>8} {"profile":>8} {"usec":>8}')
+
+    for event_name, event in events:
+        for profile, app in apps:
+            if event_name == 'error' and profile == 'default':
+                # The default profile prints the trace of every failure.
+                continue
+
+            elapsed = timeit.timeit(lambda: app(event, None), number=NUMBER) / NUMBER * 1e6
+            print(f'{event_name:>8} {profile:>8} {elapsed:>8.2f}')
+
+
+if __name__ == '__main__':
+    run()
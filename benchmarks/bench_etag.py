@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+    bench_etag.py
+
+    Measure a poll of an unchanged resource: without ETags, with the ETag hashed
+    from the serialized body, and with the version function of the route, which
+    answers the poll with a 304 before the view is executed. The view builds a
+    list of 2000 events, like a json list endpoint backed by a query.
+
+    Usage: python benchmarks/bench_etag.py
+"""
+
+import timeit
+
+from minik.core import Minik
+from minik.middleware import ETagMiddleware
+from minik.utils import create_http_api_event
+
+
+NUMBER = 500
+EVENT_COUNT = 2000
+
+
+def list_events():
+    return [{'id': idx, 'name': f'Gran Fondo {idx}', 'city': 'Baltimore'} for idx in range(EVENT_COUNT)]
+
+
+def build_app(etag, version_fn=None):
+    app = Minik()
+    if etag:
+        app.add_middleware(ETagMiddleware())
+
+    options = {'etag': version_fn} if version_fn else {}
+
+    @app.get('/events', **options)
+    def get_events():
+        return list_events()
+
+    return app
+
+
+def poll(app):
+    etag = app(create_http_api_event('/events', method='GET'), None)['headers'].get('ETag')
+    headers = {'content-type': 'application/json', 'If-None-Match': etag or ''}
+    event = create_http_api_event('/events', method='GET', headers=headers)
+
+    response = app(event, None)
+    elapsed = timeit.timeit(lambda: app(event, None), number=NUMBER) / NUMBER * 1e3
+    return elapsed, response['statusCode'], len(response['body'].encode())
+
+
+def run():
+    print(f'{"mode":>16} {"msec":>8} {"status":>7} {"bytes sent":>11}')
+
+    for name, app in [
+        ('no etag', build_app(etag=False)),
+        ('hashed body', build_app(etag=True)),
+        ('version function', build_app(etag=True, version_fn=lambda: 'v42')),
+    ]:
+        elapsed, status, size = poll(app)
+        print(f'{name:>16} {elapsed:>8.3f} {status:>7} {size:>11}')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+    bench_fields.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Measure the per request cost of validating the uri parameters of a view. The
+    coercion plan, built once per route, is compared against inspecting the view
+    annotations on every request with update_uri_parameters.
+
+    Usage: python benchmarks/bench_fields.py
+"""
+
+import timeit
+import uuid
+from types import SimpleNamespace
+
+from minik.fields import apply_coercion_plan, compile_coercion_plan, update_uri_parameters
+
+
+ITERATIONS = 200000
+
+
+def no_params():
+    pass
+
+
+def one_param(year: int):
+    pass
+
+
+def five_params(year: int, month: int, name: str, tenant: uuid.UUID, slug: str):
+    pass
+
+
+VIEWS = [
+    ('0 params', no_params, {}),
+    ('1 param', one_param, {'year': '2019'}),
+    ('5 params', five_params, {'year': '2019', 'month': '05', 'name': 'scott', 'slug': 'carbon-frame',
+                               'tenant': '00010203-0405-0607-0809-0a0b0c0d0e0f'}),
+]
+
+
+def run():
+    print(f'{"view":>10} {"per request":>14} {"plan":>10}  (usec)')
+
+    for label, view, uri_params in VIEWS:
+        plan = compile_coercion_plan(view)
+
+        per_request = timeit.timeit(
+            lambda: update_uri_parameters(view, SimpleNamespace(uri_params=dict(uri_params))),
+            number=ITERATIONS
+        )
+        with_plan = timeit.timeit(lambda: apply_coercion_plan(plan, dict(uri_params)), number=ITERATIONS)
+
+        print(f'{label:>10} {per_request / ITERATIONS * 1e6:>14.3f} {with_plan / ITERATIONS * 1e6:>10.3f}')
+
+
+if __name__ == '__main__':
+    run()
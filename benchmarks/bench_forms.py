@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+    bench_forms.py
+
+    Measure the peak memory used to parse a multipart upload with tracemalloc,
+    relative to the size of the uploaded file. The parser of minik is compared
+    against a view that decodes the body and splits it on the boundary, which
+    keeps several copies of the file in memory.
+
+    Usage: python benchmarks/bench_forms.py
+"""
+
+import base64
+import tracemalloc
+
+from minik.models import MinikRequest
+
+
+BOUNDARY = 'minikbenchboundary'
+SPOOL_THRESHOLD = 1024 * 1024
+
+
+def upload_event(file_size):
+    body = (
+        f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="name"\r\n\r\nreport\r\n'
+        f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="file"; filename="report.bin"\r\n'
+        'Content-Type: application/octet-stream\r\n\r\n'
+    ).encode() + b'x' * file_size + f'\r\n--{BOUNDARY}--\r\n'.encode()
+
+    return {
+        'body': base64.b64encode(body).decode(),
+        'isBase64Encoded': True,
+        'headers': {'content-type': f'multipart/form-data; boundary={BOUNDARY}'},
+    }
+
+
+def build_request(event):
+    request = MinikRequest(
+        request_type='api_request', path='/uploads', resource='/uploads', query_params={},
+        headers=event['headers'], uri_params={}, method='POST', body=event['body'], context=None, event=event
+    )
+    request.form_spool_threshold = SPOOL_THRESHOLD
+    return request
+
+
+def naive_parse(event):
+    body = base64.b64decode(event['body'])
+    parts = body.split(f'--{BOUNDARY}'.encode())
+    files = {}
+    for part in parts[1:-1]:
+        headers, _, content = part.partition(b'\r\n\r\n')
+        if b'filename=' in headers:
+            files['file'] = content[:-2]
+    return files['file']
+
+
+def minik_parse(event):
+    request = build_request(event)
+    return request.files['file'].size
+
+
+def peak_memory(parse, event):
+    tracemalloc.start()
+    parse(event)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def run():
+    print(f'{"file MB":>8} {"naive peak x":>13} {"minik peak x":>13}')
+
+    for file_size in (1024 * 1024, 8 * 1024 * 1024, 32 * 1024 * 1024):
+        event = upload_event(file_size)
+        naive = peak_memory(naive_parse, event) / file_size
+        minik = peak_memory(minik_parse, event) / file_size
+        print(f'{file_size // (1024 * 1024):>8} {naive:>13.2f} {minik:>13.2f}')
+
+
+if __name__ == '__main__':
+    run()
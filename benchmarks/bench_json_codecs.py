@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+    bench_json_codecs.py
+
+    Compare the cost of serializing the body of a list endpoint with every json
+    codec installed against json.dumps with the default separators.
+
+    Usage: python benchmarks/bench_json_codecs.py
+"""
+
+import datetime
+import decimal
+import json
+import timeit
+import uuid
+
+from minik import serializers
+
+
+NUMBER = 200
+
+
+def list_body(size):
+    return {
+        'data': [
+            {
+                'id': str(uuid.UUID(int=idx)),
+                'name': f'Event {idx}',
+                'price': float(decimal.Decimal('19.99')),
+                'date': datetime.date(2019, 5, 1).isoformat(),
+                'tags': ['road', 'gravel'],
+                'active': idx % 2 == 0,
+            }
+            for idx in range(size)
+        ]
+    }
+
+
+def run():
+    codecs = [serializers.StdlibJSONCodec()]
+    if serializers.orjson is not None:
+        codecs.append(serializers.OrjsonCodec())
+    if serializers.ujson is not None:
+        codecs.append(serializers.UjsonCodec())
+
+    print(f'{"codec":>8} {"items":>6} {"json.dumps usec":>16} {"codec usec":>11}')
+
+    for size in (10, 100, 1000):
+        body = list_body(size)
+        baseline = timeit.timeit(lambda: json.dumps(body), number=NUMBER) / NUMBER * 1e6
+
+        for codec in codecs:
+            elapsed = timeit.timeit(lambda: codec.dumps(body), number=NUMBER) / NUMBER * 1e6
+            print(f'{codec.name:>8} {size:>6} {baseline:>16.1f} {elapsed:>11.1f}')
+
+
+if __name__ == '__main__':
+    run()
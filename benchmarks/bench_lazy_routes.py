@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+    bench_lazy_routes.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Compare the cold start of an app that imports its views eagerly against the
+    same app using lazy routes. The view module simulates an expensive import,
+    like pandas or boto3, by sleeping at import time. Every measurement runs in a
+    fresh interpreter and times the creation of the app plus a request to /health.
+
+    Usage: python benchmarks/bench_lazy_routes.py
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+
+
+IMPORT_COST = 0.5
+RUNS = 3
+
+HEAVY_VIEWS = f'''
+import time
+time.sleep({IMPORT_COST})
+
+
+def get_report(report_id: int):
+    return {{'report_id': report_id}}
+'''
+
+APP_TEMPLATE = '''
+import time
+started = time.perf_counter()
+
+from unittest.mock import MagicMock
+from minik.core import Minik
+from minik.utils import create_alb_event
+
+app = Minik()
+
+@app.get('/health')
+def health():
+    return {{'status': 'ok'}}
+
+{registration}
+
+app(create_alb_event('/health', method='GET'), MagicMock())
+print(time.perf_counter() - started)
+'''
+
+EAGER = '''
+from heavy_views import get_report
+app.get('/reports/{report_id}')(get_report)
+'''
+
+LAZY = '''
+app.add_lazy_route('/reports/{report_id}', 'heavy_views:get_report', methods=['GET'])
+'''
+
+
+def cold_start(workdir, registration):
+    script = os.path.join(workdir, 'app.py')
+    with open(script, 'w') as app_file:
+        app_file.write(APP_TEMPLATE.format(registration=textwrap.dedent(registration)))
+
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([workdir, os.getcwd()]))
+    timings = [
+        float(subprocess.check_output([sys.executable, script], env=env))
+        for _ in range(RUNS)
+    ]
+    return min(timings)
+
+
+def run():
+    with tempfile.TemporaryDirectory() as workdir:
+        with open(os.path.join(workdir, 'heavy_views.py'), 'w') as views_file:
+            views_file.write(HEAVY_VIEWS)
+
+        print(f'eager registration: {cold_start(workdir, EAGER) * 1e3:>8.1f} ms')
+        print(f'lazy registration:  {cold_start(workdir, LAZY) * 1e3:>8.1f} ms')
+
+
+if __name__ == '__main__':
+    run()
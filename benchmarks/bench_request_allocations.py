@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+    bench_request_allocations.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Measure the memory allocated to build a MinikRequest from the bundled payloads
+    with tracemalloc. The current builders are compared against the previous
+    behaviour, which copied and lower cased every header and decoded every query
+    parameter for every request. The view reads a single header.
+
+    Usage: python benchmarks/bench_request_allocations.py
+"""
+
+import json
+import os
+import timeit
+import tracemalloc
+
+from minik.builders import APIGatewayRequestBuilder, ALBRequestBuilder, url_decode_params
+from minik.models import MinikRequest
+from minik.router import Router
+
+
+PAYLOADS_DIR = os.path.join(os.path.dirname(__file__), '..', 'payloads')
+BUILDS = 1000
+
+
+def eager_build(event, context, router):
+    headers = event.get('headers') or {}
+    resource, uri_params = router.resolve_path(event['path'])
+
+    return MinikRequest(
+        request_type='alb_request',
+        path=event['path'],
+        resource=resource,
+        query_params=url_decode_params(event.get('queryStringParameters') or {}),
+        headers={k.lower(): v for k, v in headers.items()},
+        uri_params=uri_params,
+        method=event.get('httpMethod'),
+        body=event.get('body'),
+        context=context,
+        event=event
+    )
+
+
+def handle(build, event, router):
+    request = build(event, None, router)
+    return request.headers.get('content-type')
+
+
+def allocated_bytes(build, event, router):
+    tracemalloc.start()
+    snapshot = tracemalloc.take_snapshot()
+
+    requests = [build(event, None, router) for _ in range(BUILDS)]
+    for request in requests:
+        request.headers.get('content-type')
+
+    allocated = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(snapshot, 'filename'))
+    tracemalloc.stop()
+    return allocated / BUILDS
+
+
+def run():
+    router = Router()
+    router.add_route('/test/{name}', lambda name: None)
+    router.add_route('/articles/{article_id}', lambda article_id: None)
+
+    payloads = [
+        ('gateway.json', APIGatewayRequestBuilder()),
+        ('alb.json', ALBRequestBuilder()),
+    ]
+
+    print(f'{"payload":>14} {"eager bytes":>12} {"lazy bytes":>12} {"eager usec":>11} {"lazy usec":>11}')
+
+    for payload_name, builder in payloads:
+        with open(os.path.join(PAYLOADS_DIR, payload_name)) as payload:
+            event = json.load(payload)
+
+        results = [
+            allocated_bytes(eager_build, event, router),
+            allocated_bytes(builder.build, event, router),
+            timeit.timeit(lambda: handle(eager_build, event, router), number=20000) / 20000 * 1e6,
+            timeit.timeit(lambda: handle(builder.build, event, router), number=20000) / 20000 * 1e6,
+        ]
+
+        print(f'{payload_name:>14} {results[0]:>12.0f} {results[1]:>12.0f} {results[2]:>11.2f} {results[3]:>11.2f}')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+    bench_response_headers.py
+
+    Measure the middleware path of a response: build the response from the default
+    headers of the app, merge the headers of a middleware, look up the content type
+    as ContentTypeMiddleware does, and convert the response to a dictionary. The
+    case insensitive headers of the response are compared against the previous
+    response, a plain dictionary of headers that built a lower case copy of the
+    headers for every content type lookup, for a growing number of lookups. The
+    timings are the best of several interleaved runs, the timings of a single run
+    are noisy on a shared machine.
+
+    Usage: python benchmarks/bench_response_headers.py
+"""
+
+import timeit
+
+from minik.models import Response, encode_body
+from minik.structures import MutableHeaders
+
+
+NUMBER = 20000
+REPEAT = 20
+DEFAULT_HEADERS = {'Content-Type': 'application/json'}
+# The app copies its default headers into every response.
+DEFAULT_MUTABLE_HEADERS = MutableHeaders(DEFAULT_HEADERS)
+MIDDLEWARE_HEADERS = {'X-Request-Id': 'c6af9ac6-7b61', 'Cache-Control': 'no-cache'}
+
+
+class DictResponse:
+    """
+    The previous response, the body is encoded as Response.to_dict encodes it.
+    """
+    __slots__ = ['body', 'headers', 'status_code', '_extra_headers']
+
+    def __init__(self, body='', headers=None, status_code=200):
+        self.body = body
+        self.headers = headers or {}
+        self.status_code = status_code
+        self._extra_headers = []
+
+    @property
+    def content_type(self):
+        return {
+            key.lower(): value
+            for key, value in self.headers.items()
+        }.get('content-type')
+
+    def to_dict(self):
+        body = self.body
+        if body.__class__ is str:
+            is_base64_encoded = False
+        else:
+            body, is_base64_encoded = encode_body(body, self.content_type)
+
+        response_dict = {
+            'headers': self.headers,
+            'statusCode': self.status_code,
+            'body': body,
+            'isBase64Encoded': is_base64_encoded
+        }
+
+        if self._extra_headers:
+            response_dict['multiValueHeaders'] = {}
+
+        return response_dict
+
+
+def dict_path(lookups):
+    response = DictResponse(headers=DEFAULT_HEADERS.copy())
+    response.headers.update(MIDDLEWARE_HEADERS)
+    for _ in range(lookups):
+        response.content_type
+    return response.to_dict()
+
+
+def headers_path(lookups):
+    response = Response(headers=DEFAULT_MUTABLE_HEADERS.copy())
+    response.headers.update(MIDDLEWARE_HEADERS)
+    for _ in range(lookups):
+        response.content_type
+    return response.to_dict()
+
+
+def best_of(paths):
+    """
+    The best time of every path in usec, the paths are run in turn.
+    """
+    timings = [[] for _ in paths]
+    for _ in range(REPEAT):
+        for path_timings, path in zip(timings, paths):
+            path_timings.append(timeit.timeit(path, number=NUMBER))
+    return [min(path_timings) / NUMBER * 1e6 for path_timings in timings]
+
+
+def run():
+    print(f'{"lookups":>8} {"dict usec":>10} {"mapping usec":>13}')
+
+    # The content type is looked up by every middleware that depends on it.
+    for lookups in (1, 2, 4):
+        dict_elapsed, headers_elapsed = best_of([lambda: dict_path(lookups), lambda: headers_path(lookups)])
+        print(f'{lookups:>8} {dict_elapsed:>10.3f} {headers_elapsed:>13.3f}')
+
+
+if __name__ == '__main__':
+    run()
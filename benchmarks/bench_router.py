@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+    bench_router.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Measure the cost of resolving a path with the router as the number of routes
+    grows. The trie based lookup is compared against a linear scan of compiled
+    regular expressions, which is how the router used to resolve ALB paths.
+
+    Usage: python benchmarks/bench_router.py
+"""
+
+import timeit
+
+from minik.router import Router, compile_path
+
+
+ROUTE_COUNTS = (10, 100, 500, 1000, 2000)
+ITERATIONS = 20000
+
+
+def noop_view(**kwargs):
+    pass
+
+
+def build_routes(route_count):
+    return [f'/resource{idx}/{{item_id}}/details' for idx in range(route_count)]
+
+
+def linear_resolve(compiled_paths, path):
+    for path_re, resource in compiled_paths:
+        match = path_re.match(path)
+        if match:
+            return (resource, dict(match.groupdict()))
+    return (None, {})
+
+
+def run():
+    print(f'{"routes":>8} {"trie last":>12} {"trie miss":>12} {"linear last":>12} {"linear miss":>12}  (usec/lookup)')
+
+    for route_count in ROUTE_COUNTS:
+        routes = build_routes(route_count)
+        router = Router()
+        for route_path in routes:
+            router.add_route(route_path, noop_view)
+
+        compiled_paths = [(compile_path(route_path), route_path) for route_path in routes]
+        last_path = f'/resource{route_count - 1}/2019/details'
+        missing_path = '/not/a/route'
+
+        timings = [
+            timeit.timeit(lambda: router.resolve_path(last_path), number=ITERATIONS),
+            timeit.timeit(lambda: router.resolve_path(missing_path), number=ITERATIONS),
+            timeit.timeit(lambda: linear_resolve(compiled_paths, last_path), number=ITERATIONS // 10) * 10,
+            timeit.timeit(lambda: linear_resolve(compiled_paths, missing_path), number=ITERATIONS // 10) * 10,
+        ]
+
+        print(f'{route_count:>8} ' + ' '.join(f'{t / ITERATIONS * 1e6:>12.2f}' for t in timings))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+    bench_scopes.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Measure the cost of dispatching a request as the number of scopes of the
+    app grows. Every scope is bound to its own host and defines the same set of
+    routes.
+
+    Usage: python benchmarks/bench_scopes.py
+"""
+
+import timeit
+from unittest.mock import MagicMock
+
+from minik.core import Minik
+from minik.utils import create_alb_event
+
+
+SCOPE_COUNTS = (1, 10, 100, 1000)
+ROUTES_PER_SCOPE = 20
+ITERATIONS = 20000
+
+
+def build_app(scope_count):
+    app = Minik()
+
+    for scope_idx in range(scope_count):
+        scope = app.scope(host=f'app{scope_idx}.example.com')
+        for route_idx in range(ROUTES_PER_SCOPE):
+            scope.get(f'/resource{route_idx}/{{item_id}}')(lambda item_id: {'id': item_id})
+
+    return app
+
+
+def run():
+    context = MagicMock()
+    print(f'{"scopes":>8} {"select":>10} {"request":>10}  (usec)')
+
+    for scope_count in SCOPE_COUNTS:
+        app = build_app(scope_count)
+        event = create_alb_event('/resource10/52', method='GET',
+                                 headers={'host': f'app{scope_count - 1}.example.com'})
+
+        select_time = timeit.timeit(lambda: app._scopes.select(event), number=ITERATIONS)
+        request_time = timeit.timeit(lambda: app(event, context), number=ITERATIONS)
+
+        print(f'{scope_count:>8} {select_time / ITERATIONS * 1e6:>10.2f} {request_time / ITERATIONS * 1e6:>10.2f}')
+
+
+if __name__ == '__main__':
+    run()
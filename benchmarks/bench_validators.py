@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+    bench_validators.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Compare the compiled body validator against a naive validator that walks the
+    type hints of the dataclass with inspect/typing on every request. The payloads
+    are lists of line items sized from ~5KB to ~50KB of json.
+
+    Usage: python benchmarks/bench_validators.py
+"""
+
+import dataclasses
+import json
+import timeit
+import typing
+from dataclasses import dataclass
+from typing import List, Optional
+
+from minik.validators import compile_body_validator
+
+
+@dataclass
+class LineItem:
+    sku: str
+    quantity: int
+    price: float
+    notes: Optional[str] = None
+
+
+@dataclass
+class CreateOrder:
+    customer: str
+    express: bool
+    items: List[LineItem]
+
+
+def naive_validate(body_type, value, path=''):
+    """
+    Reflective validator, the type hints of every dataclass are inspected for
+    every value.
+    """
+    errors = []
+
+    if dataclasses.is_dataclass(body_type):
+        if not isinstance(value, dict):
+            return None, [(path, 'expected an object')]
+        kwargs = {}
+        for name, field_type in typing.get_type_hints(body_type).items():
+            if name not in value:
+                continue
+            kwargs[name], field_errors = naive_validate(field_type, value[name], f'{path}.{name}')
+            errors.extend(field_errors)
+        return (None if errors else body_type(**kwargs)), errors
+
+    origin = getattr(body_type, '__origin__', None)
+    if origin is list:
+        results = []
+        for idx, item in enumerate(value):
+            result, item_errors = naive_validate(body_type.__args__[0], item, f'{path}[{idx}]')
+            results.append(result)
+            errors.extend(item_errors)
+        return results, errors
+
+    if origin is typing.Union:
+        if value is None:
+            return None, []
+        return naive_validate(body_type.__args__[0], value, path)
+
+    if not isinstance(value, body_type):
+        return None, [(path, f'expected {body_type.__name__}')]
+
+    return value, []
+
+
+def build_payload(item_count):
+    return {
+        'customer': 'EAB',
+        'express': True,
+        'items': [
+            {'sku': f'SKU-{idx:06d}', 'quantity': idx % 7 + 1, 'price': idx * 1.25, 'notes': 'gift wrap'}
+            for idx in range(item_count)
+        ],
+    }
+
+
+def run():
+    validate = compile_body_validator(CreateOrder)
+    print(f'{"payload":>10} {"naive":>10} {"compiled":>10}  (usec)')
+
+    for item_count in (60, 150, 600):
+        body = json.loads(json.dumps(build_payload(item_count)))
+        size = len(json.dumps(body))
+        iterations = 200
+
+        naive_time = timeit.timeit(lambda: naive_validate(CreateOrder, body), number=iterations)
+        compiled_time = timeit.timeit(lambda: validate(body), number=iterations)
+
+        print(f'{size // 1024:>8}KB {naive_time / iterations * 1e6:>10.1f} {compiled_time / iterations * 1e6:>10.1f}')
+
+
+if __name__ == '__main__':
+    run()
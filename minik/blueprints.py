@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+    blueprints.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+from minik.router import RouteRegistrar
+
+
+class Blueprint(RouteRegistrar):
+    """
+    A blueprint collects a set of routes and middleware that can be mounted in
+    a minik app under a path prefix. Once mounted, the routes of the blueprint
+    live in their own route index and the middleware of the blueprint only runs
+    for the requests of the mount.
+
+    reports = Blueprint('reports')
+
+    @reports.get('/{report_id}')
+    def get_report(report_id: int):
+        pass
+
+    app.mount(reports, prefix='/reports')
+    """
+
+    def __init__(self, name=None):
+        self.name = name
+        self._routes = []
+        self._middleware = []
+        self._scopes = []
+
+    def add_route(self, path, view_func, **kwargs):
+        self._routes.append((path, view_func, kwargs))
+
+        for scope in self._scopes:
+            scope.add_route(path, view_func, **kwargs)
+
+    def add_middleware(self, middleware_instance):
+        self._middleware.append(middleware_instance)
+
+        for scope in self._scopes:
+            scope.middleware.append(middleware_instance)
+
+    def register(self, scope):
+        """
+        Add the routes and middleware of the blueprint to the given scope. The
+        routes added to the blueprint after it is mounted are added to the scope
+        as well.
+
+        :param scope: The RouteScope of the mount.
+        """
+        for path, view_func, kwargs in self._routes:
+            scope.add_route(path, view_func, **kwargs)
+
+        scope.middleware.extend(self._middleware)
+        self._scopes.append(scope)
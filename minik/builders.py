@@ -14,14 +14,64 @@
     limitations under the License.
 """
 
-import urllib.parse
+from abc import ABC, abstractmethod
+from functools import partial
+from http.client import responses
+
 from minik.constants import CONFIG_ERROR_MSG
 
-from minik.models import MinikRequest
+from minik.models import MinikRequest, BinaryTypes, encode_body, is_binary_body
 from minik.exceptions import MinikViewError, ConfigurationError
+from minik.router import is_greedy_resource
+from minik.structures import HeadersView, CloudFrontHeadersView
+from minik.utils import url_decode, parse_query_string
+
+
+# The responses of a WebSocket API are always sent as text.
+TEXT_ONLY = BinaryTypes([])
+
+
+class RequestBuilder(ABC):
+    """
+    A request builder maps a raw lambda event of a given type to a MinikRequest and
+    it maps the minik response back to the format expected by the source of the event.
+    The requests of a WebSocket builder are routed by the WebSocket router of the app.
+    """
+    is_websocket = False
+
+    @abstractmethod
+    def matches(self, event):
+        """
+        True if the raw event is handled by this builder.
+
+        :param event: The raw lambda event.
+        """
+        pass
 
+    @abstractmethod
+    def build(self, event, context, router):
+        """
+        Build the MinikRequest of the raw event.
+
+        :param event: The raw lambda event.
+        :param context: The lambda context.
+        :param router: The router used to find the resource of the request.
+        """
+        pass
+
+    def format_response(self, request, response, binary_types=None):
+        """
+        Convert the response of a request into the raw dictionary returned by the
+        lambda function.
 
-class APIGatewayRequestBuilder:
+        :param request: The MinikRequest built by this builder.
+        :param response: The minik Response of the request.
+        :param binary_types: The content types of the binary responses of the app.
+        """
+        return response.to_dict(binary_types)
+
+
+class APIGatewayRequestBuilder(RequestBuilder):
     """
     This builder knows how to convert an API Gateway event into a MinikRequest instance.
     The event should be the payload a lambda function receives when it is the target
@@ -47,26 +97,34 @@ class APIGatewayRequestBuilder:
         :param router: An instance of the minik router.
         """
 
-        headers = event.get('headers') or {}
-
         if 'resource' not in event:
             raise ConfigurationError(CONFIG_ERROR_MSG)
 
+        resource = event['resource']
+
+        # A greedy resource, like '/{proxy+}', can be the single integration in front
+        # of the whole app. Minik does the routing by matching the path of the request
+        # against the routes of the app.
+        if is_greedy_resource(resource) and not router.has_resource(resource):
+            resource, uri_params = router.resolve_path(event['path'])
+        else:
+            resource, uri_params = router.resolve_resource(resource, event['pathParameters'] or {})
+
         return MinikRequest(
             request_type='api_request',
             path=event['path'],
-            resource=event['resource'],
+            resource=resource,
             query_params=event.get('queryStringParameters') or {},
-            headers={k.lower(): v for k, v in headers.items()},
-            uri_params=event['pathParameters'] or {},
+            headers=HeadersView(event.get('headers')),
+            uri_params=uri_params,
             method=event['requestContext']['httpMethod'],
-            body=event['body'],
+            body=event.get('body'),
             context=context,
             event=event
         )
 
 
-class ALBRequestBuilder:
+class ALBRequestBuilder(RequestBuilder):
     """
     This request builder knows how to convert an ALB event to a MinikRequest instance.
     The ALB event is the payload a lambda function receives, when it is the target
@@ -98,46 +156,419 @@ class ALBRequestBuilder:
         :param router: An instance of the minik router.
         """
 
-        headers = event.get('headers') or {}
+        # With multi value headers enabled in the target group, the ALB only sends the
+        # multi value version of the headers and query parameters.
+        headers = event.get('headers') or last_values(event.get('multiValueHeaders'))
+        query_params = event.get('queryStringParameters') or last_values(event.get('multiValueQueryStringParameters'))
         resource, uri_params = router.resolve_path(event['path'])
 
         return MinikRequest(
             request_type='alb_request',
             path=event['path'],
             resource=resource,
-            query_params=url_decode_params(event.get('queryStringParameters') or {}),
-            headers={k.lower(): v for k, v in headers.items()},
+            query_params=partial(url_decode_params, query_params) if query_params else {},
+            headers=HeadersView(headers),
             uri_params=uri_params,
             method=event['httpMethod'],
-            body=event['body'],
+            body=event.get('body'),
             context=context,
             event=event
         )
 
+    def format_response(self, request, response, binary_types=None):
+        """
+        If the target group has multi value headers enabled, the ALB expects all
+        the headers of the response in the multiValueHeaders field. Otherwise only
+        the single value headers are supported.
+        """
+        if 'multiValueHeaders' not in request.aws_event:
+            response_dict = response.to_dict(binary_types)
+            response_dict.pop('multiValueHeaders', None)
+            return response_dict
+
+        response_dict = response.to_dict(binary_types, multi_value_headers=True)
+        del response_dict['headers']
+        return response_dict
 
-def url_decode_params(query_params):
+
+class HTTPAPIRequestBuilder(RequestBuilder):
     """
-    Decode the key value pairs of a set of parameters.
+    This builder knows how to convert the events sent by an API Gateway HTTP API,
+    or by a lambda function URL, into a MinikRequest instance. Both services send
+    events using the payload format version 2.0:
+    https://docs.aws.amazon.com/apigateway/latest/developerguide/http-api-develop-integrations-lambda.html
+    """
+
+    def matches(self, event):
+        """
+        Determine if the given raw event uses the payload format version 2.0.
+
+        :param event: The raw event received from the lambda function.
+        """
+        return event.get('version') == '2.0'
+
+    def build(self, event, context, router):
+        """
+        Map the raw HTTP API event to a MinikRequest. The routing is done by minik,
+        the raw path of the request is matched against the routes of the app.
+
+        :param event: The raw lambda function event.
+        :param context: The raw lambda function context object.
+        :param router: An instance of the minik router.
+        """
+
+        request_context = event.get('requestContext') or {}
+        path = strip_stage(event['rawPath'], request_context.get('stage'))
+        resource, uri_params = router.resolve_path(path)
+        raw_query_string = event.get('rawQueryString')
+
+        return MinikRequest(
+            request_type='http_api_request',
+            path=path,
+            resource=resource,
+            query_params=partial(query_string_params, raw_query_string) if raw_query_string else {},
+            headers=HeadersView(event.get('headers')),
+            uri_params=uri_params,
+            method=request_context['http']['method'],
+            body=event.get('body'),
+            context=context,
+            event=event,
+            raw_query_string=raw_query_string or ''
+        )
+
+    def format_response(self, request, response, binary_types=None):
+        """
+        The HTTP API expects the Set-Cookie headers of the response in the cookies
+        field, the values of the other headers sent multiple times are joined with
+        commas. A binary body is base64 encoded.
+        """
+
+        headers = {}
+        cookies = []
+
+        for name, values in response.multi_value_headers.items():
+            if name.lower() == 'set-cookie':
+                cookies.extend(values)
+            else:
+                headers[name] = ','.join(values)
+
+        body, is_base64_encoded = response.encoded_body(binary_types)
+
+        response_dict = {
+            'statusCode': response.status_code,
+            'headers': headers,
+            'body': body,
+            'isBase64Encoded': is_base64_encoded,
+        }
+
+        if cookies:
+            response_dict['cookies'] = cookies
+
+        return response_dict
+
+
+class WebSocketRequestBuilder(RequestBuilder):
     """
+    This builder knows how to convert the events of an API Gateway WebSocket API
+    into a MinikRequest instance. The resource of the request is the route key of
+    the event and the method is the type of the event, CONNECT, MESSAGE or DISCONNECT.
+    https://docs.aws.amazon.com/apigateway/latest/developerguide/apigateway-websocket-api-overview.html
+    """
+    is_websocket = True
+
+    def matches(self, event):
+        """
+        Determine if the given raw event comes from a WebSocket API.
+
+        :param event: The raw event received from the lambda function.
+        """
+        return (event.get('requestContext') or {}).get('connectionId') is not None
+
+    def build(self, event, context, router):
+        """
+        Map the raw WebSocket event to a MinikRequest.
+
+        :param event: The raw lambda function event.
+        :param context: The raw lambda function context object.
+        :param router: The WebSocket router of the app.
+        """
+
+        request_context = event['requestContext']
+
+        return MinikRequest(
+            request_type='websocket_request',
+            path=None,
+            resource=request_context['routeKey'],
+            query_params=event.get('queryStringParameters') or {},
+            headers=HeadersView(event.get('headers')),
+            uri_params={},
+            method=request_context.get('eventType'),
+            body=event.get('body'),
+            context=context,
+            event=event
+        )
+
+    def format_response(self, request, response, binary_types=None):
+        """
+        A WebSocket API only uses the status code and the body of the response. A
+        binary body is decoded as utf-8, the messages are sent as text.
+        """
+        body, _ = encode_body(response.body, response.content_type, TEXT_ONLY)
+        return {
+            'statusCode': response.status_code,
+            'body': body,
+        }
+
+
+class CloudFrontRequestBuilder(RequestBuilder):
+    """
+    This builder knows how to convert the CloudFront events received by a
+    Lambda@Edge function into a MinikRequest instance. The response of the view
+    is returned to CloudFront as a generated response.
+    https://docs.aws.amazon.com/AmazonCloudFront/latest/DeveloperGuide/lambda-event-structure.html
+    """
+
+    def matches(self, event):
+        """
+        Determine if the given raw event is a CloudFront event.
+
+        :param event: The raw event received from the lambda function.
+        """
+        records = event.get('Records')
+        return bool(records) and 'cf' in records[0]
+
+    def build(self, event, context, router):
+        """
+        Map the CloudFront request of the event to a MinikRequest. The routing is done
+        by minik, the uri of the request is matched against the routes of the app.
+
+        :param event: The raw lambda function event.
+        :param context: The raw lambda function context object.
+        :param router: An instance of the minik router.
+        """
+
+        cf_request = event['Records'][0]['cf']['request']
+        resource, uri_params = router.resolve_path(cf_request['uri'])
+        raw_query_string = cf_request.get('querystring') or ''
+        body = cf_request.get('body') or {}
+
+        return MinikRequest(
+            request_type='cloudfront_request',
+            path=cf_request['uri'],
+            resource=resource,
+            query_params=partial(query_string_params, raw_query_string) if raw_query_string else {},
+            headers=CloudFrontHeadersView(cf_request.get('headers')),
+            uri_params=uri_params,
+            method=cf_request['method'],
+            body=body.get('data'),
+            context=context,
+            event=event,
+            raw_query_string=raw_query_string,
+            is_base64_encoded=body.get('encoding') == 'base64'
+        )
 
-    def _decode_string(key_or_value):
+    def format_response(self, request, response, binary_types=None):
         """
-        Use unquote_plus first to convert + into spaces. Then use unquote to decode any other encodings.
+        CloudFront expects the status as a string and every header as a list of
+        {'key', 'value'} entries indexed by the lower case name of the header. A
+        body that was not serialized by the middleware of the app, like the body
+        of an error, is serialized as json.
         """
-        return urllib.parse.unquote(urllib.parse.unquote_plus(key_or_value))
+
+        body = response.body
+        body_encoding = 'text'
+
+        if is_binary_body(body):
+            body, is_base64_encoded = response.encoded_body(binary_types)
+            if is_base64_encoded:
+                body_encoding = 'base64'
+        elif not isinstance(body, str):
+            body = request.json_codec.dumps(body)
+            if response.content_type is None:
+                response.headers['Content-Type'] = 'application/json'
+
+        headers = {}
+        for name, values in response.multi_value_headers.items():
+            headers.setdefault(name.lower(), []).extend({'key': name, 'value': value} for value in values)
+
+        return {
+            'status': str(response.status_code),
+            'statusDescription': responses.get(response.status_code, ''),
+            'headers': headers,
+            'body': body,
+            'bodyEncoding': body_encoding,
+        }
+
+
+def strip_stage(path, stage):
+    """
+    The raw path of a request sent to a named stage of an HTTP API starts with the
+    name of the stage, '/prod/events' => '/events'.
+    """
+
+    if stage and stage != '$default':
+        stage_prefix = '/' + stage
+        if path == stage_prefix:
+            return '/'
+        if path.startswith(stage_prefix + '/'):
+            return path[len(stage_prefix):]
+
+    return path
+
+
+def query_string_params(raw_query_string):
+    """
+    Decode a raw query string into a dictionary, the last value of a parameter
+    sent multiple times is used.
+    """
+
+    return dict(parse_query_string(raw_query_string))
+
+
+def url_decode_params(query_params):
+    """
+    Decode the key value pairs of a set of parameters.
+    """
 
     return {
-        _decode_string(key): _decode_string(value)
+        url_decode(key): url_decode(value)
         for key, value in query_params.items()
     }
 
 
+def last_values(multi_value_params):
+    """
+    Get the last value of every key of a multi value dictionary.
+    """
+
+    return {key: values[-1] for key, values in (multi_value_params or {}).items() if values}
+
+
+# The events of an HTTP API and of a WebSocket API include the id of the api as
+# well, their builders must be checked first.
 REQUEST_BUILDERS = [
+    HTTPAPIRequestBuilder(),
+    WebSocketRequestBuilder(),
     APIGatewayRequestBuilder(),
-    ALBRequestBuilder()
+    ALBRequestBuilder(),
+    CloudFrontRequestBuilder()
 ]
 
 
+def event_fingerprint(event):
+    """
+    The shape of a raw event, made of the few keys that tell the event sources
+    apart: the payload version and the 'elb', 'connectionId' and 'apiId' keys of
+    the request context, or the 'cf' key and the event source of the first record.
+    None if the event has neither a request context nor records, these events are
+    not memoized.
+
+    :param event: The raw event received by the lambda function.
+    """
+
+    request_context = event.get('requestContext')
+    if request_context is not None:
+        return (
+            event.get('version'), 'elb' in request_context, 'connectionId' in request_context,
+            'apiId' in request_context
+        )
+
+    records = event.get('Records')
+    if records:
+        record = records[0]
+        return ('cf' in record, record.get('eventSource') or record.get('EventSource'))
+
+    return None
+
+
+class RequestBuilderRegistry:
+    """
+    The request builders of an app. The builder of an event is the first builder
+    that matches the event. Once custom builders are registered, the decision is
+    memoized by the fingerprint of the event and the builder of an event is found
+    with a single dictionary lookup, no matter how many builders are registered.
+
+    The builders must match events based on their shape only, two events with the
+    same fingerprint, see event_fingerprint, are expected to come from the same
+    source.
+
+    :param builders: The request builders, by default the builders of the event
+                     sources supported by minik.
+    """
+    MAX_FINGERPRINTS = 256
+
+    def __init__(self, builders=None):
+        self._builders = list(REQUEST_BUILDERS if builders is None else builders)
+        self._builders_by_fingerprint = {}
+        self._memoized = self._has_custom_builders()
+
+    @property
+    def builders(self):
+        return tuple(self._builders)
+
+    def _has_custom_builders(self):
+        # The builders of minik match an event with one or two lookups, scanning
+        # them is cheaper than computing the fingerprint of the event.
+        return self._builders != list(REQUEST_BUILDERS)
+
+    def add(self, builder, index=0):
+        """
+        Register a request builder. By default the builder takes precedence over
+        the builders already registered.
+
+        :param builder: The instance of the RequestBuilder.
+        :param index: The position of the builder in the list of builders.
+        """
+        self._builders.insert(index, builder)
+        self._builders_by_fingerprint.clear()
+        self._memoized = self._has_custom_builders()
+
+    def find(self, event):
+        """
+        Get the builder of the given event. If the type of event is not supported,
+        an exception will be raised.
+
+        :param event: The raw event received by the lambda function.
+        """
+        if not self._memoized:
+            return self._match(event)
+
+        fingerprint = event_fingerprint(event)
+        builder = self._builders_by_fingerprint.get(fingerprint)
+
+        if builder is None:
+            builder = self._match(event)
+
+            if fingerprint is not None:
+                if len(self._builders_by_fingerprint) >= self.MAX_FINGERPRINTS:
+                    self._builders_by_fingerprint.clear()
+                self._builders_by_fingerprint[fingerprint] = builder
+
+        return builder
+
+    def _match(self, event):
+        for builder in self._builders:
+            if builder.matches(event):
+                return builder
+
+        raise MinikViewError('Unsupported event type.')
+
+
+def find_request_builder(event):
+    """
+    Get the builder that knows how to map the given lambda function event. If the
+    type of event is not supported, an exception will be raised.
+
+    :param event: The raw event received by the lambda function.
+    """
+
+    for builder in REQUEST_BUILDERS:
+        if builder.matches(event):
+            return builder
+
+    raise MinikViewError('Unsupported event type.')
+
+
 def build_request(event, context, router):
     """
     Build a minik request from the given lambda function event. Given a set of
@@ -149,8 +580,4 @@ def build_request(event, context, router):
     :param router: An instance of the minik router.
     """
 
-    for builder in REQUEST_BUILDERS:
-        if builder.matches(event):
-            return builder.build(event, context, router)
-
-    raise MinikViewError('Unsupported event type.')
+    return find_request_builder(event).build(event, context, router)
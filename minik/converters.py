@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+    converters.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import re
+import uuid
+
+from minik.exceptions import ConfigurationError
+
+
+class BaseConverter:
+    """
+    A path converter is defined as part of a route template, '/items/{item_id:int}'.
+    The regex of the converter determines which values of a path segment match
+    the parameter, and the convert method transforms the matched string into the
+    value given to the view. If convert raises a ValueError, the path does not
+    match the route.
+    """
+    regex = '[^/]+'
+
+    def convert(self, value):
+        return value
+
+
+class StringConverter(BaseConverter):
+    pass
+
+
+class IntConverter(BaseConverter):
+    regex = '[0-9]+'
+
+    def convert(self, value):
+        return int(value)
+
+
+class FloatConverter(BaseConverter):
+    regex = r'[0-9]+(?:\.[0-9]+)?'
+
+    def convert(self, value):
+        return float(value)
+
+
+class UUIDConverter(BaseConverter):
+    regex = '[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+
+    def convert(self, value):
+        return uuid.UUID(value)
+
+
+class PathConverter(BaseConverter):
+    """
+    Match the rest of the path, including the slashes, '/static/{file:path}'
+    matches '/static/css/main.css' with file='css/main.css'.
+    """
+    regex = '.+'
+
+
+CONVERTERS = {
+    'str': StringConverter(),
+    'int': IntConverter(),
+    'float': FloatConverter(),
+    'uuid': UUIDConverter(),
+    'path': PathConverter(),
+}
+
+CONVERTER_NAME_RE = re.compile('^[a-zA-Z_][a-zA-Z0-9_]*$')
+
+
+def register_converter(name, converter):
+    """
+    Make a custom converter available to route templates. Once registered, the
+    converter can be used as '/items/{item_id:name}'. Converters must be registered
+    before the routes that use them.
+
+    :param name: The name of the converter as used in a route template.
+    :param converter: An instance of a BaseConverter.
+    """
+    if not CONVERTER_NAME_RE.match(name):
+        raise ConfigurationError(f'Invalid converter name "{name}".')
+
+    CONVERTERS[name] = converter
+
+
+def get_converter(name):
+    """
+    Get the converter registered for the given name. An unknown converter is a
+    definition error, the exception is raised when the route is added.
+
+    :param name: The name of the converter, 'int' for '{item_id:int}'.
+    """
+    try:
+        return CONVERTERS[name]
+    except KeyError:
+        raise ConfigurationError(f'Unknown path converter "{name}".')
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+    cookies.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import calendar
+import datetime
+import re
+from email.utils import formatdate
+
+
+# The characters allowed in a cookie value without quotes, RFC 6265.
+COOKIE_VALUE_RE = re.compile(r'^[!#-+\--:<-\[\]-~]*$')
+SAMESITE_VALUES = ('Strict', 'Lax', 'None')
+
+# A name=value pair of a Cookie header, the value can be a quoted string.
+COOKIE_PAIR_RE = re.compile(r'\s*([^=;]*?)\s*(?:=\s*("(?:[^"\\]|\\.)*"|[^;]*?))?\s*(?:;|$)')
+
+
+def unquote_cookie_value(value):
+    if len(value) > 1 and value[0] == '"' and value[-1] == '"':
+        return value[1:-1].replace('\\"', '"').replace('\\\\', '\\')
+    return value
+
+
+def quote_cookie_value(value):
+    if COOKIE_VALUE_RE.match(value):
+        return value
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def parse_cookies(cookie_headers):
+    """
+    Parse the values of the Cookie headers of a request into a dictionary. If a
+    cookie is sent multiple times, the first value is used.
+
+    ['session=38afes7a8; theme=dark'] => {'session': '38afes7a8', 'theme': 'dark'}
+
+    :param cookie_headers: The values of the Cookie headers, or the cookies of an HTTP API event.
+    """
+    cookies = {}
+
+    for header in cookie_headers:
+        for match in COOKIE_PAIR_RE.finditer(header):
+            name, value = match.groups()
+            if name and value is not None and name not in cookies:
+                cookies[name] = unquote_cookie_value(value)
+
+    return cookies
+
+
+def http_date(value):
+    """
+    Format a date as used by the http headers, 'Wed, 21 Oct 2015 07:28:00 GMT'.
+
+    :param value: A datetime (UTC if naive), a timestamp or an already formatted string.
+    """
+    if isinstance(value, str):
+        return value
+
+    if isinstance(value, datetime.datetime):
+        value = calendar.timegm(value.utctimetuple())
+
+    return formatdate(value, usegmt=True)
+
+
+def dump_cookie(key, value='', max_age=None, expires=None, path='/', domain=None,
+                secure=False, httponly=False, samesite=None):
+    """
+    Build the value of a Set-Cookie header.
+
+    :param key: The name of the cookie.
+    :param value: The value of the cookie.
+    :param max_age: The number of seconds until the cookie expires, or a timedelta.
+    :param expires: The expiration date, a datetime (UTC if naive), a timestamp or a string.
+    :param path: The path of the cookie, by default the whole domain.
+    :param domain: The domain of the cookie.
+    :param secure: Only send the cookie over https.
+    :param httponly: Hide the cookie from javascript.
+    :param samesite: 'Strict', 'Lax' or 'None'.
+    """
+    parts = [f'{key}={quote_cookie_value(str(value))}']
+
+    if domain:
+        parts.append(f'Domain={domain}')
+    if expires is not None:
+        parts.append(f'Expires={http_date(expires)}')
+    if max_age is not None:
+        if isinstance(max_age, datetime.timedelta):
+            max_age = int(max_age.total_seconds())
+        parts.append(f'Max-Age={max_age}')
+    if path:
+        parts.append(f'Path={path}')
+    if secure:
+        parts.append('Secure')
+    if httponly:
+        parts.append('HttpOnly')
+    if samesite:
+        samesite = samesite.title()
+        if samesite not in SAMESITE_VALUES:
+            raise ValueError(f'Invalid SameSite value "{samesite}".')
+        parts.append(f'SameSite={samesite}')
+
+    return '; '.join(parts)
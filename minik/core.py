@@ -17,14 +17,20 @@
 from contextlib import contextmanager
 
 from minik.exceptions import MinikViewError
-from minik.models import Response
-from minik.builders import build_request
-from minik.router import Router
-from minik.middleware import (ServerErrorMiddleware, ExceptionMiddleware, ContentTypeMiddleware)
+from minik.forms import DEFAULT_SPOOL_THRESHOLD
+from minik.models import Response, BinaryTypes
+from minik.builders import RequestBuilderRegistry, CloudFrontRequestBuilder
+from minik.router import CacheInfo, Router, RouteRegistrar
+from minik.scopes import ScopeDispatcher
+from minik.serializers import default_json_codec
+from minik.websockets import WebSocketRouter
+from minik.middleware import (ServerErrorMiddleware, ExceptionMiddleware, ContentTypeMiddleware,
+                              before_view_hooks)
 from minik.status_codes import codes
+from minik.structures import MutableHeaders
 
 
-class Minik:
+class Minik(RouteRegistrar):
     """
     Minik is a microframwork that will handle a request from the API gateway and it
     will return a valid http response. The response returned will be determined by
@@ -44,51 +50,145 @@ class Minik:
     def __init__(self, **kwargs):
         self._debug = kwargs.get('debug', False)
 
-        self._router = Router()
+        # The edge profile is meant for Lambda@Edge functions: the app only handles
+        # CloudFront events, the json content negotiation and the trace of unhandled
+        # exceptions are skipped, and the views are responsible for the content type
+        # of their responses.
+        self._edge = kwargs.get('edge', False)
+
+        self._router = Router(cache_size=kwargs.get('route_cache_size'))
+        self._scopes = ScopeDispatcher(route_cache_size=kwargs.get('route_cache_size'))
+        self._websocket_router = WebSocketRouter()
         self._error_middleware = kwargs.get('server_error_middleware', ServerErrorMiddleware())
-        self._exception_middleware = kwargs.get('exception_middleware', ExceptionMiddleware())
+        self._exception_middleware = kwargs.get('exception_middleware', ExceptionMiddleware(trace=not self._edge))
+
+        # The codec used to parse the json body of the requests and to serialize
+        # the json responses.
+        self._json_codec = kwargs.get('json_codec') or default_json_codec()
+
+        # The content types of the responses sent base64 encoded. By default every
+        # bytes or file body is base64 encoded.
+        binary_types = kwargs.get('binary_types')
+        self._binary_types = BinaryTypes(binary_types) if binary_types is not None else None
+
+        # The files of a form larger than the threshold are written to a temporary file.
+        self._form_spool_threshold = kwargs.get('form_spool_threshold', DEFAULT_SPOOL_THRESHOLD)
+
+        # The builders of the events supported by the app, by default the builders
+        # of all the event sources supported by minik. An app with the edge profile
+        # only supports CloudFront events, the builder is selected once.
+        request_builders = kwargs.get('request_builders')
 
-        self._middleware = [ContentTypeMiddleware()]
+        if self._edge:
+            self._middleware = []
+            self._default_headers = MutableHeaders()
+            self._request_builders = RequestBuilderRegistry(request_builders or [CloudFrontRequestBuilder()])
+        else:
+            self._middleware = [ContentTypeMiddleware(self._json_codec)]
+            self._default_headers = MutableHeaders({'Content-Type': 'application/json'})
+            self._request_builders = RequestBuilderRegistry(request_builders)
+
+        self._request_builder = self._single_request_builder()
+        self._before_view_hooks = before_view_hooks(self._middleware)
 
     @property
     def in_debug(self):
         return self._debug
 
+    @property
+    def json_codec(self):
+        return self._json_codec
+
     def add_middleware(self, middleware_instance):
         self._middleware.append(middleware_instance)
+        self._before_view_hooks = before_view_hooks(self._middleware)
 
-    def get(self, path, **kwargs):
-        return self.route(path, methods=['GET'], **kwargs)
+    def add_route(self, path, view_func, **kwargs):
+        self._router.add_route(path, view_func, **kwargs)
 
-    def post(self, path, **kwargs):
-        return self.route(path, methods=['POST'], **kwargs)
+    def add_request_builder(self, builder, index=0):
+        """
+        Register a request builder, used to support an additional event source.
+        By default the builder takes precedence over the builders of the app.
 
-    def put(self, path, **kwargs):
-        return self.route(path, methods=['PUT'], **kwargs)
+        :param builder: The instance of the RequestBuilder.
+        :param index: The position of the builder in the list of builders of the app.
+        """
+        self._request_builders.add(builder, index=index)
+        self._request_builder = self._single_request_builder()
 
-    def patch(self, path, **kwargs):
-        return self.route(path, methods=['PATCH'], **kwargs)
+    def _single_request_builder(self):
+        builders = self._request_builders.builders
+        return builders[0] if self._edge and len(builders) == 1 else None
 
-    def delete(self, path, **kwargs):
-        return self.route(path, methods=['DELETE'], **kwargs)
+    def add_websocket_route(self, route_key, view_func, **kwargs):
+        self._websocket_router.add_route(route_key, view_func, **kwargs)
 
-    def route(self, path, **kwargs):
+    def websocket(self, route_key, **kwargs):
         """
-        The decorator function used to associate a given route path to a handler.
+        The decorator used to associate a route key of a WebSocket API to a view.
+        The messages with a route key that does not have a view are handled by
+        the view of the '$default' route key.
 
-        @route('/events/{event_id}')
-        def get_event(event_id: str):
-            pass
+        @app.websocket('$connect')
+        def connect():
+            save_connection(app.request.connection_id)
 
-        :param path: The endpoint associated with a given view.
+        :param route_key: The route key, '$connect', '$disconnect', '$default' or a custom key.
         """
 
         def _register_view(view_func):
-            self._router.add_route(path, view_func, **kwargs)
+            self.add_websocket_route(route_key, view_func, **kwargs)
             return view_func
 
         return _register_view
 
+    def scope(self, host=None, stage=None, prefix=''):
+        """
+        Get the route scope for the given host, API Gateway stage and path prefix.
+        The routes of a scope are only matched by the requests sent to the scope,
+        which allows a single function to serve multiple apps.
+
+        api = app.scope(host='api.example.com')
+
+        @api.get('/events/{event_id}')
+        def get_event(event_id: str):
+            pass
+
+        :param host: The value of the Host header of the requests in the scope.
+        :param stage: The API Gateway stage of the requests in the scope.
+        :param prefix: The path prefix of the routes in the scope, for instance '/billing'.
+        """
+        return self._scopes.get_or_create(host=host, stage=stage, prefix=prefix)
+
+    def mount(self, blueprint, prefix='', host=None, stage=None):
+        """
+        Mount the routes and middleware of a blueprint under the given prefix. The
+        requests of the mount are resolved against the routes of the blueprint, the
+        paths the blueprint does not define fall back to the routes of the app. A
+        blueprint mounted without a prefix shares the paths of the app.
+
+        :param blueprint: The instance of the Blueprint.
+        :param prefix: The path prefix of the routes of the blueprint, for instance '/reports'.
+        :param host: The optional value of the Host header of the requests of the mount.
+        :param stage: The optional API Gateway stage of the requests of the mount.
+        """
+        blueprint.register(self.scope(host=host, stage=stage, prefix=prefix))
+
+    def route_cache_info(self):
+        """
+        Get the hits, misses and evictions of the route caches of the app, summed
+        over the router of the app and the router of every scope. Every scope has
+        its own cache of route_cache_size paths, the maxsize is the total size of
+        the caches. If the app was created without a route cache, None is returned.
+        """
+        infos = [self._router.cache_info()] + [scope.router.cache_info() for scope in self._scopes]
+        infos = [info for info in infos if info is not None]
+        if not infos:
+            return None
+
+        return CacheInfo(*(sum(values) for values in zip(*infos)))
+
     def __call__(self, event, context):
         """
         The entrypoint of a lambda function. When building a web app with minik,
@@ -106,26 +206,66 @@ class Minik:
         :param context: The aws context included in every lambda function execution
         """
 
+        # Select the routes of the scope of the event, by default all the routes
+        # are defined in the router of the app.
+        scope = self._scopes.select(event)
+        router = scope.router if scope else self._router
+
         # Normalize the raw event by type and build a MinikRequest.
-        self.request = build_request(event, context, self._router)
+        builder = self._request_builder or self._request_builders.find(event)
+
+        # The events of a WebSocket API are routed by route key.
+        if builder.is_websocket:
+            scope, router = None, self._websocket_router
+
+        self.request = builder.build(event, context, router)
+
+        # A path that is not defined by the scope of the request falls back to the
+        # routes of the app, for instance /api/health next to an /api scope.
+        if scope is not None and not router.has_resource(self.request.resource):
+            scope, router = None, self._router
+            self.request = builder.build(event, context, router)
+
+        self.request.json_codec = self._json_codec
+        self.request.form_spool_threshold = self._form_spool_threshold
         self.response = Response(
             status_code=codes.ok,
-            headers={'Content-Type': 'application/json'}
+            headers=self._default_headers.copy()
         )
 
+        # The route of the request, None if the request does not match a route.
+        self.matched_route = None
+
         with error_handling(self):
-            route = self._router.find_route(self.request)
-            self.response.body = route.evaluate(self.request)
+            route = self.matched_route = router.find_route(self.request)
+            hooks = self._before_view_hooks
+            if scope is not None and scope.middleware:
+                hooks = hooks + before_view_hooks(scope.middleware)
+
+            # A middleware can answer the request before the view is executed, for
+            # instance a conditional request for a resource that did not change.
+            # The hooks receive the uri parameters converted for the view.
+            if not hooks:
+                self.response.body = route.evaluate(self.request)
+            else:
+                route.coerce_uri_params(self.request)
+                if not any(hook(self) for hook in hooks):
+                    self.response.body = route.evaluate(self.request, coerced=True)
 
         # After executing the view run all the middlewares in sequence. If a middleware
         # fails, handle the exception and move on. This code needs to run after the
         # execution of the views in its own contenxt given that we do want to run this
         # even if the view itself raised an exception.
-        with error_handling(self):
-            for middleware in self._middleware:
-                middleware(self)
+        if self._middleware or scope is not None:
+            with error_handling(self):
+                for middleware in self._middleware:
+                    middleware(self)
+
+                if scope is not None:
+                    for middleware in scope.middleware:
+                        middleware(self)
 
-        return self.response.to_dict()
+        return builder.format_response(self.request, self.response, self._binary_types)
 
 
 @contextmanager
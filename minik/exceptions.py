@@ -11,6 +11,19 @@ class MinikViewError(MinikError):
     def __init__(self, error_message, *args, **kwargs):
         super().__init__(f'{self.__class__.__name__}: {error_message}')
         self.status_code = kwargs.get('status_code', self.STATUS_CODE)
+        self.headers = kwargs.get('headers') or {}
+
+
+class ValidationError(MinikViewError):
+    """
+    The data of a request is not valid. The errors are a list of {'field', 'message'}
+    dictionaries, one for every invalid field.
+    """
+    STATUS_CODE = codes.bad_request
+
+    def __init__(self, error_message, *args, **kwargs):
+        super().__init__(error_message, *args, **kwargs)
+        self.errors = kwargs.get('errors') or []
 
 
 class ConfigurationError(MinikError):
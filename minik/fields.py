@@ -1,8 +1,10 @@
 import re
+import datetime
 import inspect
 from abc import ABC, abstractmethod
+from typing import List, Union
 
-from minik.exceptions import MinikViewError
+from minik.exceptions import ConfigurationError, MinikViewError
 from minik.status_codes import codes
 
 
@@ -55,7 +57,48 @@ CUSTOM_FIELD_BY_TYPE = {
 }
 
 
-def update_uri_parameters(view_fn, request):
+def compile_coercion_plan(view_fn, skip=(), fields=None):
+    """
+    Build the coercion plan of a view based on its function annotations. The plan
+    is a tuple of (field_name, converter) pairs, computed once when the route is
+    defined, so that a request does not need to inspect the annotations of the view.
+
+    def my_view(product_id: int, name: str):
+        pass
+
+    The plan of this view is (('product_id', int), ('name', CUSTOM_FIELD_BY_TYPE[str])).
+
+    :param view_fn: The function that will be executed for a given endpoint.
+    :param skip: The names of the parameters that were already converted by the router.
+    :param fields: If given, only the annotations of these parameters are part of the plan.
+    """
+
+    return tuple(
+        (field_name, CUSTOM_FIELD_BY_TYPE.get(field_type, field_type))
+        for field_name, field_type in view_fn.__annotations__.items()
+        #  Ignore 'return' field_name if type hint exists for view_fn
+        if field_name != 'return' and field_name not in skip and (fields is None or field_name in fields)
+    )
+
+
+def apply_coercion_plan(coercion_plan, values_by_name):
+    """
+    Validate and convert the uri parameters of a request using the coercion plan
+    of the view. If a value is not valid, the route does not match the request
+    and a not found error is raised.
+
+    :param coercion_plan: The plan built by compile_coercion_plan.
+    :param values_by_name: The uri parameters of the request.
+    """
+
+    try:
+        for field_name, converter in coercion_plan:
+            values_by_name[field_name] = converter(values_by_name[field_name])
+    except ValueError as ve:
+        raise MinikViewError(str(ve), status_code=codes.not_found)
+
+
+def update_uri_parameters(view_fn, request, skip=()):
     """
     Based on the function annotations of the route's view, validate a given route
     parameter and update the value of the requests' uri. For example, a route is
@@ -68,23 +111,171 @@ def update_uri_parameters(view_fn, request):
     it will update the string value of the request.uri_parameters to be the int
     representation of the value.
 
+    The routes of the app build the coercion plan of their view once, this function
+    builds it for every call.
+
     :param view_fn: The function that will be executed for a given endpoint.
     :param request: The instance of the minik request.
+    :param skip: The names of the parameters that were already converted by the router.
+    """
+
+    apply_coercion_plan(compile_coercion_plan(view_fn, skip), request.uri_params)
+
+
+TRUE_VALUES = frozenset(['true', '1', 'yes', 'on'])
+FALSE_VALUES = frozenset(['false', '0', 'no', 'off'])
+
+
+def parse_bool(value):
+    """
+    Convert the string value of a query parameter to a boolean.
+
+    :param value: The raw value, for instance 'true', '0' or 'off'.
+    """
+    lower_value = value.lower()
+
+    if lower_value in TRUE_VALUES:
+        return True
+    if lower_value in FALSE_VALUES:
+        return False
+
+    raise ValueError(f"invalid literal for bool(): '{value}'")
+
+
+class ListField:
+    """
+    Query parameter holding a list of values, '?ids=1,2,3' for an ids: List[int]
+    annotation. Every item of the list is converted with the item converter.
+    """
+
+    def __init__(self, item_converter):
+        self._item_converter = item_converter
+
+    def __call__(self, value):
+        return [self._item_converter(item) for item in value.split(',') if item]
+
+    def from_values(self, values):
+        """
+        Convert all the values of a query parameter sent multiple times, '?ids=1&ids=2,3'
+        is converted to [1, 2, 3].
+        """
+        return [self._item_converter(item) for value in values for item in value.split(',') if item]
+
+
+# The types that are not built from a string by calling the type.
+QUERY_CONVERTER_BY_TYPE = {
+    datetime.date: datetime.date.fromisoformat,
+    datetime.datetime: datetime.datetime.fromisoformat,
+    datetime.time: datetime.time.fromisoformat,
+}
+
+
+def query_field_converter(field_type):
     """
+    Get the converter of a query parameter based on its annotation. Unlike path
+    parameters, the value of a str parameter is not validated, and the bool,
+    Optional[...], List[...] and date annotations are supported. An annotation
+    that can not be built from a string raises a ConfigurationError.
+
+    :param field_type: The annotation of the view parameter.
+    """
+    args = getattr(field_type, '__args__', None) or ()
+
+    # Optional[int] is Union[int, None], the parameter is converted as an int.
+    if getattr(field_type, '__origin__', None) is Union:
+        non_null_args = [arg for arg in args if arg is not type(None)]  # noqa: E721
+        if len(non_null_args) == 1:
+            return query_field_converter(non_null_args[0])
 
-    values_by_name = request.uri_params
+    if field_type is list or getattr(field_type, '__origin__', None) in (list, List):
+        return ListField(query_field_converter(args[0]) if args else str)
+
+    if field_type is bool:
+        return parse_bool
+
+    if field_type is str:
+        return str
+
+    if field_type in QUERY_CONVERTER_BY_TYPE:
+        return QUERY_CONVERTER_BY_TYPE[field_type]
+
+    # The other annotations, like Dict[str, int] or Union[int, str], are not built
+    # from the string of a query parameter.
+    if not callable(field_type) or getattr(field_type, '__origin__', None) is not None:
+        raise ConfigurationError(f'The query parameters can not be converted to "{field_type}".')
+
+    return CUSTOM_FIELD_BY_TYPE.get(field_type, field_type)
+
+
+def _is_query_parameter(name, parameter, path_params):
+    if name in path_params or parameter.annotation is inspect.Parameter.empty:
+        return False
+    return parameter.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+
+
+def compile_query_plan(view_fn, path_params):
+    """
+    Build the plan used to fill the annotated parameters of a view that are not
+    part of the route path from the query string of a request. For example:
+
+    @app.get('/events')
+    def list_events(limit: int = 50, upcoming: bool = False):
+        pass
+
+    The plan is a tuple of (field_name, converter, required) values. A parameter
+    without a default value is required.
+
+    :param view_fn: The function that will be executed for a given endpoint.
+    :param path_params: The names of the parameters defined in the route path.
+    """
 
     try:
+        parameters = inspect.signature(view_fn).parameters
+    except (TypeError, ValueError):
+        return ()
 
-        for field_name, field_type in view_fn.__annotations__.items():
-            if field_name == 'return':
-                #  Ignore 'return' field_name if type hint exists for view_fn
-                continue
-            new_field_type = CUSTOM_FIELD_BY_TYPE.get(field_type, field_type)
-            values_by_name[field_name] = new_field_type(values_by_name[field_name])
+    return tuple(
+        (name, query_field_converter(parameter.annotation), parameter.default is inspect.Parameter.empty)
+        for name, parameter in parameters.items()
+        if _is_query_parameter(name, parameter, path_params)
+    )
 
-    except ValueError as ve:
-        raise MinikViewError(str(ve), status_code=codes.not_found)
+
+def apply_query_plan(query_plan, request):
+    """
+    Get the values of the query parameters of a view, converted based on the plan
+    of the view. A missing or invalid value results in a bad request error. The
+    missing optional parameters are left out, the view uses its default value.
+    The list parameters use all the values of the parameter, '?ids=1&ids=2'.
+
+    :param query_plan: The plan built by compile_query_plan.
+    :param request: The instance of the minik request.
+    """
+
+    values_by_name = {}
+    query_params = request.query_params
+
+    for field_name, converter, required in query_plan:
+        value = query_params.get(field_name)
+
+        if value is None:
+            if required:
+                raise MinikViewError(f'Missing query parameter "{field_name}".', status_code=codes.bad_request)
+            continue
+
+        try:
+            if isinstance(converter, ListField):
+                values_by_name[field_name] = converter.from_values(request.multi_query_params.getlist(field_name))
+            else:
+                values_by_name[field_name] = converter(value)
+        except (ValueError, TypeError, ArithmeticError) as ve:
+            # A Decimal raises an ArithmeticError, decimal.InvalidOperation.
+            raise MinikViewError(
+                f'Invalid value for query parameter "{field_name}": {ve}',
+                status_code=codes.bad_request
+            )
+
+    return values_by_name
 
 
 def cache_custom_route_fields(view):
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+    forms.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import io
+import re
+import shutil
+import tempfile
+
+from minik.exceptions import ValidationError
+from minik.structures import MultiDict
+from minik.utils import parse_query_string
+
+
+# The file parts larger than the threshold are written to a temporary file.
+DEFAULT_SPOOL_THRESHOLD = 1024 * 1024
+COPY_CHUNK_SIZE = 64 * 1024
+
+OPTION_RE = re.compile(r';\s*([^\s=;]+)\s*=\s*("(?:[^"\\]|\\.)*"|[^;]*)')
+
+
+def parse_options_header(value):
+    """
+    Split a header value into its main value and its options.
+    'form-data; name="avatar"; filename="me.png"' => ('form-data', {'name': 'avatar', 'filename': 'me.png'})
+    """
+    if not value:
+        return '', {}
+
+    main_value, _, rest = value.partition(';')
+    options = {}
+
+    for match in OPTION_RE.finditer(';' + rest):
+        option_value = match.group(2).strip()
+        if option_value[:1] == '"' and option_value[-1:] == '"':
+            option_value = option_value[1:-1].replace('\\"', '"').replace('\\\\', '\\')
+        options[match.group(1).lower()] = option_value
+
+    return main_value.strip().lower(), options
+
+
+class FileStorage:
+    """
+    A file uploaded with a multipart/form-data request. A small file is a view
+    over the body of the request, nothing is copied until the file is read. A
+    file larger than the spool threshold is written to a temporary file when the
+    form is parsed.
+    """
+
+    def __init__(self, name, filename, content_type, headers, data, spool_threshold=DEFAULT_SPOOL_THRESHOLD):
+        self.name = name
+        self.filename = filename
+        self.content_type = content_type
+        self.headers = headers
+        self.size = len(data)
+        self._data = None
+        self._stream = None
+
+        if self.size > spool_threshold:
+            self._stream = tempfile.SpooledTemporaryFile(max_size=spool_threshold)
+            for offset in range(0, self.size, COPY_CHUNK_SIZE):
+                self._stream.write(data[offset:offset + COPY_CHUNK_SIZE])
+        else:
+            self._data = data
+
+    @property
+    def stream(self):
+        """
+        A binary file object with the content of the file.
+        """
+        if self._stream is None:
+            self._stream = io.BytesIO(self._data)
+            self._data = None
+
+        self._stream.seek(0)
+        return self._stream
+
+    def read(self):
+        if self._data is not None:
+            return bytes(self._data)
+        return self.stream.read()
+
+    def save(self, destination):
+        """
+        Copy the content of the file to the given path or binary file object.
+
+        :param destination: A path or a binary file object.
+        """
+        if isinstance(destination, str):
+            with open(destination, 'wb') as file_obj:
+                shutil.copyfileobj(self.stream, file_obj, COPY_CHUNK_SIZE)
+        else:
+            shutil.copyfileobj(self.stream, destination, COPY_CHUNK_SIZE)
+
+    def close(self):
+        if self._stream is not None:
+            self._stream.close()
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}: {self.filename!r} ({self.content_type})>'
+
+
+def iter_multipart(data, boundary):
+    """
+    Iterate over the parts of a multipart body, a (headers, content) pair per part.
+    The content of a part is a memoryview over the body, the body is not copied.
+
+    :param data: The memoryview of the body of the request.
+    :param boundary: The boundary of the parts, given by the content type of the request.
+    """
+    raw = data.obj
+    delimiter = b'--' + boundary.encode('latin-1')
+    next_part = b'\r\n' + delimiter
+
+    position = raw.find(delimiter)
+    if position == -1:
+        raise ValueError('the multipart boundary was not found')
+    position += len(delimiter)
+
+    while raw[position:position + 2] != b'--':
+        if raw[position:position + 2] != b'\r\n':
+            raise ValueError('invalid multipart delimiter')
+
+        headers_end = raw.find(b'\r\n\r\n', position + 2)
+        if headers_end == -1:
+            raise ValueError('the headers of a part are not terminated')
+
+        headers = {}
+        for line in raw[position + 2:headers_end].decode('utf-8').split('\r\n'):
+            name, separator, value = line.partition(':')
+            if separator:
+                headers[name.strip().lower()] = value.strip()
+
+        content_end = raw.find(next_part, headers_end + 4)
+        if content_end == -1:
+            raise ValueError('the last part is not terminated')
+
+        yield headers, data[headers_end + 4:content_end]
+        position = content_end + len(next_part)
+
+
+def parse_multipart(data, boundary, charset='utf-8', spool_threshold=DEFAULT_SPOOL_THRESHOLD):
+    """
+    Parse a multipart/form-data body into its fields and its files.
+
+    :param data: The memoryview of the body of the request.
+    :param boundary: The boundary of the parts, given by the content type of the request.
+    :param charset: The charset of the values of the fields.
+    :param spool_threshold: The size after which a file is written to a temporary file.
+    """
+    fields, files = {}, {}
+
+    for headers, content in iter_multipart(data, boundary):
+        _, options = parse_options_header(headers.get('content-disposition'))
+        name = options.get('name')
+        if name is None:
+            continue
+
+        if 'filename' in options:
+            content_type = headers.get('content-type', 'application/octet-stream')
+            files.setdefault(name, []).append(
+                FileStorage(name, options['filename'], content_type, headers, content, spool_threshold)
+            )
+        else:
+            fields.setdefault(name, []).append(str(content, charset))
+
+    return MultiDict(fields), MultiDict(files)
+
+
+def parse_form_data(request, spool_threshold=DEFAULT_SPOOL_THRESHOLD):
+    """
+    Parse the form of a request, sent as application/x-www-form-urlencoded or as
+    multipart/form-data. The other content types result in an empty form.
+
+    :param request: The instance of the minik request.
+    :param spool_threshold: The size after which a file is written to a temporary file.
+    """
+    content_type, options = parse_options_header(request.headers.get('content-type'))
+    charset = options.get('charset') or 'utf-8'
+
+    try:
+        if content_type == 'application/x-www-form-urlencoded':
+            fields = {}
+            for key, value in parse_query_string(request.text):
+                fields.setdefault(key, []).append(value)
+            return MultiDict(fields), MultiDict()
+
+        if content_type == 'multipart/form-data':
+            if not options.get('boundary'):
+                raise ValueError('the multipart boundary is missing')
+            return parse_multipart(request.raw_body, options['boundary'], charset, spool_threshold)
+
+    except ValueError as error:
+        raise ValidationError(f'Invalid request body. The form is not valid, {error}.')
+
+    return MultiDict(), MultiDict()
@@ -1,9 +1,21 @@
+import datetime
+import hashlib
 import traceback
-import json
+import zlib
+from email.utils import parsedate_to_datetime
 
 from minik.constants import DEFAULT_500_ERROR
+from minik.cookies import http_date
+from minik.exceptions import ValidationError
+from minik.models import BYTES_TYPES, is_binary_body
+from minik.serializers import DEFAULT_JSON_CODEC
 from minik.status_codes import codes
 
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
 
 class ServerErrorMiddleware:
     """
@@ -21,15 +33,24 @@ class ServerErrorMiddleware:
         :param error: The instance of the MinikError.
         """
         app.response.status_code = error.status_code
+        app.response.headers.update(getattr(error, 'headers', None) or {})
         app.response.body = {'error_message': str(error)}
 
+        if isinstance(error, ValidationError):
+            app.response.body['errors'] = error.errors
+
 
 class ExceptionMiddleware:
     """
     Middleware used to trace unhandled exceptions. This middleware will update
-    the response of the current request to reflect the reason of failure.
+    the response of the current request to reflect the reason of failure. The
+    trace of the exception can be disabled, when the cost of formatting it matters
+    more than the logs, for instance in a Lambda@Edge function.
     """
 
+    def __init__(self, trace=True):
+        self.trace = trace
+
     def __call__(self, app, error, *args, **kwargs):
         """
         Execute the middleware for the given request with an exception instance.
@@ -40,19 +61,28 @@ class ExceptionMiddleware:
         :param error: The unhandled exception.
         """
 
-        body = _trace_error(error)
-
         app.response.status_code = codes.server_error
+
+        if not self.trace:
+            app.response.body = DEFAULT_500_ERROR
+            return
+
+        body = _trace_error(error)
         app.response.body = body if app.in_debug else DEFAULT_500_ERROR
 
 
 class ContentTypeMiddleware:
     """
     Update the response body based on the content type of the current response.
+    The json responses are serialized with the given codec, by default the
+    fastest codec installed.
     """
-    _transformer_by_content_type = {
-        'application/json': lambda body: json.dumps(body)
-    }
+
+    def __init__(self, json_codec=None):
+        self.json_codec = json_codec or DEFAULT_JSON_CODEC
+        self._transformer_by_content_type = {
+            'application/json': self.json_codec.dumps
+        }
 
     def __call__(self, app, *args, **kwargs):
         """
@@ -63,8 +93,370 @@ class ContentTypeMiddleware:
         :param app: The instance of the minik app.
         """
 
+        body = app.response.body
+
+        # A binary body is sent as is, it is base64 encoded if needed when the
+        # response is formatted.
+        if is_binary_body(body):
+            return
+
         transformer = self._transformer_by_content_type.get(app.response.content_type, _no_op_transform)
-        app.response.body = transformer(app.response.body)
+        app.response.body = transformer(body)
+
+
+# The content types that are already compressed, compressing them again costs cpu
+# time without saving bytes. An exact type or a major type, like 'video/'.
+COMPRESSED_TYPES = (
+    'image/', 'video/', 'audio/', 'font/woff', 'font/woff2', 'application/zip',
+    'application/gzip', 'application/x-gzip', 'application/pdf', 'application/octet-stream',
+)
+UNCOMPRESSED_IMAGE_TYPES = ('image/svg+xml', 'image/bmp')
+
+
+class CompressionMiddleware:
+    """
+    Compress the body of a response with gzip, or with brotli when it is installed,
+    based on the Accept-Encoding header of the request. The compressed body is sent
+    base64 encoded through the binary path of the response. The bodies smaller than
+    the minimum size and the content types that are already compressed are sent as
+    is. The middleware compresses the serialized body, it must be added after the
+    ContentTypeMiddleware of the app.
+
+    app.add_middleware(CompressionMiddleware(minimum_size=1024))
+
+    A route opts out of the compression with compress=False, or overrides the
+    settings of the middleware with a dictionary:
+
+    @app.get('/events', compress={'gzip_level': 9})
+    def get_events():
+        pass
+    """
+
+    MAX_NEGOTIATIONS = 64
+
+    def __init__(self, minimum_size=1024, gzip_level=6, brotli_quality=4, skip_types=COMPRESSED_TYPES):
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.skip_types = tuple(skip_types)
+        self.encodings = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+        # {accept_encoding: encoding}, a client sends the same header on every request.
+        self._negotiated = {}
+
+    def __call__(self, app, *args, **kwargs):
+        """
+        Execute the middleware for the given request, compress the body of the
+        response if the client accepts a supported encoding.
+
+        :param app: The instance of the minik app.
+        """
+
+        route = getattr(app, 'matched_route', None)
+        options = route.options.get('compress', True) if route is not None else True
+        if options is False:
+            return
+
+        settings = options if isinstance(options, dict) else {}
+        response = app.response
+        body = response.body
+
+        # A 304 response carries the headers of the response it stands for.
+        if response.status_code == codes.not_modified:
+            _add_vary(response.headers, 'Accept-Encoding')
+            if self.negotiate(app.request.headers.get('accept-encoding')):
+                _weaken_etag(response.headers)
+            return
+
+        if not isinstance(body, (str,) + BYTES_TYPES) or response.headers.get_lower('content-encoding'):
+            return
+
+        if self._is_compressed_type(response.content_type):
+            return
+
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+
+        if not body or len(body) < settings.get('minimum_size', self.minimum_size):
+            return
+
+        # The response depends on the Accept-Encoding header of the request, even
+        # if this client does not accept a compressed body.
+        _add_vary(response.headers, 'Accept-Encoding')
+
+        encoding = self.negotiate(app.request.headers.get('accept-encoding'))
+
+        if encoding == 'br':
+            response.body = brotli.compress(bytes(body), quality=settings.get('brotli_quality', self.brotli_quality))
+        elif encoding == 'gzip':
+            response.body = gzip_compress(body, settings.get('gzip_level', self.gzip_level))
+        else:
+            return
+
+        response.headers['Content-Encoding'] = encoding
+
+        # A strong ETag identifies the bytes of the body, the ETag of the
+        # uncompressed body is only a weak validator of the compressed body.
+        _weaken_etag(response.headers)
+
+    def _is_compressed_type(self, content_type):
+        if not content_type:
+            return False
+
+        mime_type = content_type.partition(';')[0].strip().lower()
+        return mime_type.startswith(self.skip_types) and mime_type not in UNCOMPRESSED_IMAGE_TYPES
+
+    def negotiate(self, accept_encoding):
+        """
+        Get the encoding of the response for the given Accept-Encoding header,
+        None if the client does not accept any of the supported encodings. The
+        encoding with the highest quality value wins, brotli wins a tie.
+
+        :param accept_encoding: The value of the Accept-Encoding header of the request.
+        """
+        if not accept_encoding:
+            return None
+
+        try:
+            return self._negotiated[accept_encoding]
+        except KeyError:
+            pass
+
+        qualities = parse_accept_encoding(accept_encoding)
+        encoding, best_quality = None, 0.0
+
+        for candidate in self.encodings:
+            quality = qualities.get(candidate, qualities.get('*', 0.0))
+            if quality > best_quality:
+                encoding, best_quality = candidate, quality
+
+        if len(self._negotiated) >= self.MAX_NEGOTIATIONS:
+            self._negotiated.clear()
+
+        self._negotiated[accept_encoding] = encoding
+        return encoding
+
+
+def parse_accept_encoding(accept_encoding):
+    """
+    Parse the value of an Accept-Encoding header into a {encoding: quality} dictionary.
+
+    parse_accept_encoding('gzip, br;q=0.8, *;q=0') => {'gzip': 1.0, 'br': 0.8, '*': 0.0}
+
+    :param accept_encoding: The value of the Accept-Encoding header.
+    """
+    qualities = {}
+
+    for item in accept_encoding.split(','):
+        encoding, _, params = item.partition(';')
+        encoding = encoding.strip().lower()
+        if not encoding:
+            continue
+
+        quality = 1.0
+        params = params.strip()
+        if params[:2].lower() == 'q=':
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+
+        qualities[encoding] = quality
+
+    return qualities
+
+
+def gzip_compress(body, level):
+    """
+    Compress the given bytes in the gzip format, without the copies of the gzip module.
+
+    :param body: The bytes to compress.
+    :param level: The compression level, from 1 (fastest) to 9 (smallest).
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    return compressor.compress(body) + compressor.flush()
+
+
+def _add_vary(headers, name):
+    vary = headers.get_lower('vary')
+    if not vary:
+        headers['Vary'] = name
+    elif name.lower() not in [value.strip().lower() for value in vary.split(',')]:
+        headers['Vary'] = f'{vary}, {name}'
+
+
+# The methods of the requests answered with a 304 response.
+CONDITIONAL_METHODS = ('GET', 'HEAD')
+
+
+class ETagMiddleware:
+    """
+    Add a strong ETag to the successful responses of GET and HEAD requests, and
+    answer the conditional requests, If-None-Match and If-Modified-Since, with an
+    empty 304 response. The ETag is the hash of the serialized body, the middleware
+    must be added after the ContentTypeMiddleware of the app and before the
+    CompressionMiddleware, which makes the ETag of a compressed body weak.
+
+    app.add_middleware(ETagMiddleware())
+
+    A route can give a cheap version function, called with the path parameters of
+    the request converted for the view, and/or a last modified function that
+    returns a datetime. They are evaluated before the view, which is not executed
+    if the client has the current version of the resource. A route opts out of the
+    ETag with etag=False.
+
+    @app.get('/events/{event_id}', etag=lambda event_id: get_event_version(event_id))
+    def get_event(event_id):
+        pass
+    """
+
+    def before_view(self, app):
+        """
+        Evaluate the version functions of the route, if any, before the view.
+        Return True if the request was answered with a 304 response, in which case
+        the view is not executed.
+
+        :param app: The instance of the minik app.
+        """
+        options = app.matched_route.options
+        version_fn = options.get('etag')
+        last_modified_fn = options.get('last_modified')
+
+        if not (callable(version_fn) or last_modified_fn) or app.request.method not in CONDITIONAL_METHODS:
+            return False
+
+        headers = app.response.headers
+
+        if callable(version_fn):
+            version = version_fn(**app.request.uri_params)
+            if version is not None:
+                headers['ETag'] = quote_etag(str(version))
+
+        if last_modified_fn:
+            last_modified = last_modified_fn(**app.request.uri_params)
+            if last_modified is not None:
+                headers['Last-Modified'] = http_date(last_modified)
+
+        if not is_not_modified(app.request.headers, headers):
+            return False
+
+        _not_modified(app.response)
+        return True
+
+    def __call__(self, app, *args, **kwargs):
+        """
+        Execute the middleware for the given request, add the ETag of the body to
+        the response and replace the response with a 304 if the client has the
+        current version of the resource.
+
+        :param app: The instance of the minik app.
+        """
+
+        response = app.response
+        if response.status_code != codes.ok or app.request.method not in CONDITIONAL_METHODS:
+            return
+
+        if app.matched_route is not None and app.matched_route.options.get('etag') is False:
+            return
+
+        headers = response.headers
+
+        # The ETag given by the version function of the route, or set by the view,
+        # takes precedence over the hash of the body.
+        if not headers.get_lower('etag'):
+            body = response.body
+            if isinstance(body, str):
+                body = body.encode('utf-8')
+            elif not isinstance(body, BYTES_TYPES):
+                return
+
+            headers['ETag'] = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+        if is_not_modified(app.request.headers, headers):
+            _not_modified(response)
+
+
+def quote_etag(version):
+    if version.startswith(('"', 'W/"')):
+        return version
+    return f'"{version}"'
+
+
+def is_not_modified(request_headers, response_headers):
+    """
+    Determine if the client of a conditional request has the current version of
+    the resource. If-None-Match takes precedence over If-Modified-Since, the ETags
+    are compared with the weak comparison.
+
+    :param request_headers: The headers of the request.
+    :param response_headers: The headers of the response, with its ETag and/or Last-Modified.
+    """
+
+    if_none_match = request_headers.get('if-none-match')
+    if if_none_match:
+        etag = response_headers.get_lower('etag')
+        if not etag:
+            return False
+        if if_none_match.strip() == '*':
+            return True
+
+        etag = etag[2:] if etag.startswith('W/') else etag
+        return any(
+            (candidate[2:] if candidate.startswith('W/') else candidate) == etag
+            for candidate in (value.strip() for value in if_none_match.split(','))
+        )
+
+    if_modified_since = parse_http_date(request_headers.get('if-modified-since'))
+    last_modified = parse_http_date(response_headers.get_lower('last-modified'))
+
+    return if_modified_since is not None and last_modified is not None and last_modified <= if_modified_since
+
+
+def parse_http_date(value):
+    """
+    Parse the date of an http header into an aware datetime, None if the date is
+    missing or not valid.
+
+    :param value: The value of the header, 'Wed, 21 Oct 2015 07:28:00 GMT'.
+    """
+    if not value:
+        return None
+
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+
+    if parsed is None:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=datetime.timezone.utc)
+
+
+def _not_modified(response):
+    # A 304 response does not have a body, the headers that describe the body
+    # are dropped. The cache headers, the ETag and Last-Modified are kept.
+    response.status_code = codes.not_modified
+    response.body = ''
+
+    for name in ('Content-Type', 'Content-Length', 'Content-Encoding'):
+        response.headers.pop(name, None)
+
+
+def before_view_hooks(middleware):
+    """
+    The before_view hooks of the given middleware. A hook is called with the app
+    after the route of the request is found, if it returns True the request was
+    answered by the middleware and the view is not executed.
+
+    :param middleware: The list of middleware instances.
+    """
+    return [instance.before_view for instance in middleware if hasattr(instance, 'before_view')]
+
+
+def _weaken_etag(headers):
+    etag = headers.get_lower('etag')
+    if etag and not etag.startswith('W/'):
+        headers['ETag'] = 'W/' + etag
 
 
 def _no_op_transform(body):
@@ -1,5 +1,12 @@
-import json
+import binascii
+from minik.cookies import dump_cookie, parse_cookies
+from minik.forms import DEFAULT_SPOOL_THRESHOLD, parse_form_data
+from minik.serializers import DEFAULT_JSON_CODEC
 from minik.status_codes import codes
+from minik.structures import MultiDict, MutableHeaders
+from minik.utils import url_decode, parse_query_string
+
+_NOT_PARSED = object()
 
 
 class MinikRequest:
@@ -9,11 +16,19 @@ class MinikRequest:
     friendly object to operate on. The idea is that a view does not need to be
     concerned with the inner representation of the APIGateway's event as long as
     it has access to the underlaying data values in the event.
+
+    The request does not copy the data of the event. The headers are a case
+    insensitive view of the raw headers, and the query parameters can be given
+    as a function called the first time the parameters are accessed.
     """
-    __slots__ = ['request_type', 'path', 'resource', 'query_params', 'headers', 'uri_params',
-                 'method', 'body', '_json_body', 'aws_context', 'aws_event']
+    __slots__ = ['request_type', 'path', 'resource', '_query_params', 'headers', 'uri_params',
+                 'method', 'body', '_json_body', 'aws_context', 'aws_event',
+                 '_multi_query_params', '_multi_headers', '_raw_body', 'json_codec',
+                 'raw_query_string', 'is_base64_encoded', '_form', '_files', 'form_spool_threshold',
+                 '_cookies']
 
-    def __init__(self, request_type, path, resource, query_params, headers, uri_params, method, body, context, event):
+    def __init__(self, request_type, path, resource, query_params, headers, uri_params, method, body, context, event,
+                 raw_query_string=None, is_base64_encoded=None):
 
         self.request_type = request_type
         self.path = path
@@ -28,37 +43,342 @@ class MinikRequest:
         # The parsed JSON from the body. This value should
         # only be set if the Content-Type header is application/json,
         # which is the default content type.
-        self._json_body = None
+        self._json_body = _NOT_PARSED
+        # The codec used to parse the json body, set by the app.
+        self.json_codec = DEFAULT_JSON_CODEC
+        # The multi value versions of the query parameters and headers are only
+        # built if a view requests them.
+        self._multi_query_params = None
+        self._multi_headers = None
+        # The bytes of the body, decoded from base64 if needed.
+        self._raw_body = None
+        # The events that only include the raw query string, like the HTTP API
+        # events, give it to the request to build the multi value parameters.
+        self.raw_query_string = raw_query_string
+        if is_base64_encoded is None:
+            is_base64_encoded = (event or {}).get('isBase64Encoded') is True
+        self.is_base64_encoded = is_base64_encoded
+        # The form is parsed the first time the fields or the files are accessed.
+        self._form = None
+        self._files = None
+        self.form_spool_threshold = DEFAULT_SPOOL_THRESHOLD
+        self._cookies = None
+
+    @property
+    def query_params(self):
+        if callable(self._query_params):
+            self._query_params = self._query_params()
+        return self._query_params
+
+    @query_params.setter
+    def query_params(self, query_params):
+        self._query_params = query_params
+
+    @property
+    def connection_id(self):
+        """
+        The id of the connection of a WebSocket event, None for other events.
+        """
+        return ((self.aws_event or {}).get('requestContext') or {}).get('connectionId')
 
     @property
     def json_body(self):
         """
-        Lazy loading/parsing of the json payload.
+        Lazy loading/parsing of the json payload. The messages of a WebSocket
+        API do not have headers, their body is always parsed as json.
         """
-        if self.headers.get('content-type', '').startswith('application/json'):
-            if self._json_body is None:
-                self._json_body = json.loads(self.body)
+        if self.request_type == 'websocket_request' or self.headers.get('content-type', '').startswith('application/json'):
+            if self._json_body is _NOT_PARSED:
+                self._json_body = self.json_codec.loads(self.raw_body.obj if self.is_base64_encoded else self.body)
             return self._json_body
 
+    @property
+    def raw_body(self):
+        """
+        The body of the request as a memoryview of bytes. A base64 encoded body,
+        like a binary upload, is decoded once and the bytes are cached.
+        """
+        if self._raw_body is None:
+            body = self.body
+
+            if not body:
+                self._raw_body = b''
+            elif self.is_base64_encoded:
+                # Unlike b64decode, a2b_base64 reads an ascii string without
+                # copying it to bytes first.
+                self._raw_body = binascii.a2b_base64(body)
+            elif isinstance(body, str):
+                self._raw_body = body.encode('utf-8')
+            else:
+                self._raw_body = bytes(body)
+
+        return memoryview(self._raw_body)
+
+    @property
+    def text(self):
+        """
+        The body of the request as a string, decoded with the charset of the
+        content type, utf-8 by default.
+        """
+        if isinstance(self.body, str) and not self.is_base64_encoded:
+            return self.body
+
+        content_type = self.headers.get('content-type', '')
+        _, _, charset = content_type.partition('charset=')
+
+        return str(self.raw_body.obj, charset.split(';')[0].strip() or 'utf-8')
+
+    @property
+    def cookies(self):
+        """
+        The cookies of the request, parsed the first time they are accessed. The
+        HTTP API sends the cookies in their own field instead of the Cookie header.
+        """
+        if self._cookies is None:
+            raw_cookies = (self.aws_event or {}).get('cookies')
+            if raw_cookies is None:
+                raw_cookies = self.multi_headers.getlist('cookie')
+            self._cookies = parse_cookies(raw_cookies)
+        return self._cookies
+
+    @property
+    def form(self):
+        """
+        The fields of a form sent as application/x-www-form-urlencoded or as
+        multipart/form-data.
+        """
+        if self._form is None:
+            self._form, self._files = parse_form_data(self, self.form_spool_threshold)
+        return self._form
+
+    @property
+    def files(self):
+        """
+        The files of a form sent as multipart/form-data, by field name.
+        """
+        if self._files is None:
+            self._form, self._files = parse_form_data(self, self.form_spool_threshold)
+        return self._files
+
+    @property
+    def multi_query_params(self):
+        """
+        All the values of the query parameters, '?id=1&id=2' => getlist('id') == ['1', '2'].
+        """
+        if self._multi_query_params is None:
+            lists = (self.aws_event or {}).get('multiValueQueryStringParameters')
+
+            if self.raw_query_string is not None:
+                lists = {}
+                for key, value in parse_query_string(self.raw_query_string):
+                    lists.setdefault(key, []).append(value)
+            elif lists is None:
+                lists = {key: [value] for key, value in self.query_params.items()}
+            elif self.request_type == 'alb_request':
+                lists = {url_decode(key): [url_decode(value) for value in values] for key, values in lists.items()}
+
+            self._multi_query_params = MultiDict(lists)
+
+        return self._multi_query_params
+
+    @property
+    def multi_headers(self):
+        """
+        All the values of the request headers, the names of the headers are lower case.
+        """
+        if self._multi_headers is None:
+            raw_lists = (self.aws_event or {}).get('multiValueHeaders')
+
+            if hasattr(self.headers, 'getlist'):
+                lists = {key: self.headers.getlist(key) for key in self.headers}
+            elif raw_lists is None:
+                lists = {key: [value] for key, value in self.headers.items()}
+            else:
+                lists = {}
+                for key, values in raw_lists.items():
+                    lists.setdefault(key.lower(), []).extend(values)
+
+            self._multi_headers = MultiDict(lists)
+
+        return self._multi_headers
+
+
+BYTES_TYPES = (bytes, bytearray, memoryview)
+
+
+def is_binary_body(body):
+    """
+    Determine if the body of a response is binary, bytes or a file object.
+    """
+    return isinstance(body, BYTES_TYPES) or hasattr(body, 'read')
+
+
+class BinaryTypes:
+    """
+    The content types of the responses sent base64 encoded. A type can be a
+    wildcard, 'image/*' matches all the images and '*/*' matches all the types.
+
+    :param types: The content types, ['application/pdf', 'image/*'].
+    """
+
+    def __init__(self, types):
+        self.types = tuple(types)
+        self.any_type = False
+        self._exact_types = set()
+        self._major_types = set()
+
+        for binary_type in self.types:
+            binary_type = binary_type.lower()
+            if binary_type == '*/*':
+                self.any_type = True
+            elif binary_type.endswith('/*'):
+                self._major_types.add(binary_type[:-2])
+            else:
+                self._exact_types.add(binary_type)
+
+    def matches(self, content_type):
+        if self.any_type:
+            return True
+        if not content_type:
+            return False
+
+        mime_type = content_type.partition(';')[0].strip().lower()
+        return mime_type in self._exact_types or mime_type.partition('/')[0] in self._major_types
+
+
+ANY_BINARY_TYPE = BinaryTypes(['*/*'])
+
+
+def encode_body(body, content_type, binary_types=None):
+    """
+    Prepare the body of a response to be sent by the lambda function, as a
+    (body, is_base64_encoded) pair. A binary body with a binary content type is
+    base64 encoded straight from its buffer, the other binary bodies are decoded
+    as utf-8 unless they are not valid utf-8. Without binary types, every binary
+    body is base64 encoded.
+
+    :param body: The body of the response.
+    :param content_type: The content type of the response.
+    :param binary_types: The BinaryTypes of the app, or a list of content types.
+    """
+    if not is_binary_body(body):
+        return body, False
+
+    if hasattr(body, 'read'):
+        body = body.getbuffer() if hasattr(body, 'getbuffer') else body.read()
+        if isinstance(body, str):
+            return body, False
+
+    if binary_types is not None and not isinstance(binary_types, BinaryTypes):
+        binary_types = BinaryTypes(binary_types)
+
+    if binary_types is not None and not binary_types.matches(content_type):
+        try:
+            return str(body, 'utf-8'), False
+        except UnicodeDecodeError:
+            # The body is not text, whatever its content type says.
+            pass
+
+    return binascii.b2a_base64(body, newline=False).decode('ascii'), True
+
 
 class Response:
-    __slots__ = ['body', 'headers', 'status_code']
+    __slots__ = ['body', '_headers', 'status_code']
 
     def __init__(self, body='', headers=None, status_code=codes.ok):
         self.body = body
-        self.headers = headers or {}
+        # The headers setter is inlined, a response is built for every request.
+        self._headers = headers if headers.__class__ is MutableHeaders else MutableHeaders(headers)
         self.status_code = status_code
 
+    @property
+    def headers(self):
+        """
+        The case insensitive headers of the response. The headers can be replaced
+        with a dictionary.
+        """
+        return self._headers
+
+    @headers.setter
+    def headers(self, headers):
+        # The class is compared directly, isinstance is slow with abstract base classes.
+        self._headers = headers if headers.__class__ is MutableHeaders else MutableHeaders(headers)
+
+    def add_header(self, name, value):
+        """
+        Add a header to the response without replacing the existing values of the
+        header, for instance to send multiple Set-Cookie headers.
+
+        :param name: The name of the header.
+        :param value: The value of the header.
+        """
+        self._headers.add(name, value)
+
+    def set_cookie(self, key, value='', **kwargs):
+        """
+        Add a Set-Cookie header to the response, a response can set multiple cookies.
+        The options of the cookie are documented by dump_cookie.
+
+        response.set_cookie('session', session_id, max_age=3600, secure=True, httponly=True)
+
+        :param key: The name of the cookie.
+        :param value: The value of the cookie.
+        """
+        self.add_header('Set-Cookie', dump_cookie(key, value, **kwargs))
+
+    def delete_cookie(self, key, path='/', domain=None):
+        """
+        Expire the given cookie in the client.
+
+        :param key: The name of the cookie.
+        """
+        self.set_cookie(key, expires=0, max_age=0, path=path, domain=domain)
+
+    @property
+    def multi_value_headers(self):
+        """
+        All the values of the response headers, {'Set-Cookie': ['a=1', 'b=2']}.
+        """
+        return self._headers.lists()
+
     @property
     def content_type(self):
-        return {
-            key.lower(): value
-            for key, value in self.headers.items()
-        }.get('content-type')
-
-    def to_dict(self, binary_types=None):
-        return {
-            'headers': self.headers,
+        return self._headers.get_lower('content-type')
+
+    def encoded_body(self, binary_types=None):
+        """
+        The body of the response as a (body, is_base64_encoded) pair, see encode_body.
+        A body with a content encoding, like a gzip body, is always base64 encoded.
+
+        :param binary_types: The content types of the binary responses.
+        """
+        if self._headers.get_lower('content-encoding'):
+            binary_types = ANY_BINARY_TYPE
+        return encode_body(self.body, self.content_type, binary_types)
+
+    def to_dict(self, binary_types=None, multi_value_headers=False):
+        """
+        The response in the format of the API Gateway and the ALB.
+
+        :param binary_types: The content types of the binary responses, see encode_body.
+        :param multi_value_headers: Include the multiValueHeaders field.
+        """
+        # A text body is sent as is, see encode_body.
+        body = self.body
+        if body.__class__ is str:
+            is_base64_encoded = False
+        else:
+            body, is_base64_encoded = self.encoded_body(binary_types)
+
+        headers = self._headers
+        response_dict = {
+            'headers': headers.to_dict(),
             'statusCode': self.status_code,
-            'body': self.body
+            'body': body,
+            'isBase64Encoded': is_base64_encoded
         }
+
+        if multi_value_headers or headers.has_multiple_values:
+            response_dict['multiValueHeaders'] = headers.lists()
+
+        return response_dict
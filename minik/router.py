@@ -15,14 +15,49 @@
 """
 
 import re
-from collections import defaultdict
+from abc import ABC, abstractmethod
+from collections import namedtuple, OrderedDict
 
-from minik.exceptions import MinikViewError
-from minik.fields import (update_uri_parameters, cache_custom_route_fields)
+from minik.converters import get_converter, PathConverter, StringConverter
+from minik.exceptions import MinikViewError, ConfigurationError
+from minik.fields import (apply_coercion_plan, compile_coercion_plan, cache_custom_route_fields,
+                          apply_query_plan, compile_query_plan)
 from minik.status_codes import codes
+from minik.validators import compile_body_plan, validate_json_body
+from minik.utils import import_string, validate_import_path
 
 
-PARAM_RE = re.compile("{([a-zA-Z_][a-zA-Z0-9_]*)(:[a-zA-Z_][a-zA-Z0-9_]*)?}")
+# The method slot of the routes defined without a set of methods.
+ANY_METHOD = '*'
+
+PARAM_RE = re.compile(r"{([a-zA-Z_][a-zA-Z0-9_]*)(:[a-zA-Z_][a-zA-Z0-9_]*|\+)?}")
+
+
+def param_definition(match):
+    """
+    Get the name and the converter of a parameter in a route template. For
+    instance, '{item_id:int}' is the item_id parameter with the int converter. A
+    parameter without a converter, '{item_id}', uses the str converter. A greedy
+    parameter, '{proxy+}' as defined by the API Gateway, uses the path converter.
+
+    :param match: The PARAM_RE match of a parameter.
+    """
+    param_name, converter_name = match.groups(default=":str")
+
+    if converter_name == '+':
+        return param_name, get_converter('path')
+
+    return param_name, get_converter(converter_name[1:])
+
+
+def is_greedy_resource(resource):
+    """
+    Determine if a resource of the API Gateway has a greedy path parameter,
+    for instance '/{proxy+}' or '/files/{key+}'.
+
+    :param resource: The resource of an API Gateway request.
+    """
+    return '+}' in resource
 
 
 def compile_path(path):
@@ -31,6 +66,7 @@ def compile_path(path):
     at the route level and it can be defined as having no parameters or multiple
     parameter. Given a definition like '/articles/{month}/{day}', this function will
     return the compiled regex equievanet of it as r'/articles/(?<month>[^/]+)/(?<day>[^/]+)'.
+    The regex of a parameter is defined by its converter, '{day:int}' => (?<day>[0-9]+).
 
     :param path: The path associated with a route.
     """
@@ -38,10 +74,10 @@ def compile_path(path):
     idx = 0
 
     for match in PARAM_RE.finditer(path):
-        param_name, convertor_type = match.groups(default="str")
+        param_name, converter = param_definition(match)
 
         path_re += path[idx:match.start()]
-        path_re += rf"(?P<{param_name}>[^/]+)"
+        path_re += rf"(?P<{param_name}>{converter.regex})"
 
         idx = match.end()
 
@@ -50,23 +86,411 @@ def compile_path(path):
     return re.compile(path_re)
 
 
+def compile_segment(segment):
+    """
+    Convert a single segment of a route template that mixes static text and
+    parameters, like '{name}.{ext}', to a regular expression. Unlike compile_path
+    the static text is escaped, so '{name}.{ext}' only matches values with a dot.
+
+    :param segment: A segment of a route template.
+    """
+    segment_re = "^"
+    idx = 0
+
+    for match in PARAM_RE.finditer(segment):
+        param_name, converter = param_definition(match)
+
+        segment_re += re.escape(segment[idx:match.start()])
+        segment_re += rf"(?P<{param_name}>{converter.regex})"
+        idx = match.end()
+
+    segment_re += re.escape(segment[idx:]) + "$"
+
+    return re.compile(segment_re)
+
+
+def strip_converters(route_path):
+    """
+    Remove the converters of a route template, '/items/{item_id:int}' => '/items/{item_id}'.
+    The API Gateway identifies a resource by the template without converters.
+
+    :param route_path: The route template.
+    """
+    return PARAM_RE.sub(lambda match: match.group(0) if match.group(2) == '+' else '{' + match.group(1) + '}', route_path)
+
+
+def split_path(path):
+    """
+    Split a path or a route template into its segments. The leading slash is
+    ignored but a trailing slash is significant, '/articles/{year}/' and
+    '/articles/{year}' are two different routes.
+
+    :param path: A route template like '/books/{year}' or a path like '/books/2019'.
+    """
+    return path[1:].split('/') if path.startswith('/') else path.split('/')
+
+
+class ParamSegment:
+    """
+    The dynamic segment of a route template. A segment is either a single
+    parameter, '{year}', or a mix of static text and parameters, '{name}.{ext}'.
+    Parameters without a converter accept any non empty value, all other segments
+    are matched with the compiled regular expression of their converters. The
+    matched values are converted as part of the match.
+    """
+
+    def __init__(self, segment):
+        self.segment = segment
+        match = PARAM_RE.fullmatch(segment)
+
+        if match:
+            self.name, converter = param_definition(match)
+            self.converters = {self.name: converter}
+            self.greedy = isinstance(converter, PathConverter)
+            self._segment_re = None if type(converter) is StringConverter else re.compile(f'^(?:{converter.regex})$')
+        else:
+            self.name = None
+            self.converters = dict(param_definition(match) for match in PARAM_RE.finditer(segment))
+            self.greedy = False
+            self._segment_re = compile_segment(segment)
+
+        # Typed segments are tried first, a value that does not match them falls
+        # through to the plain parameters and lastly to the greedy ones.
+        self.priority = 2 if self.greedy else int(self._segment_re is None)
+
+    def match(self, value):
+        """
+        Get the parameters captured by the segment for the given value of a path
+        segment. If the value does not match the segment, None is returned.
+
+        :param value: A single segment of the request path.
+        """
+        if self._segment_re is None:
+            return {self.name: value} if value else None
+
+        match = self._segment_re.match(value)
+        if not match:
+            return None
+
+        values = {self.name: value} if self.name else match.groupdict()
+
+        try:
+            return {name: self.converters[name].convert(raw_value) for name, raw_value in values.items()}
+        except ValueError:
+            return None
+
+
+class RouteNode:
+    """
+    A node of the route trie. Every node represents a segment of a route
+    template, the static segments are stored in a dictionary keyed by the text
+    of the segment and the dynamic segments are stored in registration order.
+    A node has a resource only if a route template ends in it.
+    """
+    __slots__ = ['static', 'params', 'resource']
+
+    def __init__(self):
+        self.static = {}
+        self.params = []
+        self.resource = None
+
+    def child(self, segment):
+        """
+        Get or create the child node associated with the segment of a route
+        template.
+
+        :param segment: A single segment of a route template.
+        """
+        if not PARAM_RE.search(segment):
+            return self.static.setdefault(segment, RouteNode())
+
+        for param_segment, node in self.params:
+            if param_segment.segment == segment:
+                return node
+
+        node = RouteNode()
+        self.params.append((ParamSegment(segment), node))
+        self.params.sort(key=lambda param: param[0].priority)
+        return node
+
+
+class RouteTrie:
+    """
+    Segment based trie used to map a request path to the route template that
+    defined it. A lookup walks the path one segment at a time, the static
+    segments are checked before the dynamic ones, which means that the cost of
+    finding a route depends on the depth of the path and not on the number of
+    routes defined in the app.
+    """
+
+    def __init__(self):
+        self._root = RouteNode()
+
+    def insert(self, route_path):
+        """
+        Add a route template to the trie.
+
+        :param route_path: The route template. For instance '/books/{year}'.
+        """
+        node = self._root
+        for segment in split_path(route_path):
+            node = node.child(segment)
+
+        node.resource = route_path
+
+    def lookup(self, path):
+        """
+        Find the route template and the path parameters of the given path. If
+        the path does not match any of the routes, (None, {}) is returned.
+
+        :param path: The path associated with a request.
+        """
+        uri_params = {}
+        resource = _match_node(self._root, split_path(path), 0, uri_params)
+        return (resource, uri_params) if resource is not None else (None, {})
+
+
+def _match_node(node, segments, idx, uri_params):
+    """
+    Depth first search of the path segments in the trie. Static segments take
+    precedence over dynamic ones, if a branch does not lead to a resource the
+    search backtracks and tries the next candidate.
+    """
+
+    if idx == len(segments):
+        return node.resource
+
+    segment = segments[idx]
+    static_node = node.static.get(segment)
+
+    if static_node is not None:
+        resource = _match_node(static_node, segments, idx + 1, uri_params)
+        if resource is not None:
+            return resource
+
+    for param_segment, param_node in node.params:
+        # A greedy segment consumes as many segments of the path as possible.
+        ends = range(len(segments), idx, -1) if param_segment.greedy else (idx + 1,)
+
+        for end in ends:
+            values = param_segment.match(segment if end == idx + 1 else '/'.join(segments[idx:end]))
+            if values is None:
+                continue
+
+            resource = _match_node(param_node, segments, end, uri_params)
+            if resource is not None:
+                uri_params.update(values)
+                return resource
+
+    return None
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+
+class RouteCache:
+    """
+    Bounded least recently used cache of resolved paths. Most of the traffic of
+    an app hits a small set of concrete paths, '/health' or '/books/2019', the
+    cache maps these paths to their (resource, uri_params) pair so the router
+    does not need to walk the route trie for every request.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = self.misses = self.evictions = 0
+        self._entries = OrderedDict()
+
+    def get(self, path):
+        """
+        Get the cached (resource, uri_params) of a path, None if the path is not
+        in the cache. The parameters are copied so a view cannot alter the
+        cached values.
+
+        :param path: The path associated with a request.
+        """
+        entry = self._entries.get(path)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(path)
+        return (entry[0], dict(entry[1]))
+
+    def put(self, path, resolved_path):
+        """
+        Store the (resource, uri_params) pair of a path. If the cache is full the
+        least recently used path is evicted.
+
+        :param path: The path associated with a request.
+        :param resolved_path: The (resource, uri_params) pair of the path.
+        """
+        self._entries[path] = (resolved_path[0], dict(resolved_path[1]))
+
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._entries))
+
+
 class SimpleRoute:
     """
     A class to store function based views for a given path. A route has two core
     components, a path and a function. Once the framework receives a request if
     the path of the request matches the path of the route, this class will know
     how to evaluate the function.
+
+    The function can also be given as an import path, 'myapp.reports:get_report'.
+    In this case the module of the view is imported the first time the route is
+    evaluated.
     """
     def __init__(self, route, endpoint, **kwargs):
         self.route = route
-        self.endpoint = endpoint
         self.methods = kwargs.get('methods')
+        # The options of the route are available to the middleware of the app, for
+        # instance compress=False.
+        self.options = kwargs
+        if self.methods:
+            self.methods = [method.upper() for method in self.methods]
+
+        # The parameters with a converter in the route template are converted
+        # when the path is matched, their annotations are not applied again.
+        self.path_params = frozenset(match.group(1) for match in PARAM_RE.finditer(route))
+        self.converted_params = frozenset(
+            match.group(1) for match in PARAM_RE.finditer(route) if match.group(2)
+        )
+
+        self._endpoint = None
+        self._import_path = None
+        self._coercion_plan = ()
+        self._query_plan = ()
+        self._body_plan = None
+
+        if isinstance(endpoint, str):
+            self._import_path = validate_import_path(endpoint)
+        else:
+            self._set_endpoint(endpoint)
+
+    def _resolve_endpoint(self):
+        """
+        Return the view of the route, the view of a lazy route is imported and its
+        coercion, body and query plans are built on the first call.
+        """
+        if self._endpoint is None:
+            self._set_endpoint(import_string(self._import_path))
+        return self._endpoint
 
-        cache_custom_route_fields(self.endpoint)
+    endpoint = property(_resolve_endpoint)
 
-    def evaluate(self, request, **kwargs):
-        update_uri_parameters(self.endpoint, request)
-        return self.endpoint(**request.uri_params)
+    def _set_endpoint(self, endpoint):
+        cache_custom_route_fields(endpoint)
+        self._coercion_plan = compile_coercion_plan(
+            endpoint, skip=self.converted_params, fields=self.path_params
+        )
+        self._body_plan = compile_body_plan(endpoint, self.path_params)
+
+        # The body parameter, if any, is not part of the query string.
+        body_params = {self._body_plan[0]} if self._body_plan else set()
+        self._query_plan = compile_query_plan(endpoint, self.path_params | body_params)
+        self._endpoint = endpoint
+
+    def coerce_uri_params(self, request):
+        """
+        Convert the uri parameters of the request with the annotations of the view,
+        for the middleware that needs the parameters of the view before it runs.
+
+        :param request: The instance of the minik request.
+        """
+        self._resolve_endpoint()
+        apply_coercion_plan(self._coercion_plan, request.uri_params)
+
+    def evaluate(self, request, coerced=False, **kwargs):
+        endpoint = self.endpoint
+        if not coerced:
+            apply_coercion_plan(self._coercion_plan, request.uri_params)
+
+        if not (self._query_plan or self._body_plan):
+            return endpoint(**request.uri_params)
+
+        view_kwargs = dict(request.uri_params)
+
+        if self._query_plan:
+            view_kwargs.update(apply_query_plan(self._query_plan, request))
+
+        if self._body_plan:
+            field_name, validator = self._body_plan
+            view_kwargs[field_name] = validate_json_body(validator, request)
+
+        return endpoint(**view_kwargs)
+
+
+class RouteRegistrar(ABC):
+    """
+    The set of decorators used to associate a route path to a view. A class
+    using the registrar must implement add_route.
+    """
+
+    @abstractmethod
+    def add_route(self, path, view_func, **kwargs):
+        """
+        Associate the route path to the given view.
+
+        :param path: The path of the route.
+        :param view_func: The view of the route.
+        """
+        pass
+
+    def add_lazy_route(self, path, import_path, **kwargs):
+        """
+        Associate a route path to a view given by its import path. The module of
+        the view is not imported until the first request to the route, which keeps
+        the expensive imports of a view out of the cold start of the function.
+
+        app.add_lazy_route('/reports/{report_id}', 'myapp.reports:get_report', methods=['GET'])
+
+        :param path: The endpoint associated with a given view.
+        :param import_path: The location of the view, 'module:function' or 'module.function'.
+        """
+        self.add_route(path, import_path, **kwargs)
+
+    def get(self, path, **kwargs):
+        return self.route(path, methods=['GET'], **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.route(path, methods=['POST'], **kwargs)
+
+    def put(self, path, **kwargs):
+        return self.route(path, methods=['PUT'], **kwargs)
+
+    def patch(self, path, **kwargs):
+        return self.route(path, methods=['PATCH'], **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.route(path, methods=['DELETE'], **kwargs)
+
+    def route(self, path, **kwargs):
+        """
+        The decorator function used to associate a given route path to a handler.
+
+        @route('/events/{event_id}')
+        def get_event(event_id: str):
+            pass
+
+        :param path: The endpoint associated with a given view.
+        """
+
+        def _register_view(view_func):
+            self.add_route(path, view_func, **kwargs)
+            return view_func
+
+        return _register_view
 
 
 class Router:
@@ -74,11 +498,24 @@ class Router:
     A router holds the collection of routes for the web application. Each route
     has a path and an associated handler. The router knows how to find a route
     for a given request.
+
+    If a cache size is given, the paths resolved by the router are memoized in a
+    bounded LRU cache.
     """
 
-    def __init__(self):
-        self._routes = defaultdict(list)
-        self._compiled_route_paths = list()
+    def __init__(self, cache_size=None):
+        # The routes of a resource are indexed by http method, {'/books': {'GET': route}}.
+        # The routes defined without methods are stored in the ANY_METHOD slot.
+        self._routes = {}
+        self._allowed_methods = {}
+        self._route_trie = RouteTrie()
+        self._route_cache = RouteCache(cache_size) if cache_size else None
+
+        # The API Gateway knows '/items/{item_id:int}' as '/items/{item_id}'. The
+        # aliases map these resources back to the route template along with the
+        # converters that apply to the path parameters sent by the gateway.
+        self._resource_aliases = {}
+        self._param_converters = {}
 
     def add_route(self, route_path, endpoint, **kwargs):
         """
@@ -89,13 +526,89 @@ class Router:
         :param route_path: The identifier of the route to be added. For instance '/books/{year}'.
         :param endpoint: The function or handler associated with the route.
         """
-        route_re = compile_path(route_path)
-        self._routes[route_path].append(SimpleRoute(route_path, endpoint, **kwargs))
+        route = SimpleRoute(route_path, endpoint, **kwargs)
+        routes_by_method = self._routes.setdefault(route_path, {})
+
+        methods = route.methods or [ANY_METHOD]
+
+        for method in methods:
+            if method in routes_by_method:
+                raise ConfigurationError(
+                    f'Found multiple views for the "{method}" method of "{route_path}".'
+                )
+
+        # A view defined without methods handles every method of the resource, it
+        # overlaps any view defined for a method.
+        if routes_by_method and (ANY_METHOD in methods or ANY_METHOD in routes_by_method):
+            raise ConfigurationError(
+                f'Found a view without methods and a view with methods for "{route_path}".'
+            )
+
+        routes_by_method.update((method, route) for method in methods)
+
+        self._allowed_methods[route_path] = ', '.join(
+            sorted(method for method in routes_by_method if method != ANY_METHOD)
+        )
+        self._index_converters(route_path)
+
+        # Index the route template to easily lookup the routes for a given request.
+        # For instance a request with '/books/2019' => '/books/{year}'. With the
+        # generic resource the router can lookup the routes.
+        self._route_trie.insert(route_path)
+
+        # A new route can change how a path resolves, the cached paths are stale.
+        if self._route_cache is not None:
+            self._route_cache.clear()
 
-        # Cache the route regular expression to easily lookup the routes for a given
-        # request. For instance a request with '/books/2019' => '/books/{year}'. With
-        # the generic resource the router can lookup the routes.
-        self._compiled_route_paths.append((route_re, route_path))
+    def _index_converters(self, route_path):
+        gateway_resource = strip_converters(route_path)
+        if gateway_resource == route_path:
+            return
+
+        self._resource_aliases.setdefault(gateway_resource, route_path)
+        converters = []
+        for match in PARAM_RE.finditer(route_path):
+            if match.group(2):
+                param_name, converter = param_definition(match)
+                converters.append((param_name, re.compile(f'^(?:{converter.regex})$'), converter))
+
+        self._param_converters[route_path] = tuple(converters)
+
+    def has_resource(self, resource):
+        """
+        Determine if the router has a route for the given route template.
+
+        :param resource: A route template, for instance '/books/{year}'.
+        """
+        return resource in self._routes
+
+    def resolve_resource(self, resource, uri_params):
+        """
+        Map a resource and its path parameters, as defined by the API Gateway,
+        to the route template and the converted parameters. If a parameter does
+        not match its converter, (None, {}) is returned.
+
+        :param resource: The resource of the request. For instance '/items/{item_id}'.
+        :param uri_params: The path parameters of the request.
+        """
+        resource = self._resource_aliases.get(resource, resource)
+        converters = self._param_converters.get(resource)
+
+        if not converters:
+            return (resource, uri_params)
+
+        uri_params = dict(uri_params)
+
+        try:
+            for param_name, param_re, converter in converters:
+                value = str(uri_params[param_name])
+                if not param_re.match(value):
+                    return (None, {})
+                uri_params[param_name] = converter.convert(value)
+        except (KeyError, ValueError):
+            return (None, {})
+
+        return (resource, uri_params)
 
     def resolve_path(self, path):
         """
@@ -104,20 +617,31 @@ class Router:
 
         :param path: The path associated with a request.
         """
+        if self._route_cache is None:
+            return self._route_trie.lookup(path)
+
+        resolved_path = self._route_cache.get(path)
+
+        if resolved_path is None:
+            resolved_path = self._route_trie.lookup(path)
+            self._route_cache.put(path, resolved_path)
 
-        for path_re, resource in self._compiled_route_paths:
-            match = path_re.match(path)
-            if match:
-                return (resource, dict(match.groupdict()))
+        return resolved_path
 
-        return (None, {})
+    def cache_info(self):
+        """
+        Get the hits, misses and evictions of the route cache. If the router
+        was created without a cache, None is returned.
+        """
+        return self._route_cache.info() if self._route_cache is not None else None
 
     def find_route(self, request):
         """
         Given the paramters of the request, lookup the associated view. The lookup
         process follows a this steps:
         1. Lookup get the routes for a given resource
-        2. Find the unique route for the method's http request.
+        2. Find the route for the method's http request, or the route defined
+           for any method.
 
         If the view is not found an exception is raised with the appropriate
         status code and error message.
@@ -133,18 +657,13 @@ class Router:
                 status_code=codes.not_found
             )
 
-        target_route = [route for route in routes if not route.methods or (request.method in route.methods)]
+        route = routes.get(request.method) or routes.get(ANY_METHOD)
 
-        if not target_route:
+        if route is None:
             raise MinikViewError(
                 'Method is not allowed.',
-                status_code=codes.method_not_allowed
-            )
-
-        if len(target_route) > 1:
-            raise MinikViewError(
-                f'Found multiple views for the "{request.method}" method.',
-                status_code=codes.not_allowed
+                status_code=codes.method_not_allowed,
+                headers={'Allow': self._allowed_methods[request.resource]}
             )
 
-        return target_route[0]
+        return route
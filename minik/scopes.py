@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+    scopes.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+from minik.builders import strip_stage
+from minik.router import Router, RouteRegistrar
+
+
+class RouteScope(RouteRegistrar):
+    """
+    A set of routes that only apply to the requests sent to a given host, API
+    Gateway stage and/or path prefix. Every scope has its own router, the routes
+    of the scope are defined relative to the prefix of the scope. The middleware
+    of a scope runs after the middleware of the app, only for the requests of the
+    scope.
+    """
+
+    def __init__(self, host=None, stage=None, prefix='', route_cache_size=None):
+        self.host = host
+        self.stage = stage
+        self.prefix = prefix
+        self.router = Router(cache_size=route_cache_size)
+        self.middleware = []
+
+    def add_middleware(self, middleware_instance):
+        self.middleware.append(middleware_instance)
+
+    def add_route(self, path, view_func, **kwargs):
+        self.router.add_route(self.prefix + path, view_func, **kwargs)
+
+
+class ScopeDispatcher:
+    """
+    Select the scope of a raw event. The scopes are indexed by (host, stage) and
+    by path prefix, which means that the cost of selecting a scope depends on the
+    depth of the path and not on the number of scopes defined.
+    """
+
+    def __init__(self, route_cache_size=None):
+        self._route_cache_size = route_cache_size
+
+        # {(host, stage): {prefix: scope}}
+        self._scopes = {}
+        self._prefix_depths = []
+
+    def get_or_create(self, host=None, stage=None, prefix=''):
+        """
+        Get the scope for the given host, stage and prefix. The scope is created
+        the first time it is requested.
+
+        :param host: The value of the Host header of the requests in the scope.
+        :param stage: The API Gateway stage of the requests in the scope.
+        :param prefix: The path prefix of the routes in the scope.
+        """
+        host = host.lower() if host else None
+        prefix = prefix.rstrip('/')
+        scopes_by_prefix = self._scopes.setdefault((host, stage), {})
+
+        if prefix not in scopes_by_prefix:
+            scopes_by_prefix[prefix] = RouteScope(host, stage, prefix, self._route_cache_size)
+
+            depth = prefix.count('/')
+            if depth not in self._prefix_depths:
+                self._prefix_depths = sorted(self._prefix_depths + [depth], reverse=True)
+
+        return scopes_by_prefix[prefix]
+
+    def __iter__(self):
+        """
+        Iterate over every scope, in the order the scopes were created.
+        """
+        for scopes_by_prefix in self._scopes.values():
+            yield from scopes_by_prefix.values()
+
+    def select(self, event):
+        """
+        Get the scope of the given event, None if the event does not belong to
+        any scope. The most specific (host, stage) pair takes precedence, then the
+        longest matching prefix.
+
+        :param event: The raw event received by the lambda function.
+        """
+        if not self._scopes:
+            return None
+
+        host = _event_host(event)
+        stage = (event.get('requestContext') or {}).get('stage')
+        path = event.get('path')
+
+        # The raw path of an HTTP API event starts with the name of the stage.
+        if path is None and 'rawPath' in event:
+            path = strip_stage(event['rawPath'], stage)
+
+        segments = (path or '').split('/')
+
+        for key in ((host, stage), (host, None), (None, stage), (None, None)):
+            scopes_by_prefix = self._scopes.get(key)
+            if not scopes_by_prefix:
+                continue
+
+            for depth in self._prefix_depths:
+                scope = scopes_by_prefix.get('/'.join(segments[:depth + 1]))
+                if scope is not None:
+                    return scope
+
+        return None
+
+
+def _event_host(event):
+    headers = event.get('headers') or {}
+    host = headers.get('Host') or headers.get('host')
+
+    if host is None and event.get('multiValueHeaders'):
+        multi_value_host = event['multiValueHeaders'].get('Host') or event['multiValueHeaders'].get('host')
+        host = multi_value_host[-1] if multi_value_host else None
+    return host.split(':')[0].lower() if host else None
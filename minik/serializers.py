@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+    serializers.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import datetime
+import decimal
+import json
+import uuid
+from abc import ABC, abstractmethod
+
+try:
+    import dataclasses
+except ImportError:  # pragma: no cover
+    dataclasses = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+def json_default(value):
+    """
+    Serialize the values the json encoders do not support natively. Dates are
+    sent in the ISO 8601 format and decimals as strings to keep their precision.
+
+    :param value: The value the json encoder could not serialize.
+    """
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+
+    if dataclasses is not None and dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+class JSONCodec(ABC):
+    """
+    The interface used by minik to parse the json body of a request and to
+    serialize the body of a json response. A custom codec can be given to the
+    app with Minik(json_codec=...).
+    """
+    name = None
+
+    @abstractmethod
+    def loads(self, data):
+        """
+        :param data: A str, bytes or bytearray with the json document.
+        """
+        pass
+
+    @abstractmethod
+    def dumps(self, value):
+        """
+        Serialize the value to a compact json string.
+
+        :param value: The body of the response.
+        """
+        pass
+
+
+class StdlibJSONCodec(JSONCodec):
+    name = 'json'
+
+    def __init__(self):
+        self._encoder = json.JSONEncoder(separators=(',', ':'), default=json_default)
+
+    def loads(self, data):
+        return json.loads(data)
+
+    def dumps(self, value):
+        return self._encoder.encode(value)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    orjson serializes datetimes, UUIDs and dataclasses natively, only decimals
+    go through the default function.
+    """
+    name = 'orjson'
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+    def dumps(self, value):
+        return orjson.dumps(value, default=json_default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+
+class UjsonCodec(JSONCodec):
+    name = 'ujson'
+
+    def loads(self, data):
+        return ujson.loads(data)
+
+    def dumps(self, value):
+        return ujson.dumps(value, default=json_default, escape_forward_slashes=False, ensure_ascii=False)
+
+
+def default_json_codec():
+    """
+    Get the fastest json codec available, orjson or ujson if installed, the
+    json module of the standard library otherwise.
+    """
+    if orjson is not None:
+        return OrjsonCodec()
+
+    if ujson is not None:
+        return UjsonCodec()
+
+    return StdlibJSONCodec()
+
+
+DEFAULT_JSON_CODEC = default_json_codec()
@@ -14,6 +14,8 @@
     limitations under the License.
 """
 
+from collections.abc import Mapping, MutableMapping
+
 
 class LookupDict(dict):
     """Dictionary lookup object."""
@@ -32,3 +34,250 @@ class LookupDict(dict):
 
     def get(self, key, default=None):
         return self.__dict__.get(key, default)
+
+
+class MultiDict(dict):
+    """
+    Dictionary of the last value of every key, the full list of values of a key
+    is available through getlist. Used for query parameters and headers that can
+    be sent multiple times, '?id=1&id=2'.
+    """
+
+    def __init__(self, lists=None):
+        lists = lists or {}
+        super(MultiDict, self).__init__((key, values[-1]) for key, values in lists.items() if values)
+        self._lists = lists
+
+    def getlist(self, key):
+        return list(self._lists.get(key) or [])
+
+    def lists(self):
+        return self._lists.items()
+
+
+class HeadersView(Mapping):
+    """
+    Case insensitive, read only view of the raw headers of an event. The raw
+    headers are not copied, a header is looked up by its exact name, then by its
+    canonical form, 'content-type' => 'Content-Type', and lastly by scanning the
+    raw names. The lower case index of the headers is only built if the view is
+    iterated, which yields lower case names.
+    """
+    __slots__ = ['_raw', '_lower']
+
+    def __init__(self, raw_headers=None):
+        self._raw = raw_headers or {}
+        self._lower = None
+
+    def _index(self):
+        if self._lower is None:
+            self._lower = {key.lower(): value for key, value in self._raw.items()}
+        return self._lower
+
+    def __getitem__(self, key):
+        raw = self._raw
+
+        if key in raw:
+            return raw[key]
+
+        title_key = key.title()
+        if title_key in raw:
+            return raw[title_key]
+
+        lower_key = key.lower()
+
+        if self._lower is not None:
+            return self._lower[lower_key]
+
+        # Scan the raw headers instead of building the index for a single lookup.
+        for raw_key, value in raw.items():
+            if raw_key.lower() == lower_key:
+                return value
+
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        return iter(self._index())
+
+    def __len__(self):
+        return len(self._index())
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._raw!r})'
+
+
+class CloudFrontHeadersView(Mapping):
+    """
+    Case insensitive, read only view of the headers of a CloudFront event. The
+    names of the raw headers are lower case and every header is a list of
+    {'key': 'Host', 'value': 'example.com'} entries, the last entry is used.
+    """
+    __slots__ = ['_raw']
+
+    def __init__(self, raw_headers=None):
+        self._raw = raw_headers or {}
+
+    def __getitem__(self, key):
+        entries = self._raw.get(key) or self._raw.get(key.lower())
+        if not entries:
+            raise KeyError(key)
+        return entries[-1]['value']
+
+    def getlist(self, key):
+        return [entry['value'] for entry in self._raw.get(key.lower()) or []]
+
+    def __iter__(self):
+        return iter(self._raw)
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._raw!r})'
+
+
+class MutableHeaders(MutableMapping):
+    """
+    Case insensitive dictionary of the headers of a response. Every header is
+    stored under its lower case name along with the name it was given, which is
+    the name used when the response is sent. A header can have multiple values,
+    the additional values are added with add and assigning a header replaces all
+    its values.
+
+    headers = MutableHeaders({'Content-Type': 'application/json'})
+    headers['content-type'] => 'application/json'
+    list(headers) => ['Content-Type']
+    """
+    __slots__ = ['_store', '_extra_values', 'has_multiple_values']
+
+    def __init__(self, headers=None):
+        # {'content-type': ('Content-Type', 'application/json')}
+        self._store = {}
+        # The values added to a header after its first value, by lower case name.
+        self._extra_values = None
+        # An attribute rather than a property, it is read for every response.
+        self.has_multiple_values = False
+        if headers:
+            self.update(headers)
+
+    def __getitem__(self, key):
+        return self._store[key.lower()][1]
+
+    def __setitem__(self, key, value):
+        lower_key = key.lower()
+        self._store[lower_key] = (key, value)
+        if self._extra_values:
+            self._pop_extra_values(lower_key)
+
+    def __delitem__(self, key):
+        lower_key = key.lower()
+        del self._store[lower_key]
+        if self._extra_values:
+            self._pop_extra_values(lower_key)
+
+    def _pop_extra_values(self, lower_key):
+        self._extra_values.pop(lower_key, None)
+        if not self._extra_values:
+            self._extra_values = None
+            self.has_multiple_values = False
+
+    def __contains__(self, key):
+        return key.lower() in self._store
+
+    def __iter__(self):
+        return (key for key, _ in self._store.values())
+
+    def __len__(self):
+        return len(self._store)
+
+    def update(self, headers=(), **kwargs):
+        """
+        Merge the given headers, the assigned headers replace their existing values.
+        """
+        items = headers.items() if hasattr(headers, 'items') else headers
+
+        if self._extra_values:
+            for key, value in items:
+                self[key] = value
+        else:
+            # The loop of __setitem__ inlined, the middleware merge their headers
+            # on every request.
+            store = self._store
+            for key, value in items:
+                store[key.lower()] = (key, value)
+
+        if kwargs:
+            self.update(kwargs)
+
+    def get(self, key, default=None):
+        item = self._store.get(key.lower())
+        return default if item is None else item[1]
+
+    def get_lower(self, lower_key, default=None):
+        """
+        Get a header by its lower case name, without normalizing the name.
+        """
+        item = self._store.get(lower_key)
+        return default if item is None else item[1]
+
+    def add(self, key, value):
+        """
+        Add a value to a header without replacing its existing values.
+        """
+        lower_key = key.lower()
+        if lower_key not in self._store:
+            self._store[lower_key] = (key, value)
+            return
+
+        if self._extra_values is None:
+            self._extra_values = {}
+            self.has_multiple_values = True
+        self._extra_values.setdefault(lower_key, []).append(value)
+
+    def getlist(self, key):
+        lower_key = key.lower()
+        item = self._store.get(lower_key)
+        if item is None:
+            return []
+        return [item[1]] + (self._extra_values or {}).get(lower_key, [])
+
+    def to_dict(self):
+        """
+        The first value of every header, by the name the header was given.
+        """
+        return dict(self._store.values())
+
+    def lists(self):
+        """
+        All the values of every header, by the name the header was given.
+        """
+        extra_values = self._extra_values or {}
+        return {
+            key: [value] + extra_values.get(lower_key, [])
+            for lower_key, (key, value) in self._store.items()
+        }
+
+    def copy(self):
+        # The app copies its default headers for every response, __init__ is skipped.
+        headers = MutableHeaders.__new__(MutableHeaders)
+        headers._store = self._store.copy()
+        headers._extra_values = (
+            {key: list(values) for key, values in self._extra_values.items()} if self._extra_values else None
+        )
+        headers.has_multiple_values = self.has_multiple_values
+        return headers
+
+    def __eq__(self, other):
+        if isinstance(other, Mapping):
+            return {key.lower(): value for key, value in self.items()} == {key.lower(): value for key, value in other.items()}
+        return NotImplemented
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.to_dict()!r})'
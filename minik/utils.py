@@ -15,7 +15,58 @@
 """
 
 
+import importlib
 import json
+import re
+import urllib.parse
+
+from minik.exceptions import ConfigurationError
+
+
+IMPORT_PATH_RE = re.compile(r'^[a-zA-Z_][\w.]*[:.][a-zA-Z_]\w*$')
+
+
+def url_decode(key_or_value: str):
+    """
+    Use unquote_plus first to convert + into spaces. Then use unquote to decode any other encodings.
+    """
+    return urllib.parse.unquote(urllib.parse.unquote_plus(key_or_value))
+
+
+def parse_query_string(raw_query_string: str):
+    """
+    Decode a raw query string into the list of its (key, value) pairs, in order.
+    'id=1&id=2&q=a+b' => [('id', '1'), ('id', '2'), ('q', 'a b')]
+    """
+    return urllib.parse.parse_qsl(raw_query_string, keep_blank_values=True)
+
+
+def validate_import_path(import_path: str):
+    """
+    Make sure that the given import path has the 'module:attribute' or the
+    'module.attribute' form. The module itself is not imported.
+
+    :param import_path: The location of an object, for instance 'myapp.reports:get_report'.
+    """
+    if not IMPORT_PATH_RE.match(import_path):
+        raise ConfigurationError(f'Invalid import path "{import_path}".')
+
+    return import_path
+
+
+def import_string(import_path: str):
+    """
+    Import the object located by the given import path.
+
+    :param import_path: The location of an object, for instance 'myapp.reports:get_report'.
+    """
+    module_name, _, attribute = import_path.rpartition(':' if ':' in import_path else '.')
+    module = importlib.import_module(module_name)
+
+    try:
+        return getattr(module, attribute)
+    except AttributeError:
+        raise ImportError(f'Module "{module_name}" does not define "{attribute}".')
 
 
 def create_api_event(resource_path: str, method='POST', **kwargs):
@@ -70,3 +121,110 @@ def create_alb_event(path: str, method='POST', **kwargs):
         "body": json.dumps(kwargs.get('body', {})).encode(),
         "isBase64Encoded": kwargs.get('isBase64Encoded', {})
     }
+
+
+def create_http_api_event(path: str, method='POST', **kwargs):
+    """
+    Create a basic version of the raw event (payload format version 2.0) a lambda
+    function will receive when invoked by an API Gateway HTTP API or a function URL.
+    The full definition of the event is documented:
+    https://docs.aws.amazon.com/apigateway/latest/developerguide/http-api-develop-integrations-lambda.html
+
+    :param path: The path of the request. I.e. /events/2019/05.
+    :param method: The http method of the event
+    """
+
+    return {
+        'version': '2.0',
+        'routeKey': kwargs.get('routeKey', '$default'),
+        'rawPath': path,
+        'rawQueryString': kwargs.get('rawQueryString', ''),
+        'cookies': kwargs.get('cookies', []),
+        'headers': kwargs.get('headers', {'content-type': 'application/json'}),
+        'requestContext': {
+            'apiId': 'ax2hor23',
+            'http': {
+                'method': method,
+                'path': path,
+            },
+            'stage': kwargs.get('stage', '$default'),
+        },
+        'body': json.dumps(kwargs.get('body', {})),
+        'isBase64Encoded': False,
+    }
+
+
+def create_cloudfront_event(uri: str, method='GET', **kwargs):
+    """
+    Create a basic version of the raw CloudFront viewer request event a Lambda@Edge
+    function will receive when invoked. The full definition of the event is documented:
+    https://docs.aws.amazon.com/AmazonCloudFront/latest/DeveloperGuide/lambda-event-structure.html
+
+    :param uri: The path of the request. I.e. /events/2019/05.
+    :param method: The http method of the event
+    """
+
+    headers = kwargs.get('headers', {'Host': 'd111111abcdef8.cloudfront.net'})
+    cf_request = {
+        'clientIp': '203.0.113.178',
+        'headers': {
+            name.lower(): [{'key': name, 'value': value}]
+            for name, value in headers.items()
+        },
+        'method': method,
+        'querystring': kwargs.get('querystring', ''),
+        'uri': uri,
+    }
+
+    if 'body' in kwargs:
+        cf_request['body'] = {
+            'inputTruncated': False,
+            'action': 'read-only',
+            'encoding': 'text',
+            'data': json.dumps(kwargs['body']),
+        }
+
+    return {
+        'Records': [{
+            'cf': {
+                'config': {
+                    'distributionDomainName': 'd111111abcdef8.cloudfront.net',
+                    'distributionId': 'EDFDVBD6EXAMPLE',
+                    'eventType': kwargs.get('eventType', 'viewer-request'),
+                    'requestId': '4TyzHTaYWb1GX1qTfsHhEqV6HUDd_BzoBZnwfnvQc_1oF26ClkoUSEQ==',
+                },
+                'request': cf_request,
+            }
+        }]
+    }
+
+
+def create_websocket_event(route_key: str, event_type='MESSAGE', **kwargs):
+    """
+    Create a basic version of the raw event a lambda function will receive when
+    invoked by an API Gateway WebSocket API. The full definition of the event is documented:
+    https://docs.aws.amazon.com/apigateway/latest/developerguide/apigateway-websocket-api-integration-requests.html
+
+    :param route_key: The route key of the message. I.e. $connect, $default, sendmessage.
+    :param event_type: The type of the event, CONNECT, MESSAGE or DISCONNECT.
+    """
+
+    event = {
+        'requestContext': {
+            'routeKey': route_key,
+            'eventType': event_type,
+            'connectionId': kwargs.get('connectionId', 'L0SM9cOFvHcCIhw='),
+            'domainName': 'ax2hor23.execute-api.us-east-1.amazonaws.com',
+            'stage': kwargs.get('stage', 'production'),
+            'apiId': 'ax2hor23',
+        },
+        'isBase64Encoded': False,
+    }
+
+    if event_type == 'CONNECT':
+        event['headers'] = kwargs.get('headers', {'Host': 'ax2hor23.execute-api.us-east-1.amazonaws.com'})
+        event['queryStringParameters'] = kwargs.get('queryParameters')
+    elif event_type == 'MESSAGE':
+        event['body'] = json.dumps(kwargs.get('body', {}))
+
+    return event
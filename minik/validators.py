@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+"""
+    validators.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import inspect
+import typing
+
+from minik.exceptions import ValidationError
+
+try:
+    import dataclasses
+except ImportError:  # pragma: no cover
+    dataclasses = None
+
+
+class _Missing:
+    def __repr__(self):
+        return '<missing>'
+
+
+MISSING = _Missing()
+INVALID = object()
+
+
+def is_dataclass_type(field_type):
+    return dataclasses is not None and inspect.isclass(field_type) and dataclasses.is_dataclass(field_type)
+
+
+def is_typeddict_type(field_type):
+    return inspect.isclass(field_type) and issubclass(field_type, dict) and hasattr(field_type, '__total__')
+
+
+def is_body_type(field_type):
+    """
+    Determine if the annotation of a view parameter describes the json body of the
+    request, which is the case for dataclasses and TypedDicts.
+
+    :param field_type: The annotation of a view parameter.
+    """
+    return is_dataclass_type(field_type) or is_typeddict_type(field_type)
+
+
+def join_path(path, key):
+    if isinstance(key, int):
+        return f'{path}[{key}]'
+    return f'{path}.{key}' if path else key
+
+
+class ValidatorBuilder:
+    """
+    Generate the source code of a validator specialized for a dataclass or a
+    TypedDict. Every structured type (dataclass, TypedDict, list) gets its own
+    function, the checks of the primitive types are inlined. The generated
+    functions take (value, path, errors) and return the validated value, or
+    INVALID after adding the (path, message) of the failures to errors.
+    """
+
+    def __init__(self):
+        self._namespace = {
+            'MISSING': MISSING, 'INVALID': INVALID, 'join_path': join_path,
+        }
+        self._sources = []
+        self._function_names = {}
+
+    def build(self, body_type):
+        function_name = self.function_for(body_type)
+        exec('\n\n'.join(self._sources), self._namespace)
+        return self._namespace[function_name]
+
+    def _global(self, value):
+        name = f'_g{len(self._namespace)}'
+        self._namespace[name] = value
+        return name
+
+    def function_for(self, field_type):
+        if field_type in self._function_names:
+            return self._function_names[field_type]
+
+        function_name = f'_validate_{len(self._function_names)}'
+        self._function_names[field_type] = function_name
+
+        if is_dataclass_type(field_type) or is_typeddict_type(field_type):
+            lines = self._object_lines(field_type)
+        else:
+            lines = self._list_lines(field_type)
+
+        self._sources.append(
+            f'def {function_name}(value, path, errors):\n' + '\n'.join('    ' + line for line in lines)
+        )
+        return function_name
+
+    def _object_lines(self, object_type):
+        type_hints = typing.get_type_hints(object_type)
+
+        if is_dataclass_type(object_type):
+            fields = [
+                (field.name, field.default is dataclasses.MISSING and field.default_factory is dataclasses.MISSING)
+                for field in dataclasses.fields(object_type) if field.init
+            ]
+            result = f'{self._global(object_type)}(**result)'
+        else:
+            required_keys = getattr(object_type, '__required_keys__', None)
+            if required_keys is None:
+                required_keys = type_hints if object_type.__total__ else ()
+            fields = [(name, name in required_keys) for name in type_hints]
+            result = 'result'
+
+        lines = [
+            'if not isinstance(value, dict):',
+            '    errors.append((path, "expected an object"))',
+            '    return INVALID',
+            'result = {}',
+            'error_count = len(errors)',
+        ]
+
+        for name, required in fields:
+            lines.append(f'item = value.get({name!r}, MISSING)')
+            lines.append('if item is MISSING:')
+            if required:
+                lines.append(f'    errors.append((join_path(path, {name!r}), "field required"))')
+            else:
+                lines.append('    pass')
+            lines.append('else:')
+            lines.extend('    ' + line for line in self._check_lines(type_hints[name], f'join_path(path, {name!r})'))
+            lines.append(f'    result[{name!r}] = item')
+
+        lines.append('if len(errors) > error_count:')
+        lines.append('    return INVALID')
+        lines.append(f'return {result}')
+        return lines
+
+    def _list_lines(self, list_type):
+        args = getattr(list_type, '__args__', None) or ()
+        lines = [
+            'if not isinstance(value, list):',
+            '    errors.append((path, "expected a list"))',
+            '    return INVALID',
+        ]
+
+        if not args or args[0] is typing.Any:
+            return lines + ['return value']
+
+        lines.append('result = []')
+        lines.append('for idx, item in enumerate(value):')
+        lines.extend('    ' + line for line in self._check_lines(args[0], 'join_path(path, idx)'))
+        lines.append('    result.append(item)')
+        lines.append('return result')
+        return lines
+
+    def _check_lines(self, field_type, path_expr):
+        """
+        The lines that validate the variable `item` against the given type. The
+        path expression is only evaluated when a check fails or when the value is
+        given to the function of a structured type.
+        """
+        origin = getattr(field_type, '__origin__', None)
+        args = getattr(field_type, '__args__', None) or ()
+
+        if origin is typing.Union:
+            non_null_args = [arg for arg in args if arg is not type(None)]  # noqa: E721
+            inner_lines = self._check_lines(non_null_args[0], path_expr) if len(non_null_args) == 1 else []
+            if not inner_lines:
+                return []
+            return ['if item is not None:'] + ['    ' + line for line in inner_lines]
+
+        if field_type is str:
+            return [
+                'if type(item) is not str:',
+                f'    errors.append(({path_expr}, "expected a string"))',
+            ]
+
+        if field_type is bool:
+            return [
+                'if type(item) is not bool:',
+                f'    errors.append(({path_expr}, "expected a boolean"))',
+            ]
+
+        if field_type is int:
+            return [
+                'if type(item) is not int:',
+                f'    errors.append(({path_expr}, "expected an integer"))',
+            ]
+
+        if field_type is float:
+            return [
+                'if type(item) is int:',
+                '    item = float(item)',
+                'elif type(item) is not float:',
+                f'    errors.append(({path_expr}, "expected a number"))',
+            ]
+
+        if field_type is dict or origin in (dict, typing.Dict):
+            return [
+                'if not isinstance(item, dict):',
+                f'    errors.append(({path_expr}, "expected an object"))',
+            ]
+
+        if field_type is list or origin in (list, typing.List) or is_body_type(field_type):
+            return [f'item = {self.function_for(field_type)}(item, {path_expr}, errors)']
+
+        if inspect.isclass(field_type) and field_type is not typing.Any:
+            return [
+                f'if not isinstance(item, {self._global(field_type)}):',
+                f'    errors.append(({path_expr}, "expected {field_type.__name__}"))',
+            ]
+
+        return []
+
+
+def compile_body_validator(body_type):
+    """
+    Build the validator of a json body described by a dataclass or a TypedDict.
+    The validator is generated once, when the route is defined, and it returns
+    an instance of the dataclass, or a dict for a TypedDict. If the body is not
+    valid, a ValidationError is raised with the path of every invalid field.
+
+    @dataclass
+    class CreateEvent:
+        name: str
+        tags: List[str]
+
+    validate = compile_body_validator(CreateEvent)
+    validate({'name': 'Gran Fondo', 'tags': ['road']}) => CreateEvent(name='Gran Fondo', tags=['road'])
+
+    :param body_type: The dataclass or TypedDict of the body.
+    """
+
+    validate_value = ValidatorBuilder().build(body_type)
+
+    def validate(body):
+        errors = []
+        value = validate_value(body, '', errors)
+
+        if errors:
+            raise ValidationError(
+                'Invalid request body. ' + '; '.join(f'{path or "body"}: {message}' for path, message in errors),
+                errors=[{'field': path, 'message': message} for path, message in errors]
+            )
+
+        return value
+
+    validate.body_type = body_type
+    return validate
+
+
+def validate_json_body(validator, request):
+    """
+    Parse the json body of the request and validate it with the given validator.
+
+    :param validator: The validator built by compile_body_validator.
+    :param request: The instance of the minik request.
+    """
+    if not request.body:
+        raise ValidationError('Invalid request body. The request does not have a body.')
+
+    try:
+        body = request.json_body
+    except (ValueError, TypeError):
+        # The codecs do not agree on the error of an invalid document.
+        raise ValidationError('Invalid request body. The body is not valid json.')
+
+    return validator(body)
+
+
+def compile_body_plan(view_fn, path_params):
+    """
+    Get the (field_name, validator) pair of the view parameter that describes the
+    json body of the request, None if the view does not have such a parameter.
+
+    :param view_fn: The function that will be executed for a given endpoint.
+    :param path_params: The names of the parameters defined in the route path.
+    """
+
+    for field_name, field_type in view_fn.__annotations__.items():
+        if field_name != 'return' and field_name not in path_params and is_body_type(field_type):
+            return (field_name, compile_body_validator(field_type))
+
+    return None
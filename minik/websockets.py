@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+    websockets.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from minik.exceptions import MinikViewError, ConfigurationError
+from minik.router import SimpleRoute
+from minik.serializers import DEFAULT_JSON_CODEC
+from minik.status_codes import codes
+
+try:
+    import boto3
+    from botocore.config import Config
+except ImportError:
+    boto3 = None
+
+
+DEFAULT_ROUTE_KEY = '$default'
+
+
+class WebSocketRouter:
+    """
+    The routes of a WebSocket API are indexed by route key, '$connect',
+    '$disconnect', '$default' or a custom key selected by the API. A message
+    with a route key that was not registered is sent to the '$default' route,
+    like API Gateway does. The connect and disconnect events are not messages,
+    they are only sent to their own route.
+    """
+
+    def __init__(self):
+        self._routes = {}
+
+    def add_route(self, route_key, endpoint, **kwargs):
+        """
+        Associate a route key to a view.
+
+        :param route_key: The route key of the WebSocket API, for instance '$connect'.
+        :param endpoint: The view function, or its import path.
+        """
+        if route_key in self._routes:
+            raise ConfigurationError(f'A view is already defined for the "{route_key}" route key.')
+
+        self._routes[route_key] = SimpleRoute(route_key, endpoint, **kwargs)
+
+    def find_route(self, request):
+        """
+        Lookup the view of the route key of the request.
+
+        :param request: An instance of the MinikRequest.
+        """
+        route = self._routes.get(request.resource)
+
+        # The method of a WebSocket request is its event type.
+        if route is None and request.method == 'MESSAGE':
+            route = self._routes.get(DEFAULT_ROUTE_KEY)
+
+        if route is None:
+            raise MinikViewError(
+                f'No view is defined for the "{request.resource}" route key.',
+                status_code=codes.not_found
+            )
+
+        return route
+
+
+BroadcastResult = namedtuple('BroadcastResult', ['sent', 'gone', 'failed'])
+
+
+# The management api clients are reused by the invocations of a warm function.
+_CLIENTS = {}
+
+
+def management_client(endpoint_url, max_pool_connections=10):
+    """
+    Get the pooled client of the API Gateway management api of the given endpoint.
+
+    :param endpoint_url: The url of the stage of the WebSocket API, https://{domain}/{stage}.
+    :param max_pool_connections: The number of http connections kept by the client.
+    """
+    if boto3 is None:
+        raise ConfigurationError('boto3 is required to send messages to the WebSocket connections.')
+
+    key = (endpoint_url, max_pool_connections)
+    if key not in _CLIENTS:
+        _CLIENTS[key] = boto3.client(
+            'apigatewaymanagementapi',
+            endpoint_url=endpoint_url,
+            config=Config(max_pool_connections=max_pool_connections)
+        )
+
+    return _CLIENTS[key]
+
+
+def management_endpoint(request):
+    """
+    The url of the management api of the stage of the request.
+
+    :param request: The MinikRequest of a WebSocket event.
+    """
+    request_context = request.aws_event['requestContext']
+    return f"https://{request_context['domainName']}/{request_context['stage']}"
+
+
+def is_gone(error):
+    """
+    Determine if the error raised by post_to_connection means that the connection
+    is closed, in which case the connection id should be discarded.
+    """
+    response = getattr(error, 'response', None) or {}
+    return response.get('Error', {}).get('Code') == 'GoneException'
+
+
+class Broadcaster:
+    """
+    Send messages to the connections of a WebSocket API. The messages of a broadcast
+    are sent concurrently with a pool of threads sharing a single client, the
+    message is serialized once for all the connections.
+
+    broadcaster = Broadcaster.from_request(app.request)
+    result = broadcaster.broadcast(connection_ids, {'event': 'ride-updated'})
+    remove_connections(result.gone)
+
+    :param endpoint_url: The url of the stage of the WebSocket API, https://{domain}/{stage}.
+    :param client: The client of the management api, by default a pooled boto3 client.
+    :param max_workers: The number of messages sent concurrently.
+    :param json_codec: The codec used to serialize the messages that are not bytes or str.
+    """
+
+    def __init__(self, endpoint_url=None, client=None, max_workers=10, json_codec=None):
+        if client is None:
+            client = management_client(endpoint_url, max_pool_connections=max_workers)
+
+        self.client = client
+        self.max_workers = max_workers
+        self.json_codec = json_codec or DEFAULT_JSON_CODEC
+        self._executor = None
+
+    @classmethod
+    def from_request(cls, request, **kwargs):
+        """
+        Build the broadcaster of the WebSocket API of the given request.
+
+        :param request: The MinikRequest of a WebSocket event.
+        """
+        if 'client' not in kwargs:
+            kwargs['endpoint_url'] = management_endpoint(request)
+        return cls(**kwargs)
+
+    def _encode(self, data):
+        if isinstance(data, bytes):
+            return data
+        if isinstance(data, str):
+            return data.encode('utf-8')
+        return self.json_codec.dumps(data).encode('utf-8')
+
+    def send(self, connection_id, data):
+        """
+        Send a message to a single connection.
+
+        :param connection_id: The id of the connection.
+        :param data: The message, bytes, a string or a json serializable value.
+        """
+        self.client.post_to_connection(ConnectionId=connection_id, Data=self._encode(data))
+
+    def broadcast(self, connection_ids, data):
+        """
+        Send the same message to a set of connections. The failures do not stop the
+        broadcast, the result lists the connections that received the message, the
+        connections that are gone and the errors of the other failures.
+
+        :param connection_ids: The ids of the connections.
+        :param data: The message, bytes, a string or a json serializable value.
+        """
+        payload = self._encode(data)
+        connection_ids = list(connection_ids)
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        futures = [
+            self._executor.submit(self.client.post_to_connection, ConnectionId=connection_id, Data=payload)
+            for connection_id in connection_ids
+        ]
+
+        sent, gone, failed = [], [], {}
+        for connection_id, future in zip(connection_ids, futures):
+            error = future.exception()
+            if error is None:
+                sent.append(connection_id)
+            elif is_gone(error):
+                gone.append(connection_id)
+            else:
+                failed[connection_id] = error
+
+        return BroadcastResult(sent, gone, failed)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+    conftest.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import pytest
+
+from minik import serializers
+
+
+def installed_codecs():
+    codecs = [serializers.StdlibJSONCodec()]
+    if serializers.orjson is not None:
+        codecs.append(serializers.OrjsonCodec())
+    if serializers.ujson is not None:
+        codecs.append(serializers.UjsonCodec())
+    return codecs
+
+
+@pytest.fixture(params=installed_codecs(), ids=lambda codec: codec.name)
+def codec(request):
+    """
+    Every json codec installed, the stdlib codec is always installed.
+    """
+    return request.param
@@ -0,0 +1,12 @@
+"""
+Views used by test_lazy_routes.py. The module must only be imported when one of
+its routes is requested.
+"""
+
+
+def get_report(report_id: int):
+    return {'report_id': report_id}
+
+
+def list_reports():
+    return {'reports': []}
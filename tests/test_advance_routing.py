@@ -19,6 +19,7 @@ import pytest
 from unittest.mock import MagicMock
 
 from minik.core import Minik
+from minik.exceptions import ConfigurationError
 from minik.status_codes import codes
 from minik.utils import create_api_event
 
@@ -36,14 +37,9 @@ def post_event(zip_code):
     return {'message': 'post handler'}
 
 
-@sample_app.route("/event_list", methods=['GET'])
-def get_events_list1():
-    return {'message': 'duplicate 1'}
-
-
-@sample_app.route("/event_list", methods=['GET'])
-def get_events_list2():
-    return {'message': 'duplicate 2'}
+@sample_app.route("/event_list")
+def get_events_list():
+    return {'message': 'any method'}
 
 
 @pytest.mark.parametrize("http_method, expected_message", [
@@ -68,13 +64,59 @@ def test_route_defined_for_post_put(http_method, expected_message):
 def test_route_defined_for_duplicate_views():
     """
     This is an invalid definition in which the user of minik is trying to associate
-    two different views for the same (path, method) pair.
+    two different views for the same (path, method) pair. The definition fails
+    when the route is registered.
     """
 
-    event = create_api_event('/event_list',
-                                method='GET',
-                                body={'type': 'cycle'})
+    app = Minik()
+
+    @app.route("/event_list", methods=['GET'])
+    def get_events_list1():
+        return {'message': 'duplicate 1'}
+
+    with pytest.raises(ConfigurationError):
+        @app.route("/event_list", methods=['GET', 'POST'])
+        def get_events_list2():
+            return {'message': 'duplicate 2'}
+
+
+@pytest.mark.parametrize("http_method", ['GET', 'POST', 'DELETE'])
+def test_route_defined_for_any_method(http_method):
+    """
+    A view defined without methods handles every method of its path.
+    """
+
+    event = create_api_event('/event_list', method=http_method)
+
+    response = sample_app(event, context)
+
+    assert json.loads(response['body'])['message'] == 'any method'
+
+
+@pytest.mark.parametrize("first_methods, second_methods", [
+    (None, ['DELETE']),
+    (['DELETE'], None),
+])
+def test_route_defined_for_method_and_any_method(first_methods, second_methods):
+    """
+    A view defined without methods overlaps the views defined for a method of
+    the same path, the definition fails when the second route is registered.
+    """
+
+    app = Minik()
+    app.add_route('/event_list', lambda: {'message': 'first'}, methods=first_methods)
+
+    with pytest.raises(ConfigurationError):
+        app.add_route('/event_list', lambda: {'message': 'second'}, methods=second_methods)
+
+
+def test_method_not_allowed_includes_allow_header():
+
+    event = create_api_event('/events/{zip_code}',
+                                method='DELETE',
+                                pathParameters={'zip_code': 20902})
 
     response = sample_app(event, context)
 
-    assert response['statusCode'] == codes.not_allowed
+    assert response['statusCode'] == codes.method_not_allowed
+    assert response['headers']['Allow'] == 'GET, POST'
@@ -96,3 +96,22 @@ def test_decoding_of_query_params_with_spackes():
     json_response_body = json.loads(response['body'])
 
     assert json_response_body['type'] == "cycle event"
+
+
+def test_route_cache_for_alb_requests():
+    """
+    With a route cache, repeated ALB requests to the same path are resolved from
+    the cache.
+    """
+
+    cached_app = Minik(route_cache_size=16)
+
+    @cached_app.get("/books/{year}")
+    def get_books(year: int):
+        return {'year': year}
+
+    for _ in range(3):
+        response = cached_app(create_alb_event('/books/2019', method='GET'), context)
+        assert json.loads(response['body']) == {'year': 2019}
+
+    assert cached_app.route_cache_info().hits == 2
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+    test_binary_responses.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import base64
+import io
+from unittest.mock import MagicMock
+
+import pytest
+
+from minik.core import Minik
+from minik.models import BinaryTypes, encode_body
+from minik.utils import create_api_event, create_alb_event, create_http_api_event, create_cloudfront_event
+
+
+PNG = b'\x89PNG\r\n\x1a\n\x00\x00'
+context = MagicMock()
+
+
+sample_app = Minik(binary_types=['image/*', 'application/pdf'])
+
+
+@sample_app.get('/files/{name}')
+def get_file(name):
+    content_type, body = {
+        'logo': ('image/png', PNG),
+        'logo-buffer': ('image/png', bytearray(PNG)),
+        'logo-view': ('image/png', memoryview(PNG)[2:]),
+        'logo-file': ('image/png', io.BytesIO(PNG)),
+        'report': ('application/pdf; charset=binary', b'%PDF-1.4'),
+        'notes': ('text/plain', 'Città'.encode()),
+        'data': ('application/json', b'{"id": 1}'),
+        'blob': ('application/json', b'\x89PNG\xff\xfe'),
+    }[name]
+    sample_app.response.headers['Content-Type'] = content_type
+    return body
+
+
+@pytest.mark.parametrize('name,expected', [
+    ('logo', PNG),
+    ('logo-buffer', PNG),
+    ('logo-view', PNG[2:]),
+    ('logo-file', PNG),
+    ('report', b'%PDF-1.4'),
+])
+def test_binary_types(name, expected):
+    response = sample_app(create_api_event('/files/{name}', method='GET', pathParameters={'name': name}), context)
+
+    assert response['isBase64Encoded'] is True
+    assert base64.b64decode(response['body']) == expected
+
+
+@pytest.mark.parametrize('name,expected', [
+    ('notes', 'Città'),
+    ('data', '{"id": 1}'),
+])
+def test_bytes_of_other_types_are_sent_as_text(name, expected):
+    response = sample_app(create_api_event('/files/{name}', method='GET', pathParameters={'name': name}), context)
+
+    assert response['isBase64Encoded'] is False
+    assert response['body'] == expected
+
+
+@pytest.mark.parametrize('create_event', [create_api_event, create_http_api_event, create_cloudfront_event])
+def test_bytes_of_other_types_that_are_not_text(create_event):
+    if create_event is create_api_event:
+        event = create_api_event('/files/{name}', method='GET', pathParameters={'name': 'blob'})
+    else:
+        event = create_event('/files/blob', method='GET')
+    response = sample_app(event, context)
+
+    assert base64.b64decode(response['body']) == b'\x89PNG\xff\xfe'
+
+
+def test_all_bytes_are_binary_by_default():
+    app = Minik()
+
+    @app.get('/data')
+    def get_data():
+        app.response.headers['Content-Type'] = 'application/json'
+        return b'{"id": 1}'
+
+    response = app(create_api_event('/data', method='GET'), context)
+
+    assert response['isBase64Encoded'] is True
+    assert base64.b64decode(response['body']) == b'{"id": 1}'
+
+
+def test_json_responses_are_not_encoded():
+    app = Minik(binary_types=['*/*'])
+
+    @app.get('/events')
+    def events():
+        return {'data': []}
+
+    response = app(create_api_event('/events', method='GET'), context)
+
+    assert response['isBase64Encoded'] is False
+    assert response['body'] == '{"data":[]}'
+
+
+@pytest.mark.parametrize('event', [
+    create_alb_event('/files/logo', method='GET'),
+    create_http_api_event('/files/logo', method='GET'),
+])
+def test_binary_response_of_other_sources(event):
+    response = sample_app(event, context)
+
+    assert response['isBase64Encoded'] is True
+    assert base64.b64decode(response['body']) == PNG
+
+
+def test_binary_response_of_cloudfront():
+    response = sample_app(create_cloudfront_event('/files/notes'), context)
+
+    assert response['bodyEncoding'] == 'text'
+    assert response['body'] == 'Città'
+
+
+@pytest.mark.parametrize('binary_types,content_type,expected', [
+    (['image/*'], 'image/svg+xml', True),
+    (['image/*'], 'Image/PNG', True),
+    (['application/pdf'], 'application/pdf; charset=binary', True),
+    (['application/pdf'], 'application/json', False),
+    (['*/*'], None, True),
+    ([], 'image/png', False),
+    (['image/*'], None, False),
+])
+def test_binary_types_matches(binary_types, content_type, expected):
+    assert BinaryTypes(binary_types).matches(content_type) is expected
+
+
+def test_encode_body_of_text_file():
+    assert encode_body(io.StringIO('hello'), 'text/plain', ['*/*']) == ('hello', False)
+    assert encode_body({'id': 1}, 'image/png') == ({'id': 1}, False)
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+    test_blueprints.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import json
+from unittest.mock import MagicMock
+
+from minik.blueprints import Blueprint
+from minik.core import Minik
+from minik.status_codes import codes
+from minik.utils import create_api_event, create_alb_event
+
+
+context = MagicMock()
+
+
+class ReportsMiddleware:
+
+    def __call__(self, app, *args, **kwargs):
+        app.response.headers['x-reports'] = 'true'
+
+
+reports = Blueprint('reports')
+reports.add_middleware(ReportsMiddleware())
+
+
+@reports.get('/{report_id:int}')
+def get_report(report_id):
+    return {'report_id': report_id}
+
+
+@reports.post('')
+def post_report():
+    return {'action': 'created'}
+
+
+sample_app = Minik()
+sample_app.mount(reports, prefix='/reports')
+
+
+@sample_app.get('/health')
+def health():
+    return {'status': 'ok'}
+
+
+def test_blueprint_routes_alb():
+
+    response = sample_app(create_alb_event('/reports/12', method='GET'), context)
+
+    assert json.loads(response['body']) == {'report_id': 12}
+    assert response['headers']['x-reports'] == 'true'
+
+
+def test_blueprint_routes_api_gateway():
+
+    event = create_api_event('/reports', method='POST')
+
+    response = sample_app(event, context)
+
+    assert json.loads(response['body']) == {'action': 'created'}
+
+
+def test_blueprint_middleware_only_runs_for_the_mount():
+
+    response = sample_app(create_alb_event('/health', method='GET'), context)
+
+    assert response['statusCode'] == codes.ok
+    assert 'x-reports' not in response['headers']
+
+
+def test_blueprint_mounted_twice():
+
+    app = Minik()
+    app.mount(reports, prefix='/v1/reports')
+    app.mount(reports, prefix='/v2/reports')
+
+    @reports.delete('/{report_id:int}')
+    def delete_report(report_id):
+        return {'deleted': report_id}
+
+    for version in ('v1', 'v2'):
+        response = app(create_alb_event(f'/{version}/reports/3', method='DELETE'), context)
+        assert json.loads(response['body']) == {'deleted': 3}
+
+
+def test_blueprint_mounted_without_prefix():
+    """
+    A blueprint mounted without a prefix serves its own routes and leaves the
+    other paths to the routes of the app.
+    """
+
+    items = Blueprint('items')
+
+    @items.get('/items')
+    def get_items():
+        return {'items': []}
+
+    app = Minik()
+    app.mount(items)
+
+    @app.get('/health')
+    def get_health():
+        return {'status': 'ok'}
+
+    for create_event in (create_alb_event, create_api_event):
+        assert json.loads(app(create_event('/items', method='GET'), context)['body']) == {'items': []}
+        assert json.loads(app(create_event('/health', method='GET'), context)['body']) == {'status': 'ok'}
+        assert app(create_event('/missing', method='GET'), context)['statusCode'] == codes.not_found
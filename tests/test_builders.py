@@ -1,6 +1,22 @@
+import json
+import os
 from unittest.mock import MagicMock
-from minik.builders import ALBRequestBuilder
-from minik.utils import create_alb_event
+
+import pytest
+
+from minik.builders import (
+    ALBRequestBuilder, APIGatewayRequestBuilder, HTTPAPIRequestBuilder, CloudFrontRequestBuilder,
+    RequestBuilder, RequestBuilderRegistry, event_fingerprint, find_request_builder
+)
+from minik.core import Minik
+from minik.exceptions import MinikViewError
+from minik.models import MinikRequest
+from minik.utils import (
+    create_alb_event, create_api_event, create_cloudfront_event, create_http_api_event, create_websocket_event
+)
+
+
+PAYLOADS_DIR = os.path.join(os.path.dirname(__file__), '..', 'payloads')
 
 
 class TestALBRequestBuilder:
@@ -39,3 +55,157 @@ class TestALBRequestBuilder:
 
         assert result.query_params['name'] == 'first last'
         assert result.query_params['greeting'] == '"Hello world."'
+
+    def test_build_decodes_querystrings_on_access(self):
+
+        mock_router = MagicMock()
+        mock_router.resolve_path.return_value = ('resource', {})
+
+        alb_event = create_alb_event(path='/findme', queryParameters={'name': 'first+last'})
+
+        result = ALBRequestBuilder().build(alb_event, 'context', mock_router)
+
+        assert callable(result._query_params)
+        assert result.query_params == {'name': 'first last'}
+
+
+class TestAPIGatewayRequestBuilder:
+
+    def test_build_sample_payload(self):
+
+        with open(os.path.join(PAYLOADS_DIR, 'gateway.json')) as payload:
+            event = json.load(payload)
+
+        mock_router = MagicMock()
+        mock_router.has_resource.return_value = False
+        mock_router.resolve_path.return_value = ('/test/{name}', {'name': 'hello'})
+
+        result = APIGatewayRequestBuilder().build(event, 'context', mock_router)
+
+        assert result.headers['user-agent'].startswith('Mozilla')
+        assert result.headers['Host'] == 'wt6mne2s9k.execute-api.us-west-2.amazonaws.com'
+        assert result.body is None
+        assert result.resource == '/test/{name}'
+
+
+class TestHTTPAPIRequestBuilder:
+
+    def test_build_sample_payload(self):
+
+        with open(os.path.join(PAYLOADS_DIR, 'http_api.json')) as payload:
+            event = json.load(payload)
+
+        mock_router = MagicMock()
+        mock_router.resolve_path.return_value = ('/test/{name}', {'name': 'hello'})
+
+        assert isinstance(find_request_builder(event), HTTPAPIRequestBuilder)
+
+        result = HTTPAPIRequestBuilder().build(event, 'context', mock_router)
+
+        mock_router.resolve_path.assert_called_once_with('/test/hello')
+        assert result.path == '/test/hello'
+        assert result.method == 'GET'
+        assert result.resource == '/test/{name}'
+        assert result.uri_params == {'name': 'hello'}
+        assert result.headers['Host'] == 'r3pmxmplak.execute-api.us-east-2.amazonaws.com'
+        assert callable(result._query_params)
+        assert result.query_params == {'tag': 'gravel', 'name': 'first last'}
+        assert result.multi_query_params.getlist('tag') == ['road', 'gravel']
+
+
+class SQSRequestBuilder(RequestBuilder):
+
+    def __init__(self):
+        self.matches_calls = 0
+
+    def matches(self, event):
+        self.matches_calls += 1
+        return (event.get('Records') or [{}])[0].get('eventSource') == 'aws:sqs'
+
+    def build(self, event, context, router):
+        resource, uri_params = router.resolve_path('/queues/' + event['Records'][0]['eventSourceARN'].split(':')[-1])
+        return MinikRequest(
+            request_type='sqs_request', path=None, resource=resource, query_params={}, headers={},
+            uri_params=uri_params, method='POST', body=event['Records'][0]['body'], context=context, event=event
+        )
+
+
+def create_sqs_event(body):
+    return {'Records': [{'eventSource': 'aws:sqs', 'eventSourceARN': 'arn:aws:sqs:us-east-1:123456789012:rides', 'body': body}]}
+
+
+class TestRequestBuilderRegistry:
+
+    def test_find_is_memoized_by_fingerprint(self):
+        sqs_builder = SQSRequestBuilder()
+        registry = RequestBuilderRegistry()
+        registry.add(sqs_builder)
+
+        for _ in range(3):
+            assert isinstance(registry.find(create_api_event('/events', method='GET')), APIGatewayRequestBuilder)
+            assert registry.find(create_sqs_event('{}')) is sqs_builder
+
+        assert sqs_builder.matches_calls == 2
+
+    def test_records_events_are_told_apart(self):
+        registry = RequestBuilderRegistry()
+        registry.add(SQSRequestBuilder(), index=len(registry.builders))
+
+        assert isinstance(registry.find(create_cloudfront_event('/')), CloudFrontRequestBuilder)
+        assert isinstance(registry.find(create_sqs_event('{}')), SQSRequestBuilder)
+
+    def test_event_fingerprint(self):
+        fingerprints = {
+            event_fingerprint(create_api_event('/events')),
+            event_fingerprint(create_alb_event('/events')),
+            event_fingerprint(create_http_api_event('/events')),
+            event_fingerprint(create_websocket_event('$default')),
+            event_fingerprint(create_cloudfront_event('/events')),
+            event_fingerprint(create_sqs_event('{}')),
+        }
+
+        assert len(fingerprints) == 6
+        assert event_fingerprint({'source': 'aws.events', 'detail': {}}) is None
+
+    def test_events_without_fingerprint_are_not_memoized(self):
+        class ScheduleRequestBuilder(SQSRequestBuilder):
+            def matches(self, event):
+                self.matches_calls += 1
+                return event.get('source') == 'aws.events'
+
+        schedule_builder = ScheduleRequestBuilder()
+        registry = RequestBuilderRegistry()
+        registry.add(schedule_builder)
+
+        for _ in range(2):
+            assert registry.find({'source': 'aws.events'}) is schedule_builder
+
+        assert schedule_builder.matches_calls == 2
+
+    def test_unsupported_event(self):
+        registry = RequestBuilderRegistry([ALBRequestBuilder()])
+
+        with pytest.raises(MinikViewError):
+            registry.find(create_api_event('/events'))
+
+    def test_builder_without_build(self):
+        class PartialRequestBuilder(RequestBuilder):
+            def matches(self, event):
+                return True
+
+        with pytest.raises(TypeError):
+            PartialRequestBuilder()
+
+    def test_app_request_builders(self):
+        app = Minik(request_builders=[ALBRequestBuilder()])
+        app.add_request_builder(SQSRequestBuilder())
+
+        @app.route('/queues/{name}')
+        def consume(name):
+            return {'queue': name, 'body': app.request.body}
+
+        response = app(create_sqs_event('ride-created'), MagicMock())
+        assert json.loads(response['body']) == {'queue': 'rides', 'body': 'ride-created'}
+
+        with pytest.raises(MinikViewError):
+            app(create_api_event('/queues/rides'), MagicMock())
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+    test_cloudfront.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import base64
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from minik.core import Minik
+from minik.builders import CloudFrontRequestBuilder, find_request_builder
+from minik.status_codes import codes
+from minik.utils import create_cloudfront_event
+
+
+edge_app = Minik(edge=True)
+sample_app = Minik()
+context = MagicMock()
+
+
+@edge_app.get('/redirects/{name}')
+def redirect(name):
+    edge_app.response.status_code = codes.found
+    edge_app.response.headers['Location'] = f'https://example.com/{name}?lang={edge_app.request.query_params["lang"]}'
+    edge_app.response.add_header('Set-Cookie', 'a=1')
+    edge_app.response.add_header('Set-Cookie', 'b=2')
+    return ''
+
+
+@edge_app.get('/pixel.gif')
+def pixel():
+    edge_app.response.headers['Content-Type'] = 'image/gif'
+    return b'GIF89a'
+
+
+@edge_app.get('/failure')
+def failure():
+    raise ValueError('unexpected')
+
+
+@sample_app.post('/events')
+def create_event():
+    return {
+        'body': sample_app.request.json_body,
+        'host': sample_app.request.headers['Host'],
+        'tags': sample_app.request.multi_query_params.getlist('tag'),
+    }
+
+
+def test_find_cloudfront_builder():
+    event = create_cloudfront_event('/redirects/home')
+    assert isinstance(find_request_builder(event), CloudFrontRequestBuilder)
+
+
+def test_edge_response_format():
+    event = create_cloudfront_event('/redirects/home', querystring='lang=en')
+
+    response = edge_app(event, context)
+
+    assert response == {
+        'status': '302',
+        'statusDescription': 'Found',
+        'headers': {
+            'location': [{'key': 'Location', 'value': 'https://example.com/home?lang=en'}],
+            'set-cookie': [{'key': 'Set-Cookie', 'value': 'a=1'}, {'key': 'Set-Cookie', 'value': 'b=2'}],
+        },
+        'body': '',
+        'bodyEncoding': 'text',
+    }
+
+
+def test_edge_binary_response():
+    response = edge_app(create_cloudfront_event('/pixel.gif'), context)
+
+    assert response['bodyEncoding'] == 'base64'
+    assert base64.b64decode(response['body']) == b'GIF89a'
+    assert response['headers']['content-type'] == [{'key': 'Content-Type', 'value': 'image/gif'}]
+
+
+@pytest.mark.parametrize('uri,status_code,body', [
+    ('/failure', codes.server_error, {'error_message': 'Internal server error.'}),
+    ('/missing', codes.not_found, {'error_message': 'MinikViewError: The requested URL was not found on the server.'}),
+])
+def test_edge_errors_are_serialized_without_trace(uri, status_code, body, capsys):
+    response = edge_app(create_cloudfront_event(uri), context)
+
+    assert response['status'] == str(status_code)
+    assert response['headers']['content-type'] == [{'key': 'Content-Type', 'value': 'application/json'}]
+    assert json.loads(response['body']) == body
+    assert capsys.readouterr().out == ''
+
+
+def test_cloudfront_event_with_default_profile():
+    event = create_cloudfront_event(
+        '/events', method='POST', body={'name': 'Gran Fondo'},
+        headers={'Host': 'example.com', 'Content-Type': 'application/json'},
+        querystring='tag=road&tag=gravel'
+    )
+
+    response = sample_app(event, context)
+
+    assert response['status'] == '200'
+    assert response['bodyEncoding'] == 'text'
+    assert json.loads(response['body']) == {
+        'body': {'name': 'Gran Fondo'},
+        'host': 'example.com',
+        'tags': ['road', 'gravel'],
+    }
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+    test_compression.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import base64
+import gzip
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from minik.core import Minik
+from minik.middleware import CompressionMiddleware, parse_accept_encoding
+from minik.utils import create_api_event, create_alb_event, create_http_api_event, create_cloudfront_event
+
+
+EVENTS = [{'id': idx, 'name': 'MD Grand Fondo', 'city': 'Baltimore'} for idx in range(100)]
+context = MagicMock()
+
+
+sample_app = Minik()
+sample_app.add_middleware(CompressionMiddleware())
+
+
+@sample_app.get('/events')
+def get_events():
+    return EVENTS
+
+
+@sample_app.get('/events/small')
+def get_small_events():
+    return EVENTS[:1]
+
+
+@sample_app.get('/events/raw', compress=False)
+def get_raw_events():
+    return EVENTS
+
+
+@sample_app.get('/events/fast', compress={'gzip_level': 1, 'minimum_size': 0})
+def get_fast_events():
+    return EVENTS[:1]
+
+
+@sample_app.get('/logo')
+def get_logo():
+    sample_app.response.headers['Content-Type'] = 'image/png'
+    return b'\x89PNG' * 1000
+
+
+@sample_app.get('/chart')
+def get_chart():
+    sample_app.response.headers['Content-Type'] = 'image/svg+xml'
+    return '<svg></svg>' * 1000
+
+
+def gzip_headers(**headers):
+    return {'content-type': 'application/json', 'Accept-Encoding': 'gzip, deflate', **headers}
+
+
+@pytest.mark.parametrize('create_event', [create_api_event, create_alb_event, create_http_api_event])
+def test_gzip_response(create_event):
+    event = create_event('/events', method='GET', headers=gzip_headers())
+    if create_event is create_api_event:
+        event['path'] = event['resource'] = '/events'
+
+    response = sample_app(event, context)
+
+    assert response['isBase64Encoded'] is True
+    assert response['headers']['Content-Encoding'] == 'gzip'
+    assert response['headers']['Vary'] == 'Accept-Encoding'
+    assert json.loads(gzip.decompress(base64.b64decode(response['body']))) == EVENTS
+
+
+def test_gzip_cloudfront_response():
+    event = create_cloudfront_event('/events', headers={'Accept-Encoding': 'gzip'})
+
+    response = sample_app(event, context)
+
+    assert response['bodyEncoding'] == 'base64'
+    assert response['headers']['content-encoding'] == [{'key': 'Content-Encoding', 'value': 'gzip'}]
+    assert json.loads(gzip.decompress(base64.b64decode(response['body']))) == EVENTS
+
+
+@pytest.mark.parametrize('accept_encoding', [None, 'identity', 'deflate', 'gzip;q=0', '*;q=0'])
+def test_encoding_not_accepted(accept_encoding):
+    headers = {'content-type': 'application/json'}
+    if accept_encoding is not None:
+        headers['Accept-Encoding'] = accept_encoding
+
+    response = sample_app(create_http_api_event('/events', method='GET', headers=headers), context)
+
+    assert response['isBase64Encoded'] is False
+    assert 'Content-Encoding' not in response['headers']
+    assert response['headers']['Vary'] == 'Accept-Encoding'
+    assert json.loads(response['body']) == EVENTS
+
+
+@pytest.mark.parametrize('path', ['/events/small', '/events/raw', '/logo'])
+def test_response_not_compressed(path):
+    response = sample_app(create_http_api_event(path, method='GET', headers=gzip_headers()), context)
+
+    assert 'Content-Encoding' not in response['headers']
+    assert 'Vary' not in response['headers']
+
+
+def test_route_settings():
+    response = sample_app(create_http_api_event('/events/fast', method='GET', headers=gzip_headers()), context)
+
+    assert response['headers']['Content-Encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(base64.b64decode(response['body']))) == EVENTS[:1]
+
+
+def test_uncompressed_image_type():
+    response = sample_app(create_http_api_event('/chart', method='GET', headers=gzip_headers()), context)
+
+    assert response['headers']['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(base64.b64decode(response['body'])) == b'<svg></svg>' * 1000
+
+
+def test_minimum_size():
+    app = Minik()
+    app.add_middleware(CompressionMiddleware(minimum_size=0))
+
+    @app.get('/events/small')
+    def get_small_events():
+        return EVENTS[:1]
+
+    response = app(create_http_api_event('/events/small', method='GET', headers=gzip_headers()), context)
+
+    assert response['headers']['Content-Encoding'] == 'gzip'
+
+
+def test_vary_header_merged():
+    app = Minik()
+    app.add_middleware(CompressionMiddleware())
+    app._default_headers['Vary'] = 'Origin'
+
+    @app.get('/events')
+    def get_events():
+        return EVENTS
+
+    response = app(create_http_api_event('/events', method='GET', headers=gzip_headers()), context)
+
+    assert response['headers']['Vary'] == 'Origin, Accept-Encoding'
+
+
+def test_missing_route():
+    response = sample_app(create_http_api_event('/missing', method='GET', headers=gzip_headers()), context)
+
+    assert response['statusCode'] == 404
+    assert 'Content-Encoding' not in response['headers']
+
+
+@pytest.mark.parametrize('accept_encoding,expected', [
+    ('gzip, deflate, br', 'gzip'),
+    ('br;q=1.0, gzip;q=0.5', 'gzip'),
+    ('*', 'gzip'),
+    ('GZIP', 'gzip'),
+    ('deflate, *;q=0.1', 'gzip'),
+    ('gzip;q=0, *', None),
+    ('identity', None),
+    ('', None),
+])
+def test_negotiate(accept_encoding, expected):
+    middleware = CompressionMiddleware()
+    middleware.encodings = ('gzip',)
+
+    assert middleware.negotiate(accept_encoding) == expected
+    assert middleware.negotiate(accept_encoding) == expected
+
+
+def test_negotiate_prefers_brotli():
+    middleware = CompressionMiddleware()
+    middleware.encodings = ('br', 'gzip')
+
+    assert middleware.negotiate('gzip, br') == 'br'
+    assert middleware.negotiate('gzip, br;q=0.5') == 'gzip'
+
+
+def test_parse_accept_encoding():
+    assert parse_accept_encoding('gzip, br;q=0.8, *;q=0, x;q=bad') == {'gzip': 1.0, 'br': 0.8, '*': 0.0, 'x': 0.0}
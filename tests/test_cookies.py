@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+    test_cookies.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import datetime
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from minik.cookies import dump_cookie, parse_cookies
+from minik.core import Minik
+from minik.utils import create_api_event, create_alb_event, create_http_api_event, create_cloudfront_event
+
+
+sample_app = Minik()
+context = MagicMock()
+
+
+@sample_app.route('/session')
+def session():
+    sample_app.response.set_cookie('session', 'new-session', max_age=3600, httponly=True)
+    sample_app.response.set_cookie('theme', 'dark')
+    sample_app.response.delete_cookie('legacy')
+    return {'cookies': sample_app.request.cookies}
+
+
+EXPECTED_SET_COOKIE = [
+    'session=new-session; Max-Age=3600; Path=/; HttpOnly',
+    'theme=dark; Path=/',
+    'legacy=; Expires=Thu, 01 Jan 1970 00:00:00 GMT; Max-Age=0; Path=/',
+]
+
+
+@pytest.mark.parametrize('headers,expected', [
+    (['session=38afes7a8; theme=dark'], {'session': '38afes7a8', 'theme': 'dark'}),
+    (['session=38afes7a8', 'session=ignored; lang="en us"'], {'session': '38afes7a8', 'lang': 'en us'}),
+    (['flag; empty=; =nameless'], {'empty': ''}),
+    ([], {}),
+])
+def test_parse_cookies(headers, expected):
+    assert parse_cookies(headers) == expected
+
+
+@pytest.mark.parametrize('kwargs,expected', [
+    ({}, 'key=value; Path=/'),
+    ({'path': None, 'domain': 'example.com', 'secure': True, 'samesite': 'lax'},
+     'key=value; Domain=example.com; Secure; SameSite=Lax'),
+    ({'expires': datetime.datetime(2020, 6, 3, 10, 30), 'max_age': datetime.timedelta(days=1)},
+     'key=value; Expires=Wed, 03 Jun 2020 10:30:00 GMT; Max-Age=86400; Path=/'),
+])
+def test_dump_cookie(kwargs, expected):
+    assert dump_cookie('key', 'value', **kwargs) == expected
+
+
+def test_dump_cookie_quotes_values():
+    assert dump_cookie('name', 'first last; "quoted"', path=None) == 'name="first last; \\"quoted\\""'
+    assert parse_cookies([dump_cookie('name', 'first last; "quoted"', path=None)]) == {'name': 'first last; "quoted"'}
+
+    with pytest.raises(ValueError):
+        dump_cookie('key', 'value', samesite='sometimes')
+
+
+def test_api_gateway_cookies():
+    event = create_api_event('/session', method='GET', headers={'Cookie': 'session=38afes7a8; theme=light'})
+
+    response = sample_app(event, context)
+
+    assert json.loads(response['body']) == {'cookies': {'session': '38afes7a8', 'theme': 'light'}}
+    assert response['multiValueHeaders']['Set-Cookie'] == EXPECTED_SET_COOKIE
+
+
+def test_alb_multi_value_cookies():
+    event = create_alb_event('/session', method='GET')
+    event['multiValueHeaders'] = {'cookie': ['session=38afes7a8']}
+    del event['headers']
+
+    response = sample_app(event, context)
+
+    assert json.loads(response['body']) == {'cookies': {'session': '38afes7a8'}}
+    assert response['multiValueHeaders']['Set-Cookie'] == EXPECTED_SET_COOKIE
+    assert 'headers' not in response
+
+
+def test_http_api_cookies():
+    event = create_http_api_event('/session', method='GET', cookies=['session=38afes7a8', 'theme=light'])
+
+    response = sample_app(event, context)
+
+    assert json.loads(response['body']) == {'cookies': {'session': '38afes7a8', 'theme': 'light'}}
+    assert response['cookies'] == EXPECTED_SET_COOKIE
+    assert 'Set-Cookie' not in response['headers']
+
+
+def test_cloudfront_cookies():
+    event = create_cloudfront_event('/session', headers={'Cookie': 'session=38afes7a8'})
+    event['Records'][0]['cf']['request']['headers']['cookie'].append({'key': 'Cookie', 'value': 'theme=light'})
+
+    response = sample_app(event, context)
+
+    assert json.loads(response['body']) == {'cookies': {'session': '38afes7a8', 'theme': 'light'}}
+    assert [entry['value'] for entry in response['headers']['set-cookie']] == EXPECTED_SET_COOKIE
+
+
+def test_cookies_are_parsed_once():
+    app = Minik()
+
+    @app.get('/cookies')
+    def cookies():
+        return {'same': app.request.cookies is app.request.cookies}
+
+    response = app(create_api_event('/cookies', method='GET', headers={'cookie': 'a=1'}), context)
+
+    assert json.loads(response['body']) == {'same': True}
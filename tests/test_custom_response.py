@@ -59,6 +59,6 @@ def test_post_custom_response():
 
     response = sample_app(event, context)
 
-    assert response['body'] == json.dumps({'findme': True, 'zip': 20902})
+    assert json.loads(response['body']) == {'findme': True, 'zip': 20902}
     assert response['headers'] == {'Content-Type': 'application/json'}
     assert response['statusCode'] == codes.partial
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+    test_etag.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import datetime
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from minik.blueprints import Blueprint
+from minik.core import Minik
+from minik.middleware import ETagMiddleware, CompressionMiddleware, is_not_modified, parse_http_date
+from minik.structures import MutableHeaders
+from minik.utils import create_http_api_event, create_alb_event
+
+
+EVENTS = [{'id': idx, 'name': 'MD Grand Fondo'} for idx in range(10)]
+UPDATED_AT = datetime.datetime(2019, 5, 1, 12, 30, tzinfo=datetime.timezone.utc)
+context = MagicMock()
+
+
+sample_app = Minik()
+sample_app.add_middleware(ETagMiddleware())
+view_calls = []
+
+
+@sample_app.get('/events')
+def get_events():
+    view_calls.append('events')
+    return EVENTS
+
+
+@sample_app.post('/events')
+def create_event():
+    return EVENTS[0]
+
+
+@sample_app.get('/events/{event_id}', etag=lambda event_id: f'v{event_id}')
+def get_event(event_id):
+    view_calls.append(event_id)
+    return EVENTS[int(event_id)]
+
+
+@sample_app.get('/calendar', last_modified=lambda: UPDATED_AT)
+def get_calendar():
+    view_calls.append('calendar')
+    return EVENTS
+
+
+@sample_app.get('/feed', etag=False)
+def get_feed():
+    return EVENTS
+
+
+@sample_app.get('/errors')
+def get_errors():
+    raise Exception('failure')
+
+
+# The ETag middleware runs before the compression middleware.
+compressed_app = Minik()
+compressed_app.add_middleware(ETagMiddleware())
+compressed_app.add_middleware(CompressionMiddleware(minimum_size=0))
+
+
+@compressed_app.get('/events')
+def get_compressed_events():
+    return EVENTS
+
+
+@pytest.fixture(autouse=True)
+def clear_view_calls():
+    view_calls.clear()
+
+
+def get(app, path, method='GET', **headers):
+    headers = {'content-type': 'application/json', **headers}
+    return app(create_http_api_event(path, method=method, headers=headers), context)
+
+
+def test_etag_of_body():
+    first = get(sample_app, '/events')
+    second = get(sample_app, '/events')
+
+    etag = first['headers']['ETag']
+    assert first['statusCode'] == 200
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == second['headers']['ETag']
+    assert json.loads(first['body']) == EVENTS
+
+
+@pytest.mark.parametrize('if_none_match', ['{etag}', 'W/{etag}', '"other", {etag}', '*'])
+def test_not_modified(if_none_match):
+    etag = get(sample_app, '/events')['headers']['ETag']
+
+    response = get(sample_app, '/events', **{'If-None-Match': if_none_match.format(etag=etag)})
+
+    assert response['statusCode'] == 304
+    assert response['body'] == ''
+    assert response['headers']['ETag'] == etag
+    assert 'Content-Type' not in response['headers']
+
+
+def test_modified():
+    response = get(sample_app, '/events', **{'If-None-Match': '"other"'})
+
+    assert response['statusCode'] == 200
+    assert json.loads(response['body']) == EVENTS
+
+
+def test_version_function_skips_view():
+    first = get(sample_app, '/events/3')
+    second = get(sample_app, '/events/3', **{'If-None-Match': '"v3"'})
+    third = get(sample_app, '/events/4', **{'If-None-Match': '"v3"'})
+
+    assert first['headers']['ETag'] == '"v3"'
+    assert second['statusCode'] == 304
+    assert second['body'] == ''
+    assert third['statusCode'] == 200
+    assert view_calls == ['3', '4']
+
+
+def test_version_function_receives_converted_params():
+    app = Minik()
+    app.add_middleware(ETagMiddleware())
+    versions = []
+
+    @app.get('/rides/{ride_id}', etag=lambda ride_id: versions.append(ride_id) or ride_id * 10)
+    def get_ride(ride_id: int):
+        return {'id': ride_id}
+
+    first = get(app, '/rides/3')
+    second = get(app, '/rides/3', **{'If-None-Match': '"30"'})
+
+    assert versions == [3, 3]
+    assert first['headers']['ETag'] == '"30"'
+    assert json.loads(first['body']) == {'id': 3}
+    assert second['statusCode'] == 304
+    assert get(app, '/rides/abc')['statusCode'] == 404
+
+
+def test_last_modified_skips_view():
+    first = get(sample_app, '/calendar')
+    second = get(sample_app, '/calendar', **{'If-Modified-Since': 'Wed, 01 May 2019 12:30:00 GMT'})
+    third = get(sample_app, '/calendar', **{'If-Modified-Since': 'Wed, 01 May 2019 12:00:00 GMT'})
+
+    assert first['headers']['Last-Modified'] == 'Wed, 01 May 2019 12:30:00 GMT'
+    assert second['statusCode'] == 304
+    assert third['statusCode'] == 200
+    assert view_calls == ['calendar', 'calendar']
+
+
+@pytest.mark.parametrize('path,method', [('/events', 'POST'), ('/feed', 'GET'), ('/errors', 'GET')])
+def test_etag_not_added(path, method):
+    response = get(sample_app, path, method=method, **{'If-None-Match': '*'})
+
+    assert 'ETag' not in response['headers']
+    assert response['statusCode'] != 304
+
+
+def test_alb_not_modified():
+    headers = {'content-type': 'application/json', 'If-None-Match': '"v1"'}
+
+    response = sample_app(create_alb_event('/events/1', method='GET', headers=headers), context)
+
+    assert response['statusCode'] == 304
+    assert response['body'] == ''
+    assert view_calls == []
+
+
+def test_compressed_not_modified():
+    headers = {'Accept-Encoding': 'gzip'}
+    etag = get(compressed_app, '/events', **headers)['headers']['ETag']
+
+    response = get(compressed_app, '/events', **headers, **{'If-None-Match': etag})
+
+    assert etag.startswith('W/"')
+    assert response['statusCode'] == 304
+    assert response['body'] == ''
+    assert response['headers']['ETag'] == etag
+    assert response['headers']['Vary'] == 'Accept-Encoding'
+    assert 'Content-Encoding' not in response['headers']
+
+
+def test_etag_differs_between_encodings():
+    identity = get(compressed_app, '/events')
+    compressed = get(compressed_app, '/events', **{'Accept-Encoding': 'gzip'})
+
+    assert 'Content-Encoding' not in identity['headers']
+    assert compressed['headers']['Content-Encoding'] == 'gzip'
+    assert compressed['headers']['ETag'] == 'W/' + identity['headers']['ETag']
+    assert get(compressed_app, '/events', **{'If-None-Match': compressed['headers']['ETag']})['statusCode'] == 304
+
+
+def test_blueprint_before_view():
+    app = Minik()
+    blueprint = Blueprint()
+    blueprint.add_middleware(ETagMiddleware())
+    report_calls = []
+
+    @blueprint.get('/{report_id}', etag=lambda report_id: report_id)
+    def get_report(report_id):
+        report_calls.append(report_id)
+        return {'id': report_id}
+
+    app.mount(blueprint, prefix='/reports')
+
+    assert get(app, '/reports/7', **{'If-None-Match': '"7"'})['statusCode'] == 304
+    assert get(app, '/reports/8', **{'If-None-Match': '"7"'})['statusCode'] == 200
+    assert report_calls == ['8']
+
+
+def test_is_not_modified_precedence():
+    response_headers = MutableHeaders({'ETag': '"a"', 'Last-Modified': 'Wed, 01 May 2019 12:30:00 GMT'})
+    request_headers = {'if-none-match': '"b"', 'if-modified-since': 'Wed, 01 May 2019 12:30:00 GMT'}
+
+    assert is_not_modified(request_headers, response_headers) is False
+    assert is_not_modified({'if-modified-since': 'not a date'}, response_headers) is False
+
+
+@pytest.mark.parametrize('value,expected', [
+    ('Wed, 01 May 2019 12:30:00 GMT', UPDATED_AT),
+    ('Wed, 01 May 2019 12:30:00', UPDATED_AT),
+    ('yesterday', None),
+    (None, None),
+])
+def test_parse_http_date(value, expected):
+    assert parse_http_date(value) == expected
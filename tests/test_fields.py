@@ -1,8 +1,9 @@
+import pytest
 from unittest.mock import MagicMock
 
 from minik.exceptions import MinikViewError
 from minik.fields import (BaseRouteField, cache_custom_route_fields, CUSTOM_FIELD_BY_TYPE,
-                          update_uri_parameters)
+                          update_uri_parameters, compile_coercion_plan, apply_coercion_plan)
 
 
 def test_cache_custom_route_fields_for_class_based_annotation():
@@ -110,3 +111,32 @@ def test_update_uri_parameters_return_hint_is_ignored():
         update_uri_parameters(sample_view, request)
     except MinikViewError as ve:
         assert 'sco!!' in str(ve)
+
+
+def test_compile_coercion_plan():
+    """
+    The plan of a view resolves the converter of every annotated field, skipping
+    the return annotation and the parameters already converted by the router.
+    """
+
+    def sample_view(bike_id: int, bike_name: str, size, frame_id: int) -> dict:
+        return {'id': bike_id}
+
+    plan = compile_coercion_plan(sample_view, skip={'frame_id'})
+
+    assert plan == (('bike_id', int), ('bike_name', CUSTOM_FIELD_BY_TYPE[str]))
+
+
+def test_apply_coercion_plan():
+
+    def sample_view(bike_id: int, bike_name: str):
+        return {'id': bike_id}
+
+    plan = compile_coercion_plan(sample_view)
+    values = {'bike_id': '52', 'bike_name': 'scott'}
+    apply_coercion_plan(plan, values)
+
+    assert values == {'bike_id': 52, 'bike_name': 'scott'}
+
+    with pytest.raises(MinikViewError):
+        apply_coercion_plan(plan, {'bike_id': 'INVALID', 'bike_name': 'scott'})
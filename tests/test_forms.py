@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+    test_forms.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import base64
+import io
+import json
+import tempfile
+from unittest.mock import MagicMock
+
+import pytest
+
+from minik.core import Minik
+from minik.forms import parse_options_header
+from minik.utils import create_api_event
+
+
+BOUNDARY = '----minikboundary7MA4YWxk'
+context = MagicMock()
+
+
+def multipart_body(fields=(), files=()):
+    lines = []
+    for name, value in fields:
+        lines.append(f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'.encode() + value.encode())
+    for name, filename, content_type, content in files:
+        lines.append((
+            f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            f'Content-Type: {content_type}\r\n\r\n'
+        ).encode() + content)
+    return b'\r\n'.join(lines) + f'\r\n--{BOUNDARY}--\r\n'.encode()
+
+
+def form_event(body, content_type, base64_encoded=True):
+    event = create_api_event('/uploads', method='POST', headers={'Content-Type': content_type})
+    event['body'] = base64.b64encode(body).decode() if base64_encoded else body.decode()
+    event['isBase64Encoded'] = base64_encoded
+    return event
+
+
+# The files larger than 16 bytes are written to a temporary file.
+sample_app = Minik(form_spool_threshold=16)
+
+
+@sample_app.post('/uploads')
+def upload():
+    avatar = sample_app.request.files.get('avatar')
+    return {
+        'name': sample_app.request.form.get('name'),
+        'tags': sample_app.request.form.getlist('tag'),
+        'avatar': {
+            'filename': avatar.filename,
+            'content_type': avatar.content_type,
+            'size': avatar.size,
+            'spooled': isinstance(avatar.stream, tempfile.SpooledTemporaryFile),
+            'content': avatar.read().decode(),
+        } if avatar else None,
+    }
+
+
+@pytest.mark.parametrize('value,expected', [
+    ('form-data; name="avatar"; filename="me.png"', ('form-data', {'name': 'avatar', 'filename': 'me.png'})),
+    ('multipart/form-data; boundary=abc', ('multipart/form-data', {'boundary': 'abc'})),
+    ('form-data; name="say \\"hi\\""', ('form-data', {'name': 'say "hi"'})),
+    ('', ('', {})),
+])
+def test_parse_options_header(value, expected):
+    assert parse_options_header(value) == expected
+
+
+def test_urlencoded_form():
+    body = 'name=Gran+Fondo&tag=road&tag=gravel%21'.encode()
+
+    response = sample_app(form_event(body, 'application/x-www-form-urlencoded', base64_encoded=False), context)
+
+    assert json.loads(response['body']) == {'name': 'Gran Fondo', 'tags': ['road', 'gravel!'], 'avatar': None}
+
+
+@pytest.mark.parametrize('content,spooled', [
+    ('first line', False),
+    ('first line\r\nsecond line', True),
+])
+def test_multipart_form(content, spooled):
+    body = multipart_body(
+        fields=[('name', 'Città'), ('tag', 'road'), ('tag', 'gravel')],
+        files=[('avatar', 'me.txt', 'text/plain', content.encode())]
+    )
+
+    response = sample_app(form_event(body, f'multipart/form-data; boundary={BOUNDARY}'), context)
+
+    assert response['statusCode'] == 200
+    assert json.loads(response['body']) == {
+        'name': 'Città',
+        'tags': ['road', 'gravel'],
+        'avatar': {
+            'filename': 'me.txt',
+            'content_type': 'text/plain',
+            'size': len(content),
+            'spooled': spooled,
+            'content': content,
+        },
+    }
+
+
+def test_files_are_views_over_the_body_until_read():
+    app = Minik()
+    body = multipart_body(files=[('avatar', 'me.png', 'image/png', b'\x89PNG\r\n\x1a\n')])
+
+    @app.post('/uploads')
+    def upload():
+        avatar = app.request.files['avatar']
+        is_view = isinstance(avatar._data, memoryview) and avatar._data.obj is app.request.raw_body.obj
+
+        destination = io.BytesIO()
+        avatar.save(destination)
+        return {'is_view': is_view, 'saved': list(destination.getvalue())}
+
+    response = app(form_event(body, f'multipart/form-data; boundary={BOUNDARY}'), context)
+
+    assert json.loads(response['body']) == {'is_view': True, 'saved': list(b'\x89PNG\r\n\x1a\n')}
+
+
+@pytest.mark.parametrize('content_type,body', [
+    (f'multipart/form-data; boundary={BOUNDARY}', b'no boundary here'),
+    (f'multipart/form-data; boundary={BOUNDARY}', f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="a"\r\n\r\nvalue'.encode()),
+    ('multipart/form-data', b'--abc--'),
+])
+def test_invalid_multipart_form(content_type, body):
+    response = sample_app(form_event(body, content_type), context)
+
+    assert response['statusCode'] == 400
+    assert json.loads(response['body'])['error_message'].startswith('ValidationError: Invalid request body.')
+
+
+def test_form_of_json_request_is_empty():
+    app = Minik()
+
+    @app.post('/uploads')
+    def upload():
+        return {'form': dict(app.request.form), 'files': dict(app.request.files)}
+
+    response = app(create_api_event('/uploads', method='POST', body={'name': 'Gran Fondo'}), context)
+
+    assert json.loads(response['body']) == {'form': {}, 'files': {}}
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+    test_http_api.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import base64
+import json
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+
+from minik.core import Minik
+from minik.status_codes import codes
+from minik.utils import create_http_api_event
+
+
+sample_app = Minik()
+context = MagicMock()
+
+
+@sample_app.get('/events/{event_id:int}')
+def get_event(event_id, tags: List[str] = None):
+    return {'id': event_id, 'tags': tags}
+
+
+@sample_app.post('/events')
+def create_event():
+    sample_app.response.add_header('Set-Cookie', 'session=38afes7a8')
+    sample_app.response.add_header('Set-Cookie', 'theme=dark; Path=/')
+    sample_app.response.add_header('X-Event', 'first')
+    sample_app.response.add_header('X-Event', 'second')
+    sample_app.response.status_code = codes.created
+    return sample_app.request.json_body
+
+
+@sample_app.get('/images/{name}')
+def get_image(name):
+    sample_app.response.headers['Content-Type'] = 'image/png'
+    return b'\x89PNG\r\n'
+
+
+@pytest.mark.parametrize('stage,path', [
+    ('$default', '/events/12'),
+    ('prod', '/prod/events/12'),
+])
+def test_route_resolved_from_raw_path(stage, path):
+    event = create_http_api_event(path, method='GET', stage=stage, rawQueryString='tags=road&tags=gravel')
+
+    response = sample_app(event, context)
+
+    assert response['statusCode'] == 200
+    assert response['isBase64Encoded'] is False
+    assert json.loads(response['body']) == {'id': 12, 'tags': ['road', 'gravel']}
+
+
+def test_cookies_and_multi_value_headers():
+    event = create_http_api_event('/events', method='POST', body={'name': 'Gran Fondo'})
+
+    response = sample_app(event, context)
+
+    assert response['statusCode'] == 201
+    assert response['cookies'] == ['session=38afes7a8', 'theme=dark; Path=/']
+    assert response['headers']['X-Event'] == 'first,second'
+    assert 'Set-Cookie' not in response['headers']
+    assert 'multiValueHeaders' not in response
+    assert json.loads(response['body']) == {'name': 'Gran Fondo'}
+
+
+def test_binary_body_is_base64_encoded():
+    event = create_http_api_event('/images/logo', method='GET')
+
+    response = sample_app(event, context)
+
+    assert response['isBase64Encoded'] is True
+    assert base64.b64decode(response['body']) == b'\x89PNG\r\n'
+    assert 'cookies' not in response
+
+
+@pytest.mark.parametrize('path,method,status_code', [
+    ('/rides', 'GET', codes.not_found),
+    ('/events', 'GET', codes.method_not_allowed),
+])
+def test_route_errors(path, method, status_code):
+    event = create_http_api_event(path, method=method)
+
+    response = sample_app(event, context)
+
+    assert response['statusCode'] == status_code
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+    test_lazy_routes.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import json
+import sys
+import pytest
+from unittest.mock import MagicMock
+
+from minik.core import Minik
+from minik.exceptions import ConfigurationError
+from minik.status_codes import codes
+from minik.utils import create_api_event, create_alb_event
+
+
+context = MagicMock()
+
+
+def test_lazy_route_imports_view_on_first_request():
+
+    sys.modules.pop('lazy_views', None)
+
+    app = Minik()
+    app.add_lazy_route('/reports/{report_id}', 'lazy_views:get_report', methods=['GET'])
+    app.add_lazy_route('/reports', 'lazy_views.list_reports', methods=['GET'])
+
+    @app.get('/health')
+    def health():
+        return {'status': 'ok'}
+
+    app(create_alb_event('/health', method='GET'), context)
+    assert 'lazy_views' not in sys.modules
+
+    response = app(create_alb_event('/reports/12', method='GET'), context)
+    assert json.loads(response['body']) == {'report_id': 12}
+    assert 'lazy_views' in sys.modules
+
+    response = app(create_api_event('/reports', method='GET'), context)
+    assert json.loads(response['body']) == {'reports': []}
+
+
+def test_lazy_route_with_missing_view():
+
+    app = Minik()
+    app.add_lazy_route('/reports', 'lazy_views:not_a_view', methods=['GET'])
+
+    response = app(create_api_event('/reports', method='GET'), context)
+
+    assert response['statusCode'] == codes.server_error
+
+
+@pytest.mark.parametrize("import_path", ['lazy_views', 'lazy views:get_report', ':get_report'])
+def test_lazy_route_with_invalid_import_path(import_path):
+
+    with pytest.raises(ConfigurationError):
+        Minik().add_lazy_route('/reports', import_path)
@@ -21,7 +21,7 @@ def test_content_type_application_json(sample_header):
 
     ContentTypeMiddleware()(mock_app)
 
-    assert response.body == json.dumps({'findme': True})
+    assert json.loads(response.body) == {'findme': True}
 
 
 def test_server_error_middleware():
@@ -70,7 +70,7 @@ def test_sample_view_with_path_params():
     view_body = sample_view('adventure', 'chile')
     response = sample_app(event, context)
 
-    assert response['body'] == json.dumps(view_body)
+    assert json.loads(response['body']) == view_body
     assert response['statusCode'] == codes.ok
 
 
@@ -84,7 +84,7 @@ def test_sample_view_without_query_params():
     view_body = sample_view('adventure', 'chile')
     response = sample_app(event, context)
 
-    assert response['body'] == json.dumps(view_body)
+    assert json.loads(response['body']) == view_body
     assert response['statusCode'] == codes.ok
 
 
@@ -98,7 +98,7 @@ def test_sample_view_with_undefined_query_params():
     view_body = sample_view('adventure', 'chile')
     response = sample_app(event, context)
 
-    assert response['body'] == json.dumps(view_body)
+    assert json.loads(response['body']) == view_body
     assert response['statusCode'] == codes.ok
 
 
@@ -225,3 +225,31 @@ def test_empty_query_params():
 
     assert response['statusCode'] == codes.ok
     assert json.loads(response['body']) == {'value': None}
+
+
+def test_route_added_after_request():
+    """
+    The route matched by a request does not shadow the decorators of the app,
+    routes can be added after the app handled a request, including a 404.
+    """
+    app = Minik()
+
+    @app.get('/first')
+    def first_view():
+        return {'view': 'first'}
+
+    app(create_api_event('/first', method='GET'), context)
+    app(create_api_event('/missing', method='GET'), context)
+
+    @app.get('/second')
+    def second_view():
+        return {'view': 'second'}
+
+    @app.route('/third', methods=['POST'])
+    def third_view():
+        return {'view': 'third'}
+
+    response = app(create_api_event('/second', method='GET'), context)
+
+    assert app.matched_route.endpoint is second_view
+    assert json.loads(response['body']) == {'view': 'second'}
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+    test_multi_value.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import json
+from typing import List
+from unittest.mock import MagicMock
+
+from minik.core import Minik
+from minik.utils import create_api_event, create_alb_event
+
+
+sample_app = Minik()
+context = MagicMock()
+
+
+@sample_app.get('/books')
+def list_books(ids: List[int] = None):
+    sample_app.response.add_header('X-Book', 'first')
+    sample_app.response.add_header('X-Book', 'second')
+    return {
+        'ids': ids,
+        'raw_ids': sample_app.request.multi_query_params.getlist('id'),
+        'accept': sample_app.request.multi_headers.getlist('accept'),
+    }
+
+
+def test_multi_value_api_gateway():
+
+    event = create_api_event('/books', method='GET', queryParameters={'ids': '2', 'id': '2'},
+                             headers={'Accept': 'text/html'})
+    event['multiValueQueryStringParameters'] = {'ids': ['1', '2'], 'id': ['a', 'b']}
+    event['multiValueHeaders'] = {'Accept': ['text/html', 'application/json']}
+
+    response = sample_app(event, context)
+
+    assert json.loads(response['body']) == {
+        'ids': [1, 2], 'raw_ids': ['a', 'b'], 'accept': ['text/html', 'application/json']
+    }
+    assert response['multiValueHeaders']['X-Book'] == ['first', 'second']
+    assert response['headers']['X-Book'] == 'first'
+
+
+def test_multi_value_alb():
+    """
+    With multi value headers enabled, the ALB only sends the multi value fields
+    and it expects the response headers in the multiValueHeaders field.
+    """
+
+    event = create_alb_event('/books', method='GET')
+    del event['headers']
+    del event['queryStringParameters']
+    event['multiValueQueryStringParameters'] = {'ids': ['1', '2%2C3'], 'id': ['first+book']}
+    event['multiValueHeaders'] = {'accept': ['text/html'], 'Accept': ['application/json']}
+
+    response = sample_app(event, context)
+
+    assert json.loads(response['body']) == {
+        'ids': [1, 2, 3], 'raw_ids': ['first book'], 'accept': ['text/html', 'application/json']
+    }
+    assert 'headers' not in response
+    assert response['multiValueHeaders']['X-Book'] == ['first', 'second']
+    assert response['multiValueHeaders']['Content-Type'] == ['application/json']
+
+
+def test_single_value_alb():
+
+    event = create_alb_event('/books', method='GET', queryParameters={'ids': '4', 'id': 'x'})
+
+    response = sample_app(event, context)
+
+    assert json.loads(response['body']) == {'ids': [4], 'raw_ids': ['x'], 'accept': []}
+    assert response['headers']['X-Book'] == 'first'
+    assert 'multiValueHeaders' not in response
+    assert 'multiValueHeaders' not in response
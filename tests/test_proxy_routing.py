@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+    test_proxy_routing.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import json
+import pytest
+from unittest.mock import MagicMock
+
+from minik.core import Minik
+from minik.status_codes import codes
+from minik.utils import create_api_event, create_alb_event
+
+
+sample_app = Minik()
+context = MagicMock()
+
+
+@sample_app.get('/books/{year:int}')
+def get_books(year):
+    return {'year': year}
+
+
+@sample_app.post('/books')
+def post_book():
+    return {'action': 'created'}
+
+
+@sample_app.get('/files/{key+}')
+def get_file(key):
+    return {'key': key}
+
+
+def create_proxy_event(path, method='GET'):
+    """
+    Create the event the API Gateway sends when the app is behind a single
+    '/{proxy+}' resource.
+    """
+    event = create_api_event('/{proxy+}', method=method)
+    event['path'] = path
+    event['pathParameters'] = {'proxy': path[1:]}
+    return event
+
+
+@pytest.mark.parametrize("path, method, expected_body", [
+    ('/books/2019', 'GET', {'year': 2019}),
+    ('/books', 'POST', {'action': 'created'}),
+    ('/files/reports/2019/05.pdf', 'GET', {'key': 'reports/2019/05.pdf'}),
+])
+def test_proxy_resource_routes_by_path(path, method, expected_body):
+    """
+    With a greedy API Gateway resource, minik routes the request based on the
+    path of the request.
+    """
+
+    response = sample_app(create_proxy_event(path, method), context)
+
+    assert response['statusCode'] == codes.ok
+    assert json.loads(response['body']) == expected_body
+
+
+def test_proxy_resource_not_found():
+
+    response = sample_app(create_proxy_event('/authors/tolkien'), context)
+
+    assert response['statusCode'] == codes.not_found
+
+
+def test_greedy_route_defined_in_the_gateway():
+    """
+    If the greedy resource is one of the routes of the app, the path parameters
+    of the API Gateway are used as is.
+    """
+
+    event = create_api_event('/files/{key+}', method='GET')
+    event['path'] = '/files/css/main.css'
+    event['pathParameters'] = {'key': 'css/main.css'}
+
+    response = sample_app(event, context)
+
+    assert json.loads(response['body']) == {'key': 'css/main.css'}
+
+
+def test_greedy_route_alb():
+
+    response = sample_app(create_alb_event('/files/css/main.css', method='GET'), context)
+
+    assert json.loads(response['body']) == {'key': 'css/main.css'}
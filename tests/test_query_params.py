@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+    test_query_params.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import datetime
+import json
+import pytest
+from decimal import Decimal
+from typing import Dict, List, Optional
+from unittest.mock import MagicMock
+
+from minik.core import Minik
+from minik.exceptions import ConfigurationError
+from minik.status_codes import codes
+from minik.utils import create_api_event, create_alb_event
+
+
+sample_app = Minik()
+context = MagicMock()
+
+
+@sample_app.get('/events/{year}')
+def list_events(year: int, limit: int = 50, upcoming: bool = False, tags: List[str] = None,
+                since: Optional[float] = None):
+    return {'year': year, 'limit': limit, 'upcoming': upcoming, 'tags': tags, 'since': since}
+
+
+@sample_app.get('/search')
+def search(term: str, ids: list = None):
+    return {'term': term, 'ids': ids}
+
+
+@sample_app.get('/rides')
+def list_rides(since: datetime.date = None, price: Decimal = None):
+    return {'since': since and since.isoformat(), 'price': price and str(price)}
+
+
+@pytest.mark.parametrize("query_params, expected_body", [
+    ({}, {'year': 2019, 'limit': 50, 'upcoming': False, 'tags': None, 'since': None}),
+    ({'limit': '10', 'upcoming': 'true'}, {'year': 2019, 'limit': 10, 'upcoming': True, 'tags': None, 'since': None}),
+    ({'tags': 'road,gravel', 'since': '1.5'},
+     {'year': 2019, 'limit': 50, 'upcoming': False, 'tags': ['road', 'gravel'], 'since': 1.5}),
+])
+def test_typed_query_params(query_params, expected_body):
+    """
+    The annotated parameters of a view that are not part of the path are filled
+    from the query string.
+    """
+
+    event = create_api_event('/events/{year}', method='GET', pathParameters={'year': '2019'},
+                             queryParameters=query_params)
+
+    response = sample_app(event, context)
+
+    assert json.loads(response['body']) == expected_body
+
+
+@pytest.mark.parametrize("query_params, expected_message", [
+    ({'limit': 'ten'}, 'limit'),
+    ({'upcoming': 'maybe'}, 'upcoming'),
+])
+def test_invalid_query_params(query_params, expected_message):
+
+    event = create_api_event('/events/{year}', method='GET', pathParameters={'year': '2019'},
+                             queryParameters=query_params)
+
+    response = sample_app(event, context)
+
+    assert response['statusCode'] == codes.bad_request
+    assert expected_message in json.loads(response['body'])['error_message']
+
+
+def test_missing_required_query_param():
+
+    response = sample_app(create_api_event('/search', method='GET'), context)
+
+    assert response['statusCode'] == codes.bad_request
+    assert 'term' in json.loads(response['body'])['error_message']
+
+
+def test_typed_query_params_alb():
+    """
+    The values of the ALB query string are url decoded before they are converted.
+    """
+
+    event = create_alb_event('/search', method='GET', queryParameters={'term': 'gran+fondo', 'ids': '1%2C2'})
+
+    response = sample_app(event, context)
+
+    assert json.loads(response['body']) == {'term': 'gran fondo', 'ids': ['1', '2']}
+
+
+def test_date_and_decimal_query_params():
+
+    event = create_api_event('/rides', method='GET', queryParameters={'since': '2019-01-01', 'price': '9.50'})
+
+    response = sample_app(event, context)
+
+    assert json.loads(response['body']) == {'since': '2019-01-01', 'price': '9.50'}
+
+
+@pytest.mark.parametrize("query_params, expected_message", [
+    ({'price': 'abc'}, 'price'),
+    ({'since': '01/01/2019'}, 'since'),
+])
+def test_invalid_date_and_decimal_query_params(query_params, expected_message):
+
+    response = sample_app(create_api_event('/rides', method='GET', queryParameters=query_params), context)
+
+    assert response['statusCode'] == codes.bad_request
+    assert expected_message in json.loads(response['body'])['error_message']
+
+
+def test_query_param_that_can_not_be_converted():
+    """
+    An annotation that can not be built from a string fails when the route is added.
+    """
+
+    app = Minik()
+
+    with pytest.raises(ConfigurationError):
+        @app.get('/rides')
+        def list_rides(filters: Dict[str, int] = None):
+            return filters
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+    test_request_body.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import base64
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from minik.core import Minik
+from minik.models import MinikRequest
+from minik.utils import create_api_event
+
+
+sample_app = Minik()
+context = MagicMock()
+
+
+@sample_app.post('/uploads')
+def upload():
+    raw_body = sample_app.request.raw_body
+    return {
+        'size': len(raw_body),
+        'is_memoryview': isinstance(raw_body, memoryview),
+        'first_byte': raw_body[0],
+    }
+
+
+def build_request(body, headers=None, is_base64_encoded=False):
+    event = {'body': body, 'isBase64Encoded': is_base64_encoded}
+    return MinikRequest(
+        request_type='api_request', path='/uploads', resource='/uploads',
+        query_params={}, headers=headers or {'content-type': 'application/json'},
+        uri_params={}, method='POST', body=body, context=None, event=event
+    )
+
+
+def test_binary_upload_is_decoded_once():
+    payload = bytes(range(256))
+    event = create_api_event('/uploads', method='POST')
+    event['body'] = base64.b64encode(payload).decode()
+    event['isBase64Encoded'] = True
+
+    response = sample_app(event, context)
+    body = json.loads(response['body'])
+
+    assert response['statusCode'] == 200
+    assert body == {'size': 256, 'is_memoryview': True, 'first_byte': 0}
+
+
+@pytest.mark.parametrize('body,expected', [
+    ('{"name": "Gran Fondo"}', b'{"name": "Gran Fondo"}'),
+    (b'{"name": "Gran Fondo"}', b'{"name": "Gran Fondo"}'),
+    (None, b''),
+    ('', b''),
+])
+def test_raw_body_of_plain_bodies(body, expected):
+    request = build_request(body)
+    assert request.raw_body.tobytes() == expected
+
+
+def test_raw_body_is_cached():
+    request = build_request(base64.b64encode(b'\x00\x01').decode(), is_base64_encoded=True)
+    assert request.raw_body.obj is request.raw_body.obj
+
+
+def test_text_and_json_body_of_base64_body():
+    body = base64.b64encode('{"name": "Città"}'.encode()).decode()
+    request = build_request(body, is_base64_encoded=True)
+
+    assert request.text == '{"name": "Città"}'
+    assert request.json_body == {'name': 'Città'}
+
+
+def test_text_uses_the_charset_of_the_content_type():
+    body = base64.b64encode('Città'.encode('latin-1')).decode()
+    request = build_request(body, headers={'content-type': 'text/plain; charset=latin-1'}, is_base64_encoded=True)
+
+    assert request.text == 'Città'
+    assert request.json_body is None
@@ -22,7 +22,7 @@ from unittest.mock import MagicMock
 from minik.core import Minik
 from minik.fields import ReStr, BaseRouteField
 from minik.status_codes import codes
-from minik.utils import create_api_event
+from minik.utils import create_api_event, create_alb_event
 
 
 sample_app = Minik()
@@ -50,7 +50,7 @@ def test_str_route_validation_valid(username):
     response = sample_app(event, context)
     expected_response = get_re_view(username)
 
-    assert response['body'] == json.dumps(expected_response)
+    assert json.loads(response['body']) == expected_response
 
 
 @pytest.mark.parametrize("username", [('$$$'), ('12#3'), ('hello@gmail')])
@@ -85,7 +85,7 @@ def test_route_with_int_valid():
     response = sample_app(event, context)
     expected_response = get_articles_view(2020, 10)
 
-    assert response['body'] == json.dumps(expected_response)
+    assert json.loads(response['body']) == expected_response
 
 
 @pytest.mark.parametrize("year,month", [
@@ -222,3 +222,41 @@ def test_custom_field_in_route_invalid(tracker_name):
 
     response = sample_app(event, context)
     assert response['statusCode'] == codes.not_found
+
+
+@sample_app.route('/orders/{order_id:int}', methods=['GET'])
+def get_order(order_id):
+    assert isinstance(order_id, int)
+    return {'id': order_id}
+
+
+@sample_app.route('/orders/{order_name}', methods=['GET'])
+def get_order_by_name(order_name: str):
+    return {'name': order_name}
+
+
+def test_converter_in_route_api_gateway():
+    """
+    The API Gateway resource does not include the converter, the value of the
+    parameter is still converted before the view is executed.
+    """
+
+    event = create_api_event('/orders/{order_id}',
+                                method='GET',
+                                pathParameters={'order_id': '512'})
+
+    response = sample_app(event, context)
+    assert json.loads(response['body']) == {'id': 512}
+
+
+@pytest.mark.parametrize("path, expected_body", [
+    ('/orders/512', {'id': 512}),
+    ('/orders/first-order', {'name': 'first-order'}),
+])
+def test_converter_in_route_alb(path, expected_body):
+    """
+    A path that does not match the converter falls through to the next route.
+    """
+
+    response = sample_app(create_alb_event(path, method='GET'), context)
+    assert json.loads(response['body']) == expected_body
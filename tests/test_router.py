@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+    test_router.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import uuid
+import pytest
+from minik.converters import BaseConverter, register_converter
+from minik.exceptions import ConfigurationError
+from minik.router import Router, RouteRegistrar
+
+
+def sample_view(**kwargs):
+    return kwargs
+
+
+@pytest.fixture
+def router():
+    router = Router()
+    for route_path in ['/books', '/books/{year}', '/books/latest', '/books/{year}/{month}/',
+                       '/authors/{name}/books/{title}', '/files/{name}.{ext}', '/books/{year}/reviews']:
+        router.add_route(route_path, sample_view)
+    return router
+
+
+@pytest.mark.parametrize("path, expected_resource, expected_params", [
+    ('/books', '/books', {}),
+    ('/books/2019', '/books/{year}', {'year': '2019'}),
+    ('/books/2019/05/', '/books/{year}/{month}/', {'year': '2019', 'month': '05'}),
+    ('/authors/tolkien/books/hobbit', '/authors/{name}/books/{title}', {'name': 'tolkien', 'title': 'hobbit'}),
+    ('/files/report.pdf', '/files/{name}.{ext}', {'name': 'report', 'ext': 'pdf'}),
+    ('/books/2019/reviews', '/books/{year}/reviews', {'year': '2019'}),
+])
+def test_resolve_path(router, path, expected_resource, expected_params):
+    """
+    The router maps a concrete path to the route template that defines it along
+    with the values of the path parameters.
+    """
+
+    assert router.resolve_path(path) == (expected_resource, expected_params)
+
+
+@pytest.mark.parametrize("path", [
+    '/books/2019/05', '/books/', '/authors/tolkien', '/unknown', '', '/books/2019/reviews/5',
+])
+def test_resolve_path_not_found(router, path):
+
+    assert router.resolve_path(path) == (None, {})
+
+
+def test_resolve_path_static_before_param(router):
+    """
+    A static segment takes precedence over a parameter, independent of the order
+    in which the routes were registered.
+    """
+
+    assert router.resolve_path('/books/latest') == ('/books/latest', {})
+
+
+def test_resolve_path_backtracks_to_param_segment():
+    """
+    If the static branch of the trie does not lead to a route, the lookup falls
+    back to the parameter branch.
+    """
+
+    router = Router()
+    router.add_route('/shelf/top/books', sample_view)
+    router.add_route('/shelf/{position}/authors', sample_view)
+
+    assert router.resolve_path('/shelf/top/authors') == ('/shelf/{position}/authors', {'position': 'top'})
+
+
+def test_route_cache_hits_and_misses():
+
+    router = Router(cache_size=10)
+    router.add_route('/books/{year}', sample_view)
+
+    assert router.resolve_path('/books/2019') == ('/books/{year}', {'year': '2019'})
+    assert router.resolve_path('/books/2019') == ('/books/{year}', {'year': '2019'})
+    assert router.resolve_path('/books/2020') == ('/books/{year}', {'year': '2020'})
+
+    info = router.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (1, 2, 0, 2)
+
+
+def test_route_cache_returns_a_copy_of_the_params():
+    """
+    A view can update the uri parameters of a request, the changes should not
+    leak into the cached values.
+    """
+
+    router = Router(cache_size=10)
+    router.add_route('/books/{year}', sample_view)
+
+    router.resolve_path('/books/2019')
+    _, uri_params = router.resolve_path('/books/2019')
+    uri_params['year'] = 2019
+
+    assert router.resolve_path('/books/2019') == ('/books/{year}', {'year': '2019'})
+
+
+def test_route_cache_evicts_least_recently_used():
+
+    router = Router(cache_size=2)
+    router.add_route('/books/{year}', sample_view)
+
+    for path in ['/books/1', '/books/2', '/books/1', '/books/3']:
+        router.resolve_path(path)
+
+    assert router.cache_info().evictions == 1
+    assert router.resolve_path('/books/1') == ('/books/{year}', {'year': '1'})
+    assert router.cache_info().hits == 2
+
+
+def test_route_cache_invalidated_by_new_route():
+
+    router = Router(cache_size=10)
+    router.add_route('/books/{year}', sample_view)
+    router.resolve_path('/books/latest')
+
+    router.add_route('/books/latest', sample_view)
+
+    assert router.resolve_path('/books/latest') == ('/books/latest', {})
+    assert router.cache_info().currsize == 1
+
+
+def test_router_without_cache():
+
+    assert Router().cache_info() is None
+
+
+@pytest.fixture
+def typed_router():
+    router = Router()
+    for route_path in ['/items/{slug}', '/items/{item_id:int}', '/prices/{amount:float}',
+                       '/tenants/{tenant_id:uuid}', '/static/{file_path:path}', '/archive/{year:int}-{month:int}']:
+        router.add_route(route_path, sample_view)
+    return router
+
+
+@pytest.mark.parametrize("path, expected_resource, expected_params", [
+    ('/items/5234', '/items/{item_id:int}', {'item_id': 5234}),
+    ('/items/carbon-frame', '/items/{slug}', {'slug': 'carbon-frame'}),
+    ('/prices/12.5', '/prices/{amount:float}', {'amount': 12.5}),
+    ('/tenants/00010203-0405-0607-0809-0a0b0c0d0e0f', '/tenants/{tenant_id:uuid}',
+     {'tenant_id': uuid.UUID('00010203-0405-0607-0809-0a0b0c0d0e0f')}),
+    ('/static/css/main.css', '/static/{file_path:path}', {'file_path': 'css/main.css'}),
+    ('/archive/2019-05', '/archive/{year:int}-{month:int}', {'year': 2019, 'month': 5}),
+])
+def test_resolve_path_with_converters(typed_router, path, expected_resource, expected_params):
+    """
+    The values of the typed parameters are converted as part of the lookup. A
+    typed parameter is tried before an untyped one, regardless of the order in
+    which the routes were added.
+    """
+
+    assert typed_router.resolve_path(path) == (expected_resource, expected_params)
+
+
+@pytest.mark.parametrize("path", ['/prices/free', '/tenants/INVALID', '/static/', '/archive/2019-May'])
+def test_resolve_path_with_converters_not_found(typed_router, path):
+
+    assert typed_router.resolve_path(path) == (None, {})
+
+
+def test_resolve_resource_with_converters(typed_router):
+    """
+    The API Gateway sends the resource without the converters, the router maps
+    the resource back to the route template and converts the parameters.
+    """
+
+    assert typed_router.resolve_resource('/items/{item_id}', {'item_id': '12'}) == \
+        ('/items/{item_id:int}', {'item_id': 12})
+    assert typed_router.resolve_resource('/items/{item_id}', {'item_id': 'INVALID'}) == (None, {})
+    assert typed_router.resolve_resource('/items/{slug}', {'slug': 'frame'}) == ('/items/{slug}', {'slug': 'frame'})
+
+
+def test_custom_converter():
+
+    class EvenConverter(BaseConverter):
+        regex = '[0-9]+'
+
+        def convert(self, value):
+            if int(value) % 2:
+                raise ValueError(value)
+            return int(value)
+
+    register_converter('even', EvenConverter())
+
+    router = Router()
+    router.add_route('/even/{number:even}', sample_view)
+
+    assert router.resolve_path('/even/12') == ('/even/{number:even}', {'number': 12})
+    assert router.resolve_path('/even/13') == (None, {})
+
+
+def test_unknown_converter():
+
+    with pytest.raises(ConfigurationError):
+        Router().add_route('/items/{item_id:unknown}', sample_view)
+
+
+def test_registrar_without_add_route():
+
+    class ReadOnlyRegistrar(RouteRegistrar):
+        pass
+
+    with pytest.raises(TypeError):
+        ReadOnlyRegistrar()
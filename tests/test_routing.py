@@ -74,7 +74,7 @@ def test_route_defined_for_post_put(http_method):
     response = sample_app(event, context)
     expected_response = post_put_view()
 
-    assert response['body'] == json.dumps(expected_response)
+    assert json.loads(response['body']) == expected_response
 
 
 @pytest.mark.parametrize("http_method", ['GET', 'DELETE'])
@@ -124,7 +124,7 @@ def test_routing_for_http_post():
     response = sample_app(event, context)
     expected_response = post_view()
 
-    assert response['body'] == json.dumps(expected_response)
+    assert json.loads(response['body']) == expected_response
 
 
 def test_routing_for_http_get():
@@ -142,7 +142,7 @@ def test_routing_for_http_get():
     response = sample_app(event, context)
     expected_response = get_view(activity_id)
 
-    assert response['body'] == json.dumps(expected_response)
+    assert json.loads(response['body']) == expected_response
 
 
 @sample_app.post('/pacific_resource')
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+    test_scopes.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import json
+import pytest
+from unittest.mock import MagicMock
+
+from minik.core import Minik
+from minik.status_codes import codes
+from minik.utils import create_api_event, create_alb_event, create_http_api_event
+
+
+sample_app = Minik()
+context = MagicMock()
+
+books = sample_app.scope(host='books.example.com')
+music = sample_app.scope(host='music.example.com')
+beta = sample_app.scope(stage='beta')
+billing = sample_app.scope(prefix='/billing')
+
+
+@sample_app.get('/items/{item_id}')
+def get_default_item(item_id):
+    return {'app': 'default', 'id': item_id}
+
+
+@books.get('/items/{item_id}')
+def get_book(item_id):
+    return {'app': 'books', 'id': item_id}
+
+
+@music.get('/items/{item_id}')
+def get_album(item_id):
+    return {'app': 'music', 'id': item_id}
+
+
+@beta.get('/items/{item_id}')
+def get_beta_item(item_id):
+    return {'app': 'beta', 'id': item_id}
+
+
+@billing.get('/invoices/{invoice_id}')
+def get_invoice(invoice_id):
+    return {'app': 'billing', 'id': invoice_id}
+
+
+@sample_app.get('/billing/health')
+def get_billing_health():
+    return {'app': 'default', 'status': 'ok'}
+
+
+@pytest.mark.parametrize("host, expected_app", [
+    ('books.example.com', 'books'),
+    ('MUSIC.example.com:443', 'music'),
+    ('other.example.com', 'default'),
+])
+def test_routes_scoped_by_host(host, expected_app):
+
+    event = create_alb_event('/items/52', method='GET', headers={'Host': host})
+
+    response = sample_app(event, context)
+
+    assert json.loads(response['body']) == {'app': expected_app, 'id': '52'}
+
+
+def test_routes_scoped_by_stage():
+
+    event = create_api_event('/items/{item_id}', method='GET', pathParameters={'item_id': '52'})
+    event['requestContext']['stage'] = 'beta'
+
+    response = sample_app(event, context)
+
+    assert json.loads(response['body']) == {'app': 'beta', 'id': '52'}
+
+
+def test_routes_scoped_by_prefix():
+
+    response = sample_app(create_alb_event('/billing/invoices/7', method='GET'), context)
+    assert json.loads(response['body']) == {'app': 'billing', 'id': '7'}
+
+    response = sample_app(create_alb_event('/billing/items/7', method='GET'), context)
+    assert response['statusCode'] == codes.not_found
+
+
+@pytest.mark.parametrize("raw_path, stage", [
+    ('/billing/invoices/3', '$default'),
+    ('/prod/billing/invoices/3', 'prod'),
+])
+def test_http_api_routes_scoped_by_prefix(raw_path, stage):
+
+    event = create_http_api_event(raw_path, method='GET', stage=stage)
+
+    response = sample_app(event, context)
+
+    assert json.loads(response['body']) == {'app': 'billing', 'id': '3'}
+
+
+@pytest.mark.parametrize("event", [
+    create_alb_event('/billing/health', method='GET'),
+    create_api_event('/billing/health', method='GET'),
+])
+def test_app_routes_next_to_a_scope(event):
+    """
+    A path that is not defined by the scope of the request falls back to the
+    routes of the app.
+    """
+
+    response = sample_app(event, context)
+
+    assert response['statusCode'] == codes.ok
+    assert json.loads(response['body']) == {'app': 'default', 'status': 'ok'}
+
+
+def test_scope_is_created_once():
+
+    assert sample_app.scope(host='Books.Example.com') is books
+    assert sample_app.scope(prefix='/billing/') is billing
+
+
+def test_route_cache_info_of_scopes():
+    """
+    Every scope caches its own paths, the counters of the app cover every cache.
+    """
+
+    cached_app = Minik(route_cache_size=8)
+    reports = cached_app.scope(prefix='/reports')
+
+    @cached_app.get('/items/{item_id}')
+    def get_item(item_id):
+        return {'id': item_id}
+
+    @reports.get('/daily/{day}')
+    def get_report(day):
+        return {'day': day}
+
+    for path in ['/items/1', '/items/1', '/reports/daily/monday', '/reports/daily/monday']:
+        cached_app(create_alb_event(path, method='GET'), context)
+
+    info = cached_app.route_cache_info()
+
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (2, 2, 16, 2)
+    assert Minik().route_cache_info() is None
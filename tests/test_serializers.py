@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+    test_serializers.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import datetime
+import decimal
+import json
+import uuid
+from dataclasses import dataclass
+from unittest.mock import MagicMock
+
+import pytest
+
+from minik import serializers
+from minik.core import Minik
+from minik.utils import create_api_event
+
+
+@dataclass
+class Ride:
+    name: str
+    distance: int
+
+
+def test_compact_separators(codec):
+    assert codec.dumps({'data': [1, 2], 'ok': True}) == '{"data":[1,2],"ok":true}'
+
+
+def test_extended_types(codec):
+    body = {
+        'date': datetime.date(2019, 5, 1),
+        'created': datetime.datetime(2019, 5, 1, 10, 30),
+        'price': decimal.Decimal('19.99'),
+        'id': uuid.UUID(int=1),
+        'ride': Ride('Gran Fondo', 100),
+    }
+
+    assert json.loads(codec.dumps(body)) == {
+        'date': '2019-05-01',
+        'created': '2019-05-01T10:30:00',
+        'price': '19.99',
+        'id': '00000000-0000-0000-0000-000000000001',
+        'ride': {'name': 'Gran Fondo', 'distance': 100},
+    }
+
+
+def test_unsupported_type(codec):
+    with pytest.raises(TypeError):
+        codec.dumps({'value': object()})
+
+
+def test_loads(codec):
+    assert codec.loads(b'{"name": "Gran Fondo"}') == {'name': 'Gran Fondo'}
+    assert codec.loads('[1, 2]') == [1, 2]
+
+
+class CountingCodec(serializers.StdlibJSONCodec):
+
+    def __init__(self):
+        super().__init__()
+        self.loads_calls = 0
+
+    def loads(self, data):
+        self.loads_calls += 1
+        return super().loads(data)
+
+    def dumps(self, value):
+        return 'custom:' + super().dumps(value)
+
+
+def test_codec_without_dumps():
+
+    class LoadOnlyCodec(serializers.JSONCodec):
+        def loads(self, data):
+            return None
+
+    with pytest.raises(TypeError):
+        LoadOnlyCodec()
+
+
+def test_custom_codec_and_null_body_is_parsed_once():
+    codec = CountingCodec()
+    sample_app = Minik(json_codec=codec)
+
+    @sample_app.post('/rides')
+    def create_ride():
+        return {'body': [sample_app.request.json_body, sample_app.request.json_body]}
+
+    event = create_api_event('/rides', method='POST')
+    event['body'] = 'null'
+
+    response = sample_app(event, MagicMock())
+
+    assert response['body'] == 'custom:{"body":[null,null]}'
+    assert codec.loads_calls == 1
+
+
+def test_default_codec_falls_back_to_stdlib(monkeypatch):
+    monkeypatch.setattr(serializers, 'orjson', None)
+    monkeypatch.setattr(serializers, 'ujson', None)
+
+    assert isinstance(serializers.default_json_codec(), serializers.StdlibJSONCodec)
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+    test_structures.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import pytest
+from minik.models import Response
+from minik.structures import HeadersView, MultiDict, MutableHeaders
+
+
+@pytest.mark.parametrize("header_name", ['Content-Type', 'content-type', 'CONTENT-TYPE'])
+def test_headers_view_is_case_insensitive(header_name):
+
+    headers = HeadersView({'Content-Type': 'application/json', 'x-amzn-trace-id': 'Root=1'})
+
+    assert headers[header_name] == 'application/json'
+    assert header_name in headers
+    assert headers.get('X-Amzn-Trace-Id') == 'Root=1'
+    assert headers.get('missing', 'default') == 'default'
+
+
+def test_headers_view_does_not_index_canonical_lookups():
+    """
+    The lower case index of the headers is only built when it is needed.
+    """
+
+    headers = HeadersView({'Content-Type': 'application/json', 'X-Forwarded-For': '10.0.0.1'})
+
+    assert headers['content-type'] == 'application/json'
+    assert headers['x-forwarded-for'] == '10.0.0.1'
+    assert headers._lower is None
+
+    assert dict(headers) == {'content-type': 'application/json', 'x-forwarded-for': '10.0.0.1'}
+
+
+def test_headers_view_without_headers():
+
+    headers = HeadersView(None)
+
+    assert len(headers) == 0
+    assert headers.get('content-type', '') == ''
+
+
+def test_multi_dict():
+
+    params = MultiDict({'id': ['1', '2'], 'empty': []})
+
+    assert params['id'] == '2'
+    assert params.getlist('id') == ['1', '2']
+    assert params.getlist('missing') == []
+    assert 'empty' not in params
+
+
+def test_mutable_headers_keep_the_name_of_the_last_assignment():
+
+    headers = MutableHeaders({'Content-Type': 'application/json'})
+    headers['x-request-id'] = '1'
+    headers['X-Request-Id'] = '2'
+
+    assert headers['CONTENT-TYPE'] == 'application/json'
+    assert headers.get_lower('content-type') == 'application/json'
+    assert 'content-type' in headers
+    assert list(headers) == ['Content-Type', 'X-Request-Id']
+    assert headers == {'content-type': 'application/json', 'x-request-id': '2'}
+
+    del headers['CONTENT-TYPE']
+    assert headers.to_dict() == {'X-Request-Id': '2'}
+
+
+def test_mutable_headers_multiple_values():
+
+    headers = MutableHeaders()
+    headers.add('Set-Cookie', 'a=1')
+    headers.add('set-cookie', 'b=2')
+    headers.add('Vary', 'Accept')
+
+    assert headers['set-cookie'] == 'a=1'
+    assert headers.getlist('SET-COOKIE') == ['a=1', 'b=2']
+    assert headers.has_multiple_values
+    assert headers.lists() == {'Set-Cookie': ['a=1', 'b=2'], 'Vary': ['Accept']}
+
+    headers['Set-Cookie'] = 'c=3'
+    assert headers.getlist('set-cookie') == ['c=3']
+    assert not headers.has_multiple_values
+
+
+def test_response_headers():
+
+    response = Response(headers={'content-type': 'text/html'})
+    response.headers.update({'X-Trace': '1'})
+    response.add_header('X-Trace', '2')
+
+    assert response.content_type == 'text/html'
+    assert response.to_dict() == {
+        'headers': {'content-type': 'text/html', 'X-Trace': '1'},
+        'multiValueHeaders': {'content-type': ['text/html'], 'X-Trace': ['1', '2']},
+        'statusCode': 200,
+        'body': '',
+        'isBase64Encoded': False,
+    }
+
+    response.headers = {'Content-Type': 'application/json'}
+    assert response.content_type == 'application/json'
+    assert 'multiValueHeaders' not in response.to_dict()
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+    test_validators.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import json
+import pytest
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+from unittest.mock import MagicMock
+
+from minik.core import Minik
+from minik.exceptions import ValidationError
+from minik.status_codes import codes
+from minik.utils import create_api_event
+from minik.validators import compile_body_validator
+
+try:
+    from typing import TypedDict
+except ImportError:  # pragma: no cover
+    TypedDict = None
+
+
+@dataclass
+class Location:
+    city: str
+    zip_code: Optional[str] = None
+
+
+@dataclass
+class CreateEvent:
+    name: str
+    distance: float
+    locations: List[Location]
+    riders: int = 0
+    tags: List[str] = field(default_factory=list)
+    extra: Dict[str, Any] = None
+
+
+def test_compiled_validator_builds_dataclass():
+
+    validate = compile_body_validator(CreateEvent)
+
+    event = validate({
+        'name': 'Gran Fondo',
+        'distance': 100,
+        'locations': [{'city': 'Bethesda'}],
+        'tags': ['road'],
+        'unknown': 'ignored'
+    })
+
+    assert event == CreateEvent(name='Gran Fondo', distance=100.0, locations=[Location(city='Bethesda')],
+                                tags=['road'])
+
+
+def test_compiled_validator_reports_field_paths():
+
+    validate = compile_body_validator(CreateEvent)
+
+    with pytest.raises(ValidationError) as error:
+        validate({'name': 12, 'locations': [{'city': 'Bethesda'}, {'zip_code': 20902}], 'tags': 'road'})
+
+    assert [error['field'] for error in error.value.errors] == [
+        'name', 'distance', 'locations[1].city', 'locations[1].zip_code', 'tags'
+    ]
+    assert error.value.status_code == codes.bad_request
+
+
+def test_compiled_validator_rejects_non_object():
+
+    with pytest.raises(ValidationError) as error:
+        compile_body_validator(Location)(['Bethesda'])
+
+    assert error.value.errors == [{'field': '', 'message': 'expected an object'}]
+
+
+@pytest.mark.skipif(TypedDict is None, reason='TypedDict is not available')
+def test_compiled_validator_for_typed_dict():
+
+    class Rider(TypedDict):
+        name: str
+        age: int
+
+    validate = compile_body_validator(Rider)
+
+    assert validate({'name': 'Eddy', 'age': 32}) == {'name': 'Eddy', 'age': 32}
+
+    with pytest.raises(ValidationError) as error:
+        validate({'name': 'Eddy', 'age': '32'})
+
+    assert error.value.errors == [{'field': 'age', 'message': 'expected an integer'}]
+
+
+context = MagicMock()
+
+
+def create_event(zip_code: int, payload: CreateEvent, notify: bool = False):
+    return {'zip_code': zip_code, 'name': payload.name, 'cities': [loc.city for loc in payload.locations],
+            'notify': notify}
+
+
+def build_app(codec):
+    """
+    The body of the requests is parsed with the given codec.
+    """
+    app = Minik(json_codec=codec)
+    app.add_route('/events/{zip_code}', create_event, methods=['POST'])
+    return app
+
+
+def test_body_parameter_in_view(codec):
+
+    event = create_api_event('/events/{zip_code}', pathParameters={'zip_code': '20902'},
+                             queryParameters={'notify': 'yes'},
+                             body={'name': 'Gran Fondo', 'distance': 100, 'locations': [{'city': 'Bethesda'}]})
+
+    response = build_app(codec)(event, context)
+
+    assert json.loads(response['body']) == {
+        'zip_code': 20902, 'name': 'Gran Fondo', 'cities': ['Bethesda'], 'notify': True
+    }
+
+
+def test_invalid_body_parameter_in_view(codec):
+
+    event = create_api_event('/events/{zip_code}', pathParameters={'zip_code': '20902'},
+                             body={'name': 'Gran Fondo', 'locations': [{}]})
+
+    response = build_app(codec)(event, context)
+    body = json.loads(response['body'])
+
+    assert response['statusCode'] == codes.bad_request
+    assert body['errors'] == [
+        {'field': 'distance', 'message': 'field required'},
+        {'field': 'locations[0].city', 'message': 'field required'},
+    ]
+
+
+@pytest.mark.parametrize("raw_body", ['{"name": ', None, ''])
+def test_malformed_or_missing_json_body_in_view(codec, raw_body):
+
+    event = create_api_event('/events/{zip_code}', pathParameters={'zip_code': '20902'})
+    event['body'] = raw_body
+
+    response = build_app(codec)(event, context)
+
+    assert response['statusCode'] == codes.bad_request
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""
+    test_websockets.py
+    :copyright: © 2019 by the EAB Tech team.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+        http://www.apache.org/licenses/LICENSE-2.0
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from minik.core import Minik
+from minik.exceptions import ConfigurationError
+from minik.status_codes import codes
+from minik.utils import create_websocket_event, create_api_event
+from minik.websockets import Broadcaster
+
+
+sample_app = Minik()
+context = MagicMock()
+
+
+@sample_app.websocket('$connect')
+def connect(token: str):
+    if token != 'secret':
+        sample_app.response.status_code = codes.forbidden
+    return {'connection_id': sample_app.request.connection_id}
+
+
+@sample_app.websocket('sendmessage')
+def send_message():
+    return {'message': sample_app.request.json_body['message']}
+
+
+@sample_app.websocket('$default')
+def default():
+    return {'route_key': sample_app.request.resource}
+
+
+@sample_app.get('/messages')
+def list_messages():
+    return {'messages': []}
+
+
+def test_connect():
+    event = create_websocket_event('$connect', event_type='CONNECT', connectionId='abc=', queryParameters={'token': 'secret'})
+
+    response = sample_app(event, context)
+
+    assert response == {'statusCode': 200, 'body': '{"connection_id":"abc="}'}
+
+
+def test_connect_forbidden():
+    event = create_websocket_event('$connect', event_type='CONNECT', queryParameters={'token': 'guess'})
+
+    response = sample_app(event, context)
+
+    assert response['statusCode'] == codes.forbidden
+
+
+def test_custom_route_key():
+    event = create_websocket_event('sendmessage', body={'action': 'sendmessage', 'message': 'hello'})
+
+    response = sample_app(event, context)
+
+    assert json.loads(response['body']) == {'message': 'hello'}
+
+
+def test_unknown_route_key_uses_default():
+    event = create_websocket_event('chat', body={'action': 'chat'})
+
+    response = sample_app(event, context)
+
+    assert json.loads(response['body']) == {'route_key': 'chat'}
+
+
+@pytest.mark.parametrize("route_key, event_type", [('$disconnect', 'DISCONNECT'), ('$connect', 'CONNECT')])
+def test_unknown_connection_events_do_not_use_default(route_key, event_type):
+    """
+    API Gateway only sends the messages to the $default route.
+    """
+    app = Minik()
+
+    @app.websocket('$default')
+    def default():
+        return app.request.json_body
+
+    response = app(create_websocket_event(route_key, event_type=event_type), context)
+
+    assert response['statusCode'] == codes.not_found
+
+
+def test_http_routes_are_not_websocket_routes():
+    response = sample_app(create_api_event('/messages', method='GET'), context)
+    assert json.loads(response['body']) == {'messages': []}
+
+    app = Minik()
+
+    @app.get('/messages')
+    def messages():
+        return {}
+
+    response = app(create_websocket_event('$default'), context)
+    assert response['statusCode'] == codes.not_found
+
+
+def test_duplicate_route_key():
+    app = Minik()
+    app.add_websocket_route('$connect', lambda: None)
+
+    with pytest.raises(ConfigurationError):
+        app.add_websocket_route('$connect', lambda: None)
+
+
+class GoneError(Exception):
+    response = {'Error': {'Code': 'GoneException'}}
+
+
+class StubManagementClient:
+    """
+    Stub of the API Gateway management api client.
+    """
+
+    def __init__(self, gone=(), failing=()):
+        self.gone = set(gone)
+        self.failing = set(failing)
+        self.messages = []
+        self.threads = set()
+        self._lock = threading.Lock()
+
+    def post_to_connection(self, ConnectionId, Data):
+        with self._lock:
+            self.threads.add(threading.current_thread().name)
+
+        if ConnectionId in self.gone:
+            raise GoneError()
+        if ConnectionId in self.failing:
+            raise ValueError('throttled')
+
+        with self._lock:
+            self.messages.append((ConnectionId, Data))
+
+
+def test_broadcast():
+    client = StubManagementClient(gone={'c2'}, failing={'c3'})
+    broadcaster = Broadcaster(client=client, max_workers=4)
+
+    result = broadcaster.broadcast(['c1', 'c2', 'c3', 'c4'], {'event': 'ride-updated'})
+    broadcaster.close()
+
+    assert result.sent == ['c1', 'c4']
+    assert result.gone == ['c2']
+    assert list(result.failed) == ['c3']
+    assert sorted(client.messages) == [('c1', b'{"event":"ride-updated"}'), ('c4', b'{"event":"ride-updated"}')]
+    assert 'MainThread' not in client.threads
+
+
+def test_send_from_request():
+    client = StubManagementClient()
+    request = MagicMock(aws_event=create_websocket_event('$default'))
+
+    Broadcaster.from_request(request, client=client).send('c1', 'hello')
+
+    assert client.messages == [('c1', b'hello')]
+
+
+def test_broadcaster_requires_boto3_without_client(monkeypatch):
+    monkeypatch.setattr('minik.websockets.boto3', None)
+
+    with pytest.raises(ConfigurationError):
+        Broadcaster(endpoint_url='https://ax2hor23.execute-api.us-east-1.amazonaws.com/production')